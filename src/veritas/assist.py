@@ -13,11 +13,12 @@ Pipeline for each claim:
 from __future__ import annotations
 import re
 import time
-from typing import List, Dict, Any, Tuple
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple
 
 from .models import Claim, EvidenceSuggestion, new_id
-from .scoring import score_evidence, compute_auto_status, classify_finance_claim
-from .evidence_sources import ALL_SOURCES
+from .scoring import score_evidence_batch, compute_auto_status, classify_finance_claim
+from .evidence_sources import ALL_SOURCES, BATCH_SOURCES
 from .evidence_sources.sec_edgar import infer_source_entity
 from .evidence_sources.yfinance_source import _TICKER_MAP
 from . import db
@@ -343,31 +344,43 @@ def _smart_select_sources(
 # Category-based source selection
 # ------------------------------------------------------------------
 
+# Preferred source order per category; local_dataset is always first —
+# zero latency, highest precision.
+_CATEGORY_SOURCE_PRIORITY: Dict[str, List[str]] = {
+    "finance": ["local_dataset", "yfinance", "sec_edgar", "sec_gov", "fred", "bls", "cbo", "usaspending", "google_factcheck", "crossref", "wikipedia", "wikidata", "duckduckgo"],
+    "health": ["local_dataset", "pubmed", "openfda", "google_factcheck", "crossref", "semantic_scholar", "wikipedia", "wikidata", "duckduckgo"],
+    "science": ["local_dataset", "arxiv", "semantic_scholar", "crossref", "pubmed", "worldbank", "wikipedia", "wikidata", "duckduckgo"],
+    "tech": ["local_dataset", "arxiv", "crossref", "patentsview", "google_factcheck", "wikipedia", "wikidata", "duckduckgo"],
+    "politics": ["local_dataset", "google_factcheck", "sec_gov", "cbo", "usaspending", "crossref", "wikipedia", "wikidata", "duckduckgo"],
+    "military": ["local_dataset", "google_factcheck", "usaspending", "crossref", "wikipedia", "wikidata", "duckduckgo"],
+    "education": ["local_dataset", "census", "worldbank", "crossref", "google_factcheck", "semantic_scholar", "wikipedia", "wikidata", "duckduckgo"],
+    "energy_climate": ["local_dataset", "worldbank", "crossref", "arxiv", "google_factcheck", "wikipedia", "wikidata", "duckduckgo"],
+    "labor": ["local_dataset", "bls", "fred", "census", "google_factcheck", "crossref", "wikipedia", "wikidata", "duckduckgo"],
+    "general": [
+        "local_dataset", "google_factcheck", "wikipedia", "crossref",
+        "arxiv", "pubmed", "sec_gov", "sec_edgar", "yfinance", "fred",
+        "openfda", "bls", "cbo", "usaspending", "census", "worldbank",
+        "patentsview", "wikidata", "duckduckgo", "semantic_scholar",
+    ],
+}
+
+
 def _select_sources_for_category(category: str) -> List[Tuple[str, Any]]:
     """Choose which API sources to query based on claim category.
 
     All sources are tried for 'general'; category-specific sources are prioritised.
     """
-    # Map categories to preferred sources
-    # local_dataset is always first — zero latency, highest precision
-    priority = {
-        "finance": ["local_dataset", "yfinance", "sec_edgar", "sec_gov", "fred", "bls", "cbo", "usaspending", "google_factcheck", "crossref", "wikipedia", "wikidata", "duckduckgo"],
-        "health": ["local_dataset", "pubmed", "openfda", "google_factcheck", "crossref", "semantic_scholar", "wikipedia", "wikidata", "duckduckgo"],
-        "science": ["local_dataset", "arxiv", "semantic_scholar", "crossref", "pubmed", "worldbank", "wikipedia", "wikidata", "duckduckgo"],
-        "tech": ["local_dataset", "arxiv", "crossref", "patentsview", "google_factcheck", "wikipedia", "wikidata", "duckduckgo"],
-        "politics": ["local_dataset", "google_factcheck", "sec_gov", "cbo", "usaspending", "crossref", "wikipedia", "wikidata", "duckduckgo"],
-        "military": ["local_dataset", "google_factcheck", "usaspending", "crossref", "wikipedia", "wikidata", "duckduckgo"],
-        "education": ["local_dataset", "census", "worldbank", "crossref", "google_factcheck", "semantic_scholar", "wikipedia", "wikidata", "duckduckgo"],
-        "energy_climate": ["local_dataset", "worldbank", "crossref", "arxiv", "google_factcheck", "wikipedia", "wikidata", "duckduckgo"],
-        "labor": ["local_dataset", "bls", "fred", "census", "google_factcheck", "crossref", "wikipedia", "wikidata", "duckduckgo"],
-        "general": [
-            "local_dataset", "google_factcheck", "wikipedia", "crossref",
-            "arxiv", "pubmed", "sec_gov", "sec_edgar", "yfinance", "fred",
-            "openfda", "bls", "cbo", "usaspending", "census", "worldbank",
-            "patentsview", "wikidata", "duckduckgo", "semantic_scholar",
-        ],
-    }
-    preferred = priority.get(category, ["crossref"])
+    return list(_ordered_sources(category))
+
+
+@lru_cache(maxsize=32)
+def _ordered_sources(category: str) -> Tuple[Tuple[str, Any], ...]:
+    """ALL_SOURCES with the category's preferred ones first.
+
+    ALL_SOURCES is fixed at import, so the order depends only on the
+    category; _select_sources_for_category copies it into a fresh list.
+    """
+    preferred = _CATEGORY_SOURCE_PRIORITY.get(category, ["crossref"])
 
     # Reorder ALL_SOURCES so preferred ones come first
     source_dict = {name: fn for name, fn in ALL_SOURCES}
@@ -380,7 +393,7 @@ def _select_sources_for_category(category: str) -> List[Tuple[str, Any]]:
         if name not in preferred:
             ordered.append((name, fn))
 
-    return ordered
+    return tuple(ordered)
 
 
 def assist_claim(
@@ -389,6 +402,7 @@ def assist_claim(
     dry_run: bool = False,
     source_entity: str = "",
     upload_date: str = "",
+    batches: Optional[Dict[str, "_SourceBatch"]] = None,
 ) -> Dict[str, Any]:
     """Run assisted verification for a single claim.
 
@@ -398,6 +412,8 @@ def assist_claim(
         dry_run: If True, don't write to DB.
         source_entity: Company/entity name from source metadata (for EDGAR query injection).
         upload_date: Source upload date for temporal filtering.
+        batches: Batched lookups keyed by source name (see _SourceBatch);
+            a selected source with a batch is answered from it.
 
     Returns a report dict with:
       - suggestions_found: int
@@ -422,21 +438,24 @@ def assist_claim(
     sources = _smart_select_sources(claim.text, claim.category, sources)
     for source_name, search_fn in sources:
         try:
-            if source_name == "sec_edgar":
-                # Pass entity injection + enrichment + temporal context for EDGAR
-                results = search_fn(
-                    claim.text,
-                    max_results=3,
-                    source_entity=source_entity,
-                    enrich=True,
-                    claim_date=claim_date,
-                    upload_date=upload_date,
-                )
-            elif source_name == "yfinance":
-                # Pass temporal context for historical data
-                results = search_fn(claim.text, max_results=3, claim_date=claim_date)
-            else:
-                results = search_fn(claim.text, max_results=3)
+            batch = batches.get(source_name) if batches else None
+            results = batch.results_for(claim) if batch is not None else None
+            if results is None:
+                if source_name == "sec_edgar":
+                    # Pass entity injection + enrichment + temporal context for EDGAR
+                    results = search_fn(
+                        claim.text,
+                        max_results=3,
+                        source_entity=source_entity,
+                        enrich=True,
+                        claim_date=claim_date,
+                        upload_date=upload_date,
+                    )
+                elif source_name == "yfinance":
+                    # Pass temporal context for historical data
+                    results = search_fn(claim.text, max_results=3, claim_date=claim_date)
+                else:
+                    results = search_fn(claim.text, max_results=3)
             for r in results:
                 r["_source_name"] = source_name
             all_results.extend(results)
@@ -454,19 +473,16 @@ def assist_claim(
         }
 
     # Score all results (with temporal context)
-    scored: List[Tuple[int, str, Dict[str, Any]]] = []
-    for r in all_results:
-        s, sigs = score_evidence(
-            claim_text=claim.text,
-            claim_category=claim.category,
-            evidence_title=r.get("title", ""),
-            evidence_snippet=r.get("snippet", ""),
-            evidence_type=r.get("evidence_type", "other"),
-            source_name=r.get("source_name", ""),
-            claim_date=claim_date,
-            evidence_date=r.get("evidence_date", ""),
+    scored: List[Tuple[int, List[str], Dict[str, Any]]] = [
+        (s, sigs, r)
+        for (s, sigs), r in zip(
+            score_evidence_batch(
+                claim.text, claim.category, all_results,
+                claim_date=claim_date, raw_signals=True,
+            ),
+            all_results,
         )
-        scored.append((s, sigs, r))
+    ]
 
     # Sort by score descending, take top N
     scored.sort(key=lambda x: x[0], reverse=True)
@@ -485,7 +501,7 @@ def assist_claim(
             source_name=r.get("source_name", ""),
             evidence_type=r.get("evidence_type", "other"),
             score=s,
-            signals=sigs,
+            signals="|".join(sigs),
             snippet=r.get("snippet", "")[:200],
         ))
 
@@ -496,7 +512,7 @@ def assist_claim(
 
     # Compute auto status from best evidence
     best_score = top[0][0] if top else 0
-    best_signals = top[0][1] if top else ""
+    best_signals = top[0][1] if top else []
     best_type = top[0][2].get("evidence_type", "other") if top else "other"
     status_auto, auto_confidence = compute_auto_status(
         best_score, best_type, best_signals, claim.confidence_language,
@@ -596,6 +612,54 @@ def _verifiability_score(claim: "Claim") -> int:
     return max(0, min(100, score))
 
 
+# Most claims covered by one batched lookup in assist_source
+_SOURCE_BATCH_SIZE = 10
+
+
+class _SourceBatch:
+    """One batch-capable source's lookups, shared across upcoming claims.
+
+    Nothing is fetched until assist_claim asks for a claim's results.  Each
+    fetch then covers that claim and the ones after it, but only as many as
+    the remaining budget is expected to reach at the pace so far.
+    """
+
+    def __init__(self, batch_fn: Any, claims: List[Claim], deadline: float) -> None:
+        self._batch_fn = batch_fn
+        self._claims = claims
+        self._index = {c.id: i for i, c in enumerate(claims)}
+        self._deadline = deadline
+        self._started = time.time()
+        self._results: Dict[str, List[Dict[str, Any]]] = {}
+
+    def _batch_size(self, index: int) -> int:
+        if self._deadline == float("inf"):
+            return _SOURCE_BATCH_SIZE
+        if index == 0:
+            return 1  # no pace to go on yet
+        now = time.time()
+        per_claim = (now - self._started) / index
+        if per_claim <= 0:
+            return _SOURCE_BATCH_SIZE
+        expected = int((self._deadline - now) / per_claim)
+        return max(1, min(_SOURCE_BATCH_SIZE, expected))
+
+    def results_for(self, claim: Claim) -> Optional[List[Dict[str, Any]]]:
+        """Results for *claim*, or None to fall back to a per-claim lookup."""
+        if claim.id not in self._results:
+            index = self._index.get(claim.id)
+            if index is None:
+                return None
+            batch = self._claims[index:index + self._batch_size(index)]
+            try:
+                fetched = self._batch_fn([c.text for c in batch], max_results=3)
+            except Exception:
+                return None
+            self._results = {c.id: r for c, r in zip(batch, fetched)}
+        hit = self._results.get(claim.id)
+        return [dict(r) for r in hit] if hit is not None else None
+
+
 def assist_source(
     source_id: str,
     max_per_claim: int = 5,
@@ -661,6 +725,13 @@ def assist_source(
     skipped_low_verifiability = 0
     claim_reports: List[Dict[str, Any]] = []
 
+    # Batch-capable sources share one request across the next few claims
+    to_check = [claim for claim, v in scored_claims if v >= 5]
+    batches = {
+        name: _SourceBatch(BATCH_SOURCES[name], to_check, deadline)
+        for name, _ in ALL_SOURCES if name in BATCH_SOURCES
+    }
+
     for claim, v_score in scored_claims:
         # Check budget
         if time.time() > deadline:
@@ -678,6 +749,7 @@ def assist_source(
             dry_run=dry_run,
             source_entity=source_entity,
             upload_date=upload_date,
+            batches=batches,
         )
         report["verifiability_score"] = v_score
         claim_reports.append({
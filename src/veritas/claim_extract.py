@@ -13,11 +13,15 @@ No LLM needed — uses rule-based heuristics:
 from __future__ import annotations
 import hashlib
 import json
+import os
 import re
 import string
+from dataclasses import dataclass
 from difflib import SequenceMatcher
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Tuple
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Set, Tuple
 
 from .config import (
     ASSERTION_VERBS, HEDGE_WORDS, DEFINITIVE_WORDS, DEDUP_THRESHOLD,
@@ -37,6 +41,12 @@ MAX_CLAIM_CHARS = 240   # cap stitched claim length
 STITCH_FORWARD = 2      # max segments to look ahead for sentence end
 STITCH_BACKWARD = 1     # max segments to look behind for sentence start
 
+# Per-sentence rule results are pure functions of the exact text, so they are
+# memoised; transcripts re-extracted after rule tweaks and recurring stock
+# phrases hit the cache. Keyed on the raw sentence: punctuation and spacing
+# matter to the boilerplate and phrase checks.
+_CLASSIFY_CACHE_SIZE = 8192
+
 # Conjunctions that signal a dangling clause, not a self-contained claim
 _DANGLING_STARTS = frozenset([
     "and", "but", "while", "because", "so", "which", "that",
@@ -59,8 +69,9 @@ _SENT_RE = re.compile(r'(?<=[.!?])\s+')
 
 def _split_sentences(text: str) -> List[str]:
     """Rough sentence splitter that works on transcription text."""
-    parts = _SENT_RE.split(text.strip())
-    return [p.strip() for p in parts if len(p.strip()) > 10]
+    # The separator swallows the whole whitespace run and the ends are
+    # stripped up front, so the parts never need stripping themselves.
+    return [p for p in _SENT_RE.split(text.strip()) if len(p) > 10]
 
 
 # ------------------------------------------------------------------
@@ -202,15 +213,13 @@ def _has_named_entity(s: str) -> bool:
 
 
 def _has_assertion_verb(s: str) -> bool:
-    words = set(s.lower().split())
-    return bool(words & ASSERTION_VERBS)
+    return not ASSERTION_VERBS.isdisjoint(s.lower().split())
 
 
 def _has_subject(s: str) -> bool:
     """Check for a subject-like token: capitalized word, pronoun, or number."""
-    lower_words = set(s.lower().split())
     # Pronoun subject
-    if lower_words & _SUBJECT_PRONOUNS:
+    if not _SUBJECT_PRONOUNS.isdisjoint(s.lower().split()):
         return True
     # Capitalized token (proper noun / named entity)
     if _CAPITALIZED_RE.search(s):
@@ -223,53 +232,27 @@ def _has_subject(s: str) -> bool:
 
 def _starts_with_conjunction(s: str) -> bool:
     """Return True if the sentence starts with a dangling conjunction."""
-    first_word = s.strip().split()[0].lower().rstrip(",") if s.strip() else ""
-    return first_word in _DANGLING_STARTS
+    head = s.split(None, 1)
+    return bool(head) and head[0].lower().rstrip(",") in _DANGLING_STARTS
 
 
 def _collect_signals(sentence: str) -> List[str]:
     """Return list of signal names that fired for this sentence."""
-    signals: List[str] = []
-    if _has_number(sentence):
-        signals.append("number")
-    if _has_date(sentence):
-        signals.append("date")
-    if _has_named_entity(sentence):
-        signals.append("named_entity")
-    if _has_assertion_verb(sentence):
-        signals.append("assertion_verb")
-    if _has_subject(sentence):
-        signals.append("has_subject")
-    return signals
+    return _scan_sentence(sentence).signals()
 
 
 def _is_candidate(sentence: str) -> bool:
     """Return True if sentence looks like a checkable, self-contained claim."""
-    # Must have at least one claim-signal
-    has_signal = (
-        _has_number(sentence)
-        or _has_date(sentence)
-        or _has_named_entity(sentence)
-        or _has_assertion_verb(sentence)
-    )
-    if not has_signal:
-        return False
-
-    # Must have a subject-like anchor
-    if not _has_subject(sentence):
-        return False
-
-    return True
+    return _scan_sentence(sentence).is_candidate
 
 
 # ------------------------------------------------------------------
 # Confidence classification
 # ------------------------------------------------------------------
 
-def _classify_confidence(sentence: str) -> str:
-    words = set(sentence.lower().split())
-    has_hedge = bool(words & HEDGE_WORDS)
-    has_definitive = bool(words & DEFINITIVE_WORDS)
+def _confidence_from_words(words: set) -> str:
+    has_hedge = not words.isdisjoint(HEDGE_WORDS)
+    has_definitive = not words.isdisjoint(DEFINITIVE_WORDS)
     if has_hedge and not has_definitive:
         return "hedged"
     if has_definitive and not has_hedge:
@@ -277,48 +260,270 @@ def _classify_confidence(sentence: str) -> str:
     return "unknown"
 
 
+def _classify_confidence(sentence: str) -> str:
+    return _confidence_from_words(set(sentence.lower().split()))
+
+
+# ------------------------------------------------------------------
+# Single-pass sentence scan
+# ------------------------------------------------------------------
+
+# Rule signals as bits of one int
+_SIG_NUMBER = 1
+_SIG_NAMED_ENTITY = 2
+_SIG_DATE = 4
+_SIG_ASSERTION_VERB = 8
+_SIG_HAS_SUBJECT = 16
+_SIG_CLAIM = _SIG_NUMBER | _SIG_NAMED_ENTITY | _SIG_DATE | _SIG_ASSERTION_VERB
+
+# In the order signals are logged on a claim
+_SIGNAL_BITS = (
+    ("number", _SIG_NUMBER),
+    ("date", _SIG_DATE),
+    ("named_entity", _SIG_NAMED_ENTITY),
+    ("assertion_verb", _SIG_ASSERTION_VERB),
+    ("has_subject", _SIG_HAS_SUBJECT),
+)
+# Signal names for every possible bitmask, so decoding is a tuple index
+_SIGNAL_NAMES = tuple(
+    tuple(name for name, bit in _SIGNAL_BITS if bits & bit)
+    for bits in range(1 << len(_SIGNAL_BITS))
+)
+
+
+def _signals_to_list(bits: int) -> List[str]:
+    """Signal names set in a _SIG_* bitmask."""
+    return list(_SIGNAL_NAMES[bits])
+
+
+@dataclass(frozen=True)
+class _SentenceScan:
+    """Every rule feature of one sentence. The candidate filter, signals,
+    and confidence label all read from this, so each regex and word-set
+    test runs once per sentence instead of once per helper."""
+    bits: int  # _SIG_* flags
+    confidence: str
+
+    @property
+    def is_candidate(self) -> bool:
+        # At least one claim-signal plus a subject-like anchor
+        return bool(self.bits & _SIG_CLAIM) and bool(self.bits & _SIG_HAS_SUBJECT)
+
+    def signals(self) -> List[str]:
+        return _signals_to_list(self.bits)
+
+
+@lru_cache(maxsize=_CLASSIFY_CACHE_SIZE)
+def _scan_sentence(sentence: str) -> _SentenceScan:
+    words = set(sentence.lower().split())
+    bits = 0
+    if _has_number(sentence):
+        bits |= _SIG_NUMBER | _SIG_HAS_SUBJECT
+        # Every _DATE_RE alternative needs a digit, so the digit scan doubles
+        # as a prefilter: digit-free sentences skip the costliest regex.
+        if _has_date(sentence):
+            bits |= _SIG_DATE
+    if _has_named_entity(sentence):
+        bits |= _SIG_NAMED_ENTITY
+    if not words.isdisjoint(ASSERTION_VERBS):
+        bits |= _SIG_ASSERTION_VERB
+    if not bits & _SIG_HAS_SUBJECT and (
+        not words.isdisjoint(_SUBJECT_PRONOUNS) or _CAPITALIZED_RE.search(sentence)
+    ):
+        bits |= _SIG_HAS_SUBJECT
+    return _SentenceScan(bits=bits, confidence=_confidence_from_words(words))
+
+
 # ------------------------------------------------------------------
 # Deduplication
 # ------------------------------------------------------------------
 
+_PUNCT_TABLE = str.maketrans("", "", string.punctuation)
+
+# ASCII fast path: bytes.translate lower-cases and drops punctuation in one
+# C pass, about 3x quicker than str.lower() + str.translate() with deletions.
+_ASCII_LOWER = bytes.maketrans(string.ascii_uppercase.encode(), string.ascii_lowercase.encode())
+_ASCII_PUNCT = string.punctuation.encode()
+
+
 def _normalise(text: str) -> str:
     """Lower-case, strip punctuation, collapse whitespace."""
-    t = text.lower().translate(str.maketrans("", "", string.punctuation))
+    if text.isascii():
+        t = text.encode("ascii").translate(_ASCII_LOWER, _ASCII_PUNCT).decode("ascii")
+    else:
+        t = text.lower().translate(_PUNCT_TABLE)
     return " ".join(t.split())
 
 
+# Beyond this many claims the all-pairs scan is replaced by MinHash-LSH
+# candidate retrieval (datasketch, optional) over character 3-shingles.
+# SequenceMatcher ratio is not Jaccard, so the LSH threshold sits well below
+# DEDUP_THRESHOLD for recall; every candidate still gets the exact ratio test.
+_MAX_EXACT_DEDUP = 1000
+_DEDUP_LSH_THRESHOLD = 0.3
+_MINHASH_PERMUTATIONS = 64
+
+# Below this many LSH candidate pairs (or on a single CPU) process start-up
+# costs more than it saves, so the exact ratio checks stay in-process.
+_PARALLEL_MIN_DEDUP_PAIRS = 5_000
+
+
+def _matcher_for(prev: str) -> SequenceMatcher:
+    """A SequenceMatcher with *prev* as seq2; difflib caches its index."""
+    return SequenceMatcher(None, "", prev)
+
+
+def _is_similar(matcher: SequenceMatcher, norm: str, threshold: float) -> bool:
+    """SequenceMatcher(None, norm, prev).ratio() >= threshold, via cheap upper bounds first."""
+    matcher.set_seq1(norm)
+    return (
+        matcher.real_quick_ratio() >= threshold
+        and matcher.quick_ratio() >= threshold
+        and matcher.ratio() >= threshold
+    )
+
+
 def _deduplicate(claims: List[Claim], threshold: float = DEDUP_THRESHOLD) -> List[Claim]:
     """Remove near-duplicate claims based on normalised text similarity."""
-    kept: List[Claim] = []
-    seen_normalised: List[str] = []
-    for c in claims:
-        norm = _normalise(c.text)
-        is_dup = False
-        for prev in seen_normalised:
-            if SequenceMatcher(None, norm, prev).ratio() >= threshold:
-                is_dup = True
-                break
+    keep = _dedup_indices([_normalise(c.text) for c in claims], threshold)
+    return [claims[i] for i in keep]
+
+
+def _dedup_indices(norms: List[str], threshold: float = DEDUP_THRESHOLD) -> List[int]:
+    """Indices of the *norms* that survive near-duplicate removal, in order."""
+    if len(norms) > _MAX_EXACT_DEDUP:
+        try:
+            from datasketch import MinHash, MinHashLSH
+        except ImportError:
+            pass  # fall through to the exact scan
+        else:
+            return _dedup_indices_lsh(norms, threshold, MinHash, MinHashLSH)
+
+    keep: List[int] = []
+    matchers: List[SequenceMatcher] = []
+    seen: Set[str] = set()
+    for i, norm in enumerate(norms):
+        if norm in seen and threshold <= 1.0:
+            continue  # identical text: ratio 1.0 against the copy or what it duplicated
+        seen.add(norm)
+        if not any(_is_similar(m, norm, threshold) for m in matchers):
+            keep.append(i)
+            matchers.append(_matcher_for(norm))
+    return keep
+
+
+def _dedup_indices_lsh(
+    norms: List[str],
+    threshold: float,
+    MinHash,
+    MinHashLSH,
+) -> List[int]:
+    """_dedup_indices for large inputs: compare only against LSH candidates.
+
+    Every text is indexed, so candidates[i] lists all earlier texts that
+    collide with it; only the ones that were kept are compared, which gives
+    the same result as indexing kept texts alone.
+    """
+    lsh = MinHashLSH(threshold=_DEDUP_LSH_THRESHOLD, num_perm=_MINHASH_PERMUTATIONS)
+    candidates: List[List[int]] = []
+    for i, norm in enumerate(norms):
+        shingles = {norm[j:j + 3] for j in range(len(norm) - 2)} or {norm}
+        m = MinHash(num_perm=_MINHASH_PERMUTATIONS)
+        m.update_batch([s.encode("utf-8") for s in shingles])
+        candidates.append(lsh.query(m))
+        lsh.insert(i, m)
+
+    similar = _parallel_similar_pairs(norms, candidates, threshold)
+    keep: List[int] = []
+    matchers: Dict[int, SequenceMatcher] = {}
+    seen: Set[str] = set()
+    for i, norm in enumerate(norms):
+        if norm in seen and threshold <= 1.0:
+            continue  # identical text: ratio 1.0 against the copy or what it duplicated
+        seen.add(norm)
+        earlier = [k for k in candidates[i] if k in matchers]
+        if similar is not None:
+            is_dup = any((k, i) in similar for k in earlier)
+        else:
+            is_dup = any(_is_similar(matchers[k], norm, threshold) for k in earlier)
         if not is_dup:
-            kept.append(c)
-            seen_normalised.append(norm)
-    return kept
+            keep.append(i)
+            matchers[i] = _matcher_for(norm)
+    return keep
+
+
+def _similar_to_earlier(
+    args: Tuple[int, str, List[Tuple[int, str]], float],
+) -> List[Tuple[int, int]]:
+    """Process-pool worker: (k, i) pairs where text i near-duplicates text k."""
+    k, norm_k, later, threshold = args
+    matcher = _matcher_for(norm_k)
+    return [(k, i) for i, norm in later if _is_similar(matcher, norm, threshold)]
+
+
+def _parallel_similar_pairs(
+    norms: List[str],
+    candidates: List[List[int]],
+    threshold: float,
+) -> Optional[Set[Tuple[int, int]]]:
+    """Check every LSH candidate pair across a ProcessPoolExecutor.
+
+    The ratio test is CPU-bound pure Python, so threads would only contend
+    for the GIL. Returns None when the work is too small, there is a single
+    CPU, or no pool can be started; the caller then checks pairs lazily.
+    """
+    n_pairs = sum(map(len, candidates))
+    if n_pairs < _PARALLEL_MIN_DEDUP_PAIRS or (os.cpu_count() or 1) < 2:
+        return None
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    later_by_earlier: Dict[int, List[Tuple[int, str]]] = {}
+    for i, cands in enumerate(candidates):
+        for k in cands:
+            later_by_earlier.setdefault(k, []).append((i, norms[i]))
+    payloads = [
+        (k, norms[k], later, threshold) for k, later in later_by_earlier.items()
+    ]
+    try:
+        with ProcessPoolExecutor() as ex:
+            pair_lists = list(ex.map(_similar_to_earlier, payloads, chunksize=64))
+    except (OSError, RuntimeError):
+        return None  # no usable process pool here; decide pairs in-process
+    return {pair for pairs in pair_lists for pair in pairs}
 
 
 # ------------------------------------------------------------------
 # Claim hash (deterministic dedup, inspired by WeThePeople)
 # ------------------------------------------------------------------
 
-def _claim_hash(source_id: str, text: str) -> str:
-    """SHA256 hash of source_id + normalised claim text for same-source dedup."""
-    norm = _normalise(text)
-    combined = f"{source_id}||{norm}"
-    return hashlib.sha256(combined.encode("utf-8")).hexdigest()
+def _sha256_hex(data: str) -> str:
+    # Identity hashes, not a security boundary: usedforsecurity=False keeps
+    # FIPS-mode OpenSSL builds on the plain SHA-256 path. The digest itself is
+    # unchanged, which matters because stored claims are grouped by it.
+    return hashlib.sha256(data.encode("utf-8"), usedforsecurity=False).hexdigest()
+
+
+def _claim_hash(source_id: str, text: str, norm: str = "") -> str:
+    """SHA256 hash of source_id + normalised claim text for same-source dedup.
+
+    Pass *norm* when the caller already has _normalise(text).
+    """
+    return _sha256_hex(f"{source_id}||{norm or _normalise(text)}")
+
+
+def _claim_hasher(source_id: str) -> Any:
+    """SHA256 state already fed the "{source_id}||" prefix of _claim_hash.
+
+    copy() it and update() with the normalised text to get the same digest
+    without re-encoding and re-hashing the prefix for every claim.
+    """
+    return hashlib.sha256(f"{source_id}||".encode("utf-8"), usedforsecurity=False)
 
 
-def _claim_hash_global(text: str) -> str:
+def _claim_hash_global(text: str, norm: str = "") -> str:
     """SHA256 hash of normalised text only — cross-source identity."""
-    norm = _normalise(text)
-    return hashlib.sha256(norm.encode("utf-8")).hexdigest()
+    return _sha256_hex(norm or _normalise(text))
 
 
 # ------------------------------------------------------------------
@@ -513,23 +718,95 @@ _CATEGORY_TERMS: dict[str, frozenset[str]] = {
 }
 
 
-def _score_all_categories(text: str) -> dict[str, int]:
-    """Score text against all category keyword sets. Returns {category: score}."""
-    lower = text.lower()
-    clean = lower.translate(str.maketrans("", "", string.punctuation))
-    words = set(clean.split())
-    scores: dict[str, int] = {}
-    for cat, terms in _CATEGORY_TERMS.items():
-        score = 0
+# Categories are counted by position in this tuple and only turned back into
+# names at the end; its order (that of _CATEGORY_TERMS) breaks score ties.
+_CATEGORY_NAMES = tuple(_CATEGORY_TERMS)
+
+
+def _term_owners(multi_word: bool) -> dict[str, tuple[int, ...]]:
+    """Map each single-word (or multi-word) term to the indices of the
+    categories listing it."""
+    owners: dict[str, list[int]] = {}
+    for idx, terms in enumerate(_CATEGORY_TERMS.values()):
         for term in terms:
-            if " " in term:
-                if term in clean:
-                    score += 2
-            elif term in words:
-                score += 1
-        if score > 0:
-            scores[cat] = score
-    return scores
+            if (" " in term) == multi_word:
+                owners.setdefault(term, []).append(idx)
+    return {term: tuple(idxs) for term, idxs in owners.items()}
+
+
+# Single words score 1 per category when present in the text's word set;
+# phrases score 2 when they occur anywhere in the cleaned text.
+_WORD_CATEGORIES = _term_owners(multi_word=False)
+_PHRASE_CATEGORIES = _term_owners(multi_word=True)
+
+# Aho-Corasick automaton over the phrases (pyahocorasick, optional).
+# None = not built yet; False = pyahocorasick is not installed.
+_PHRASE_AUTOMATON: Any = None
+
+
+def _get_phrase_automaton() -> Any:
+    """Return the category-phrase automaton, building it on first use."""
+    global _PHRASE_AUTOMATON
+    if _PHRASE_AUTOMATON is None:
+        try:
+            import ahocorasick
+        except ImportError:
+            _PHRASE_AUTOMATON = False
+        else:
+            automaton = ahocorasick.Automaton()
+            for phrase in _PHRASE_CATEGORIES:
+                automaton.add_word(phrase, phrase)
+            automaton.make_automaton()
+            _PHRASE_AUTOMATON = automaton
+    return _PHRASE_AUTOMATON or None
+
+
+# Fallback when pyahocorasick is missing: a substring test per phrase.
+_PHRASE_OWNERS = tuple(_PHRASE_CATEGORIES.items())
+
+
+def _add_phrase_scores(clean: str, counts: List[int]) -> None:
+    """Add 2 to counts[idx] for each category phrase occurring in *clean*."""
+    automaton = _get_phrase_automaton()
+    if automaton is None:
+        for phrase, idxs in _PHRASE_OWNERS:
+            if phrase in clean:
+                for idx in idxs:
+                    counts[idx] += 2
+        return
+    for phrase in {phrase for _, phrase in automaton.iter(clean)}:
+        for idx in _PHRASE_CATEGORIES[phrase]:
+            counts[idx] += 2
+
+
+def _score_all_categories(text: str) -> Mapping[str, int]:
+    """Score text against all category keyword sets. Returns {category: score}."""
+    return _score_all_categories_lc(text.lower())
+
+
+@lru_cache(maxsize=_CLASSIFY_CACHE_SIZE)
+def _score_all_categories_lc(lower: str) -> Mapping[str, int]:
+    """_score_all_categories for text that is already lowercased.
+
+    Looks each distinct word up in a reverse index and finds phrases in one
+    automaton pass, instead of testing every term of every category. The
+    result is cached, hence read-only; copy it before merging.
+    """
+    clean = lower.translate(_PUNCT_TABLE)
+    counts = [0] * len(_CATEGORY_NAMES)
+    for word in set(clean.split()):
+        for idx in _WORD_CATEGORIES.get(word, ()):
+            counts[idx] += 1
+    _add_phrase_scores(clean, counts)
+    return MappingProxyType({
+        name: score for name, score in zip(_CATEGORY_NAMES, counts) if score
+    })
+
+
+def _context_scores(source_title: str = "", source_channel: str = "") -> Mapping[str, int]:
+    """Category scores of the source context (title + channel)."""
+    context_text = f"{source_title} {source_channel}".strip()
+    return _score_all_categories(context_text) if context_text else {}
 
 
 def _classify_category(text: str, source_title: str = "", source_channel: str = "") -> str:
@@ -539,17 +816,26 @@ def _classify_category(text: str, source_title: str = "", source_channel: str =
     Source context (e.g. "Apple Q1 FY26 Earnings Call") provides a strong prior
     that lowers the claim-text threshold from 2 to 1 keyword match.
     """
+    return _classify_with_context(text, _context_scores(source_title, source_channel))
+
+
+def _classify_with_context(text: str, context_scores: Mapping[str, int]) -> str:
+    """_classify_category with the context already scored by _context_scores().
+
+    The context is the same for every claim of a source, so extraction
+    scores it once per call instead of once per sentence.
+    """
+    return _classify_with_context_lc(text.lower(), context_scores)
+
+
+def _classify_with_context_lc(lower: str, context_scores: Mapping[str, int]) -> str:
+    """_classify_with_context for claim text that is already lowercased."""
     # Score the claim text itself
-    claim_scores = _score_all_categories(text)
+    claim_scores = dict(_score_all_categories_lc(lower))
 
-    # Score source context (title + channel) if available
-    context_text = f"{source_title} {source_channel}".strip()
-    context_scores: dict[str, int] = {}
-    if context_text:
-        context_scores = _score_all_categories(context_text)
-        # Merge: context counts at full weight
-        for cat, cscore in context_scores.items():
-            claim_scores[cat] = claim_scores.get(cat, 0) + cscore
+    # Merge: context counts at full weight
+    for cat, cscore in context_scores.items():
+        claim_scores[cat] = claim_scores.get(cat, 0) + cscore
 
     if not claim_scores:
         return "general"
@@ -579,7 +865,12 @@ _BOILERPLATE_PATTERNS = frozenset([
 
 def _is_boilerplate(text: str) -> bool:
     """Return True if text looks like YouTube filler / self-promotion."""
-    lower = text.lower()
+    return _is_boilerplate_lc(text.lower())
+
+
+@lru_cache(maxsize=_CLASSIFY_CACHE_SIZE)
+def _is_boilerplate_lc(lower: str) -> bool:
+    """_is_boilerplate for text that is already lowercased."""
     matches = sum(1 for pat in _BOILERPLATE_PATTERNS if pat in lower)
     return matches >= 2  # two or more signals → filler
 
@@ -601,8 +892,23 @@ def extract_claims_from_segments(
     the categoriser so e.g. claims from "Apple Q1 Earnings Call" default
     to finance even when the claim text alone has only 1 keyword match.
     """
-    raw_claims: List[Claim] = []
+    # Surviving sentences are gathered column-wise; Claim objects (ids,
+    # categories, dates, global hashes) are only built for the ones that
+    # survive near-duplicate removal, which reuses the normalised texts.
+    # Each sentence is lowercased once; the _lc helpers take that copy.
+    texts: List[str] = []
+    lowers: List[str] = []
+    norms: List[str] = []
+    spans: List[Tuple[float, float]] = []
+    hashes: List[str] = []
+    scans: List[_SentenceScan] = []
     seen_texts: set = set()  # quick exact-dedup before expensive SequenceMatcher
+    # Overlapping stitch windows yield the same sentence several times. A
+    # repeat either failed the filters already or its hash is in seen_texts,
+    # so it is skipped before any filtering work.
+    seen_sentences: set = set()
+    source_hasher = _claim_hasher(source_id)
+    context_scores = _context_scores(source_title, source_channel)
 
     for seg_idx, seg in enumerate(segments):
         # Build stitched text window around this segment
@@ -614,6 +920,10 @@ def extract_claims_from_segments(
         )
 
         for sent, ts_start, ts_end in sentence_tuples:
+            if sent in seen_sentences:
+                continue
+            seen_sentences.add(sent)
+
             # Length filters
             if len(sent.split()) < MIN_CLAIM_WORDS or len(sent) < MIN_CLAIM_CHARS:
                 continue
@@ -623,46 +933,58 @@ def extract_claims_from_segments(
                 continue
 
             # Must be a candidate claim (signal + subject)
-            if not _is_candidate(sent):
+            scan = _scan_sentence(sent)
+            if not scan.is_candidate:
                 continue
 
             # Reject boilerplate / YouTube filler
-            if _is_boilerplate(sent):
+            low = sent.lower()
+            if _is_boilerplate_lc(low):
                 continue
 
             # Quick exact dedup via hash
-            chash = _claim_hash(source_id, sent)
+            norm = _normalise(sent)
+            hasher = source_hasher.copy()
+            hasher.update(norm.encode("utf-8"))
+            chash = hasher.hexdigest()
             if chash in seen_texts:
                 continue
             seen_texts.add(chash)
 
-            # Collect explainability signals
-            signals = _collect_signals(sent)
-            conf = _classify_confidence(sent)
-            if conf != "unknown":
-                signals.append(f"confidence:{conf}")
-            cat = _classify_category(sent, source_title, source_channel)
-            if cat != "general":
-                signals.append(f"category:{cat}")
-
-            # Extract temporal date from claim text
-            claim_date = _extract_claim_date(sent)
-
-            raw_claims.append(Claim(
-                id=new_id(),
-                source_id=source_id,
-                text=sent,
-                ts_start=ts_start,
-                ts_end=ts_end,
-                confidence_language=conf,
-                category=cat,
-                claim_date=claim_date,
-                claim_hash=chash,
-                claim_hash_global=_claim_hash_global(sent),
-                signals="|".join(signals),
-            ))
-
-    return _deduplicate(raw_claims)
+            texts.append(sent)
+            lowers.append(low)
+            norms.append(norm)
+            spans.append((ts_start, ts_end))
+            hashes.append(chash)
+            scans.append(scan)
+
+    claims: List[Claim] = []
+    for i in _dedup_indices(norms):
+        sent, scan = texts[i], scans[i]
+
+        # Collect explainability signals
+        signals = scan.signals()
+        conf = scan.confidence
+        if conf != "unknown":
+            signals.append(f"confidence:{conf}")
+        cat = _classify_with_context_lc(lowers[i], context_scores)
+        if cat != "general":
+            signals.append(f"category:{cat}")
+
+        claims.append(Claim(
+            id=new_id(),
+            source_id=source_id,
+            text=sent,
+            ts_start=spans[i][0],
+            ts_end=spans[i][1],
+            confidence_language=conf,
+            category=cat,
+            claim_date=_extract_claim_date(sent),  # temporal date from claim text
+            claim_hash=hashes[i],
+            claim_hash_global=_claim_hash_global(sent, norms[i]),
+            signals="|".join(signals),
+        ))
+    return claims
 
 
 def extract_claims(source_id: str) -> List[Claim]:
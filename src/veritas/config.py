@@ -13,7 +13,7 @@ DB_PATH = DATA_DIR / "veritas.sqlite"
 # Whisper defaults
 DEFAULT_WHISPER_MODEL = "small"
 DEFAULT_DEVICE = "cuda"
-DEFAULT_COMPUTE_TYPE = "float16"
+DEFAULT_COMPUTE_TYPE = "int8_float16"  # GPU: int8 weights, fp16 compute
 
 # Claim extraction
 ASSERTION_VERBS = frozenset([
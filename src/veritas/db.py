@@ -181,6 +181,7 @@ def get_conn() -> Generator[sqlite3.Connection, None, None]:
     init_db()
     conn = sqlite3.connect(str(_db_path()))
     conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")  # safe under WAL; fsync per checkpoint
     conn.execute("PRAGMA foreign_keys=ON")
     conn.row_factory = sqlite3.Row
     try:
@@ -324,6 +325,22 @@ def insert_evidence(e: Evidence) -> None:
         )
 
 
+def insert_evidence_many(evidence: List[Evidence]) -> int:
+    """Insert several evidence rows in one transaction. Returns count inserted."""
+    if not evidence:
+        return 0
+    with get_conn() as conn:
+        conn.executemany(
+            "INSERT INTO evidence (id, claim_id, url, title, evidence_type, strength, notes, created_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            [
+                (e.id, e.claim_id, e.url, e.title, e.evidence_type, e.strength, e.notes, e.created_at)
+                for e in evidence
+            ],
+        )
+    return len(evidence)
+
+
 def get_evidence_for_claim(claim_id: str) -> List[Evidence]:
     with get_conn() as conn:
         rows = conn.execute(
@@ -565,11 +582,43 @@ def get_top_claims(limit: int = 20) -> List[Dict[str, Any]]:
 # Cluster CRUD (knowledge graph)
 # ---------------------------------------------------------------------------
 
+def _clear_clusters(conn: sqlite3.Connection) -> None:
+    conn.execute("DELETE FROM cluster_members")
+    conn.execute("DELETE FROM claim_clusters")
+
+
+def _upsert_clusters(conn: sqlite3.Connection, clusters: List[ClaimCluster]) -> None:
+    conn.executemany(
+        "INSERT OR REPLACE INTO claim_clusters "
+        "(id, representative_text, category, claim_count, source_count, "
+        "best_status, best_confidence, consensus_score, created_at, updated_at) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        (
+            (c.id, c.representative_text, c.category, c.claim_count,
+             c.source_count, c.best_status, c.best_confidence,
+             c.consensus_score, c.created_at, c.updated_at)
+            for c in clusters
+        ),
+    )
+
+
+def _insert_cluster_members(conn: sqlite3.Connection, members: List[Dict[str, Any]]) -> None:
+    conn.executemany(
+        "INSERT OR REPLACE INTO cluster_members "
+        "(cluster_id, claim_id, fingerprint, similarity_to_rep) "
+        "VALUES (?, ?, ?, ?)",
+        (
+            (m["cluster_id"], m["claim_id"], m["fingerprint"],
+             m["similarity_to_rep"])
+            for m in members
+        ),
+    )
+
+
 def clear_clusters() -> None:
     """Delete all clusters and members (for full rebuild)."""
     with get_conn() as conn:
-        conn.execute("DELETE FROM cluster_members")
-        conn.execute("DELETE FROM claim_clusters")
+        _clear_clusters(conn)
 
 
 def upsert_clusters(clusters: List[ClaimCluster]) -> int:
@@ -577,18 +626,7 @@ def upsert_clusters(clusters: List[ClaimCluster]) -> int:
     if not clusters:
         return 0
     with get_conn() as conn:
-        conn.executemany(
-            "INSERT OR REPLACE INTO claim_clusters "
-            "(id, representative_text, category, claim_count, source_count, "
-            "best_status, best_confidence, consensus_score, created_at, updated_at) "
-            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
-            [
-                (c.id, c.representative_text, c.category, c.claim_count,
-                 c.source_count, c.best_status, c.best_confidence,
-                 c.consensus_score, c.created_at, c.updated_at)
-                for c in clusters
-            ],
-        )
+        _upsert_clusters(conn, clusters)
     return len(clusters)
 
 
@@ -597,19 +635,26 @@ def insert_cluster_members(members: List[Dict[str, Any]]) -> int:
     if not members:
         return 0
     with get_conn() as conn:
-        conn.executemany(
-            "INSERT OR REPLACE INTO cluster_members "
-            "(cluster_id, claim_id, fingerprint, similarity_to_rep) "
-            "VALUES (?, ?, ?, ?)",
-            [
-                (m["cluster_id"], m["claim_id"], m["fingerprint"],
-                 m["similarity_to_rep"])
-                for m in members
-            ],
-        )
+        _insert_cluster_members(conn, members)
     return len(members)
 
 
+def replace_clusters(
+    clusters: List[ClaimCluster],
+    members: List[Dict[str, Any]],
+) -> None:
+    """Swap in a full cluster rebuild: clear, then write clusters and members.
+
+    Runs as a single IMMEDIATE transaction, so readers never see a
+    half-written graph and the rebuild costs one commit instead of three.
+    """
+    with get_conn() as conn:
+        conn.execute("BEGIN IMMEDIATE")
+        _clear_clusters(conn)
+        _upsert_clusters(conn, clusters)
+        _insert_cluster_members(conn, members)
+
+
 def get_cluster(cluster_id: str) -> Optional[Dict[str, Any]]:
     """Get a single cluster by ID."""
     with get_conn() as conn:
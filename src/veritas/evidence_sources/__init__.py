@@ -5,7 +5,7 @@ from .arxiv import search_arxiv
 from .pubmed import search_pubmed
 from .sec_edgar import search_sec_edgar
 from .yfinance_source import search_yfinance
-from .wikipedia_source import search_wikipedia
+from .wikipedia_source import search_wikipedia, search_wikipedia_batch
 from .fred_source import search_fred
 from .google_factcheck import search_google_factcheck
 from .openfda import search_openfda
@@ -43,3 +43,9 @@ ALL_SOURCES = [
     ("duckduckgo", search_duckduckgo),
     ("semantic_scholar", search_semantic_scholar),
 ]
+
+# Sources that can answer several claims in one shared request:
+# name -> fn(claim_texts, max_results) returning one result list per claim
+BATCH_SOURCES = {
+    "wikipedia": search_wikipedia_batch,
+}
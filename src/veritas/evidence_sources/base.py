@@ -1,14 +1,37 @@
 """Shared utilities for evidence source modules."""
 
 from __future__ import annotations
+import re
 import time
 import requests
-from typing import List, Dict, Any, Optional
+from requests.adapters import HTTPAdapter
+from typing import List, Dict, Any, Optional, Sequence, Tuple
 
 # Global rate limiter: minimum seconds between requests per source
 _LAST_REQUEST: Dict[str, float] = {}
 _MIN_INTERVAL = 1.0  # 1 second between API calls per source
 
+# Shared HTTP session — keeps TCP+TLS connections to each API host warm
+# across calls instead of a fresh handshake per request. Lives for the process.
+_SESSION: Optional[requests.Session] = None
+
+
+def _get_session() -> requests.Session:
+    """Return the process-wide HTTP session, creating it on first use."""
+    global _SESSION
+    if _SESSION is None:
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers.update({
+            "User-Agent": "Veritas/1.0 (local research tool; mailto:noreply@local)",
+            "Accept-Encoding": "gzip, deflate",
+            "Connection": "keep-alive",
+        })
+        _SESSION = session
+    return _SESSION
+
 
 def rate_limited_get(
     url: str,
@@ -27,14 +50,8 @@ def rate_limited_get(
     if wait > 0:
         time.sleep(wait)
 
-    default_headers = {
-        "User-Agent": "Veritas/1.0 (local research tool; mailto:noreply@local)",
-    }
-    if headers:
-        default_headers.update(headers)
-
     try:
-        resp = requests.get(url, params=params, headers=default_headers, timeout=timeout)
+        resp = _get_session().get(url, params=params, headers=headers, timeout=timeout)
         _LAST_REQUEST[source_name] = time.time()
         resp.raise_for_status()
         return resp
@@ -43,6 +60,45 @@ def rate_limited_get(
         return None
 
 
+_TERM_TOKEN_RE = re.compile(r'[a-z0-9]+')
+
+
+def build_term_index(terms_by_len: Sequence[str]) -> Dict[str, Tuple[Tuple[int, str], ...]]:
+    """Index lookup-table keys by their first word for quick rejection.
+
+    *terms_by_len* is the longest-first key order; each entry keeps its
+    rank so match_longest_term() can preserve that order.
+    """
+    index: Dict[str, List[Tuple[int, str]]] = {}
+    for rank, term in enumerate(terms_by_len):
+        tokens = _TERM_TOKEN_RE.findall(term)
+        if tokens:
+            index.setdefault(tokens[0], []).append((rank, term))
+    return {first: tuple(entries) for first, entries in index.items()}
+
+
+def match_longest_term(
+    lower: str,
+    index: Dict[str, Tuple[Tuple[int, str], ...]],
+) -> Optional[str]:
+    """Return the longest indexed term found in *lower*, or None.
+
+    Only terms whose first word appears as a word in the text are
+    substring-checked, so most claims test a handful of keys instead of
+    the whole table.
+    """
+    candidates = []
+    for token in set(_TERM_TOKEN_RE.findall(lower)):
+        entries = index.get(token)
+        if entries:
+            candidates.extend(entries)
+    candidates.sort()
+    for _, term in candidates:
+        if term in lower:
+            return term
+    return None
+
+
 def build_search_query(claim_text: str, max_terms: int = 8) -> str:
     """Extract key terms from a claim for API search queries.
 
@@ -39,11 +39,14 @@ _SERIES_MAP: Dict[str, tuple[str, str]] = {
     "ppi": ("WPUFD4", "Producer Price Index, Final Demand"),
 }
 
+# Match order for _match_series (longest phrase first), computed once
+_SERIES_TERMS_BY_LEN = tuple(sorted(_SERIES_MAP, key=len, reverse=True))
+
 
 def _match_series(claim_text: str) -> Optional[tuple[str, str]]:
     """Match claim text to a known BLS series."""
     lower = claim_text.lower()
-    for term in sorted(_SERIES_MAP.keys(), key=len, reverse=True):
+    for term in _SERIES_TERMS_BY_LEN:
         if term in lower:
             return _SERIES_MAP[term]
     return None
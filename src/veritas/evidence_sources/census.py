@@ -79,11 +79,14 @@ _CENSUS_QUERIES = {
     },
 }
 
+# Longest query terms first; sorted once rather than per claim
+_QUERY_TERMS_BY_LEN = tuple(sorted(_CENSUS_QUERIES, key=len, reverse=True))
+
 
 def _match_query(claim_text: str) -> Optional[Dict[str, str]]:
     """Match claim text to a Census API query."""
     lower = claim_text.lower()
-    for term in sorted(_CENSUS_QUERIES.keys(), key=len, reverse=True):
+    for term in _QUERY_TERMS_BY_LEN:
         if term in lower:
             return _CENSUS_QUERIES[term]
     return None
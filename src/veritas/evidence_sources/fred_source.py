@@ -68,6 +68,9 @@ _SERIES_MAP: Dict[str, str] = {
     "leading indicators": "USSLIND",
 }
 
+# Series terms, longest first
+_SERIES_TERMS_BY_LEN = tuple(sorted(_SERIES_MAP, key=len, reverse=True))
+
 _FRED_SERIES_URL = "https://api.stlouisfed.org/fred/series"
 _FRED_OBS_URL = "https://api.stlouisfed.org/fred/series/observations"
 
@@ -83,7 +86,7 @@ def _match_series(claim_text: str) -> Optional[str]:
     """
     lower = claim_text.lower()
     # Try longer phrases first for better matching
-    for term in sorted(_SERIES_MAP.keys(), key=len, reverse=True):
+    for term in _SERIES_TERMS_BY_LEN:
         if term in lower:
             return _SERIES_MAP[term]
     return None
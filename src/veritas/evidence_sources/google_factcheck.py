@@ -69,6 +69,22 @@ def search_google_factcheck(
     return results
 
 
+def _decode_json(raw: str) -> Any:
+    """json.loads via orjson when it is installed.
+
+    orjson rejects a few inputs json accepts (NaN, integers wider than 64
+    bits), so a failed orjson parse is retried with json before giving up.
+    """
+    try:
+        import orjson
+    except ImportError:
+        return json.loads(raw)
+    try:
+        return orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        return json.loads(raw)
+
+
 def _parse_explorer_response(raw: str) -> List[Dict[str, Any]]:
     """Parse the nested array response from Fact Check Explorer.
 
@@ -85,7 +101,7 @@ def _parse_explorer_response(raw: str) -> List[Dict[str, Any]]:
       [[pub_name, pub_site], url, timestamp_or_null, rating, null, [null, id], lang, null, title_snippet, ...]
     """
     try:
-        outer = json.loads(raw)
+        outer = _decode_json(raw)
     except (json.JSONDecodeError, ValueError):
         return []
 
@@ -111,28 +127,35 @@ def _parse_explorer_response(raw: str) -> List[Dict[str, Any]]:
         if not isinstance(claim_array, list) or len(claim_array) < 4:
             continue
 
-        claim_text = claim_array[0] if isinstance(claim_array[0], str) else ""
+        # Length is checked above, so the first four fields unpack directly
+        claim_text, claimant_info, _, reviews_block = claim_array[:4]
+        if not isinstance(claim_text, str):
+            claim_text = ""
 
         # Extract claimant from [claimant_name, claimant_id]
         claimant = ""
-        if isinstance(claim_array[1], list) and len(claim_array[1]) > 0:
-            claimant = claim_array[1][0] if isinstance(claim_array[1][0], str) else ""
+        if isinstance(claimant_info, list) and claimant_info:
+            claimant = claimant_info[0] if isinstance(claimant_info[0], str) else ""
 
-        # Extract reviews from claim_array[3]
-        reviews_block = claim_array[3] if len(claim_array) > 3 and isinstance(claim_array[3], list) else []
+        if not isinstance(reviews_block, list):
+            reviews_block = []
 
         reviews = []
         for rev in reviews_block:
             if not isinstance(rev, list) or len(rev) < 4:
                 continue
 
-            # rev[0] = [publisher_name, publisher_site]
-            publisher_info = rev[0] if isinstance(rev[0], list) else []
+            publisher_info, url, _, rating = rev[:4]
+            # publisher_info = [publisher_name, publisher_site]
+            if not isinstance(publisher_info, list):
+                publisher_info = []
             publisher_name = publisher_info[0] if len(publisher_info) > 0 and isinstance(publisher_info[0], str) else ""
             publisher_site = publisher_info[1] if len(publisher_info) > 1 and isinstance(publisher_info[1], str) else ""
 
-            url = rev[1] if len(rev) > 1 and isinstance(rev[1], str) else ""
-            rating = rev[3] if len(rev) > 3 and isinstance(rev[3], str) else ""
+            if not isinstance(url, str):
+                url = ""
+            if not isinstance(rating, str):
+                rating = ""
             title_snippet = rev[8] if len(rev) > 8 and isinstance(rev[8], str) else ""
 
             reviews.append({
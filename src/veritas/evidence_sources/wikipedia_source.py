@@ -9,13 +9,25 @@ historical events, person bios, geographic data.
 """
 
 from __future__ import annotations
+import heapq
 import re
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
 from .base import rate_limited_get, build_search_query
 
 _SEARCH_URL = "https://en.wikipedia.org/w/api.php"
 
+# Word tokenizer for _clean_extract — ignores punctuation ("founded." == "founded")
+_WORD_RE = re.compile(r'[a-z0-9]+')
+
+# _clean_extract early exit: extracts longer than this stop scanning after
+# a run of paragraphs with no claim-word overlap
+_LONG_EXTRACT_CHARS = 32 * 1024
+_MAX_IRRELEVANT_RUN = 10
+
+# MediaWiki returns at most 20 intro extracts per prop=extracts request
+_EXTRACTS_PER_REQUEST = 20
+
 
 def _has_entity_relevance(claim_text: str) -> bool:
     """Check if a claim mentions named entities that Wikipedia would cover.
@@ -56,6 +68,65 @@ def search_wikipedia(claim_text: str, max_results: int = 5) -> List[Dict[str, An
     Standard evidence source signature. Returns list of dicts with keys:
     url, title, source_name, evidence_type, snippet.
     """
+    # Step 1: Search for matching articles
+    search_results = _search_pages(claim_text, max_results)
+    if not search_results:
+        return []
+
+    # Step 2: Get extracts (summaries) for the matching pages
+    pages = _fetch_extracts([str(r["pageid"]) for r in search_results])
+    if pages is None:
+        # Fall back to search snippets only
+        return _build_results_from_search(search_results, max_results)
+
+    return _build_results(search_results, pages, claim_text, max_results)
+
+
+def search_wikipedia_batch(
+    claims: List[str],
+    max_results: int = 5,
+) -> List[List[Dict[str, Any]]]:
+    """Search Wikipedia for many claims, sharing the extracts requests.
+
+    Runs one search per claim, then fetches extracts for the union of
+    matched page IDs in as few requests as the API allows — N searches
+    plus ceil(pages / 20) extract calls instead of 2N calls.
+
+    Returns one result list per claim, in the same order as *claims*.
+    """
+    searches = [_search_pages(text, max_results) for text in claims]
+
+    page_ids: List[str] = []
+    seen = set()
+    for search_results in searches:
+        for r in search_results:
+            pid = str(r["pageid"])
+            if pid not in seen:
+                seen.add(pid)
+                page_ids.append(pid)
+
+    pages: Dict[str, Any] = {}
+    failed = False
+    for i in range(0, len(page_ids), _EXTRACTS_PER_REQUEST):
+        chunk = _fetch_extracts(page_ids[i:i + _EXTRACTS_PER_REQUEST])
+        if chunk is None:
+            failed = True
+        else:
+            pages.update(chunk)
+
+    batch_results: List[List[Dict[str, Any]]] = []
+    for text, search_results in zip(claims, searches):
+        if not search_results:
+            batch_results.append([])
+        elif failed and not any(str(r["pageid"]) in pages for r in search_results):
+            batch_results.append(_build_results_from_search(search_results, max_results))
+        else:
+            batch_results.append(_build_results(search_results, pages, text, max_results))
+    return batch_results
+
+
+def _search_pages(claim_text: str, max_results: int) -> List[Dict[str, Any]]:
+    """Run list=search for a claim. Returns raw search hits ([] on failure)."""
     # Pre-filter: skip claims without named entities
     if not _has_entity_relevance(claim_text):
         return []
@@ -64,7 +135,6 @@ def search_wikipedia(claim_text: str, max_results: int = 5) -> List[Dict[str, An
     if not query:
         return []
 
-    # Step 1: Search for matching articles
     resp = rate_limited_get(
         _SEARCH_URL,
         source_name="wikipedia",
@@ -85,13 +155,11 @@ def search_wikipedia(claim_text: str, max_results: int = 5) -> List[Dict[str, An
     except Exception:
         return []
 
-    search_results = data.get("query", {}).get("search", [])
-    if not search_results:
-        return []
+    return data.get("query", {}).get("search", [])
 
-    # Step 2: Get extracts (summaries) for the matching pages
-    page_ids = [str(r["pageid"]) for r in search_results]
 
+def _fetch_extracts(page_ids: List[str]) -> Optional[Dict[str, Any]]:
+    """Fetch intro extracts + URLs for *page_ids*. Returns None on failure."""
     extract_resp = rate_limited_get(
         _SEARCH_URL,
         source_name="wikipedia",
@@ -108,15 +176,23 @@ def search_wikipedia(claim_text: str, max_results: int = 5) -> List[Dict[str, An
         },
     )
     if extract_resp is None:
-        # Fall back to search snippets only
-        return _build_results_from_search(search_results, max_results)
+        return None
 
     try:
         extract_data = extract_resp.json()
     except Exception:
-        return _build_results_from_search(search_results, max_results)
+        return None
+
+    return extract_data.get("query", {}).get("pages", {})
 
-    pages = extract_data.get("query", {}).get("pages", {})
+
+def _build_results(
+    search_results: List[Dict[str, Any]],
+    pages: Dict[str, Any],
+    claim_text: str,
+    max_results: int,
+) -> List[Dict[str, Any]]:
+    """Turn search hits + fetched extracts into evidence result dicts."""
     results = []
 
     for sr in search_results:
@@ -157,16 +233,21 @@ def _clean_extract(extract: str, claim_text: str) -> str:
         return extract[:500]
 
     # Score paragraphs by relevance to claim
-    claim_words = set(claim_text.lower().split())
+    claim_words = frozenset(m.group() for m in _WORD_RE.finditer(claim_text.lower()))
+    long_extract = len(extract) > _LONG_EXTRACT_CHARS
     scored = []
+    misses = 0
     for p in paragraphs:
-        p_words = set(p.lower().split())
-        overlap = len(claim_words & p_words)
+        overlap = len(claim_words.intersection(m.group() for m in _WORD_RE.finditer(p.lower())))
         scored.append((overlap, p))
-
-    # Sort by relevance, take top 3 paragraphs
-    scored.sort(key=lambda x: -x[0])
-    best = scored[:3]
+        if long_extract:
+            # Very long pages: stop once relevance has clearly dried up
+            misses = misses + 1 if overlap == 0 else 0
+            if misses >= _MAX_IRRELEVANT_RUN:
+                break
+
+    # Take top 3 paragraphs by relevance (ties keep document order)
+    best = heapq.nlargest(3, scored, key=lambda x: x[0])
 
     return " ".join(p for _, p in best)
 
@@ -10,7 +10,7 @@ from __future__ import annotations
 import re
 from typing import List, Dict, Any, Optional
 
-from .base import rate_limited_get
+from .base import rate_limited_get, build_term_index, match_longest_term
 
 
 _BASE_URL = "https://api.worldbank.org/v2"
@@ -74,21 +74,21 @@ _COUNTRY_CODES: Dict[str, str] = {
     "global": "WLD",
 }
 
+# Longest-first so "gdp per capita" wins over "gdp" — sorted once at import
+_INDICATORS_BY_LEN = tuple(sorted(_INDICATOR_MAP, key=len, reverse=True))
+_COUNTRIES_BY_LEN = tuple(sorted(_COUNTRY_CODES, key=len, reverse=True))
+_INDICATOR_INDEX = build_term_index(_INDICATORS_BY_LEN)
+_COUNTRY_INDEX = build_term_index(_COUNTRIES_BY_LEN)
+
 
 def _match_indicator(claim_text: str) -> Optional[tuple[str, str]]:
-    lower = claim_text.lower()
-    for term in sorted(_INDICATOR_MAP.keys(), key=len, reverse=True):
-        if term in lower:
-            return _INDICATOR_MAP[term]
-    return None
+    term = match_longest_term(claim_text.lower(), _INDICATOR_INDEX)
+    return _INDICATOR_MAP[term] if term else None
 
 
 def _extract_country(claim_text: str) -> str:
-    lower = claim_text.lower()
-    for name in sorted(_COUNTRY_CODES.keys(), key=len, reverse=True):
-        if name in lower:
-            return _COUNTRY_CODES[name]
-    return "WLD"  # Default to world aggregate
+    name = match_longest_term(claim_text.lower(), _COUNTRY_INDEX)
+    return _COUNTRY_CODES[name] if name else "WLD"  # Default to world aggregate
 
 
 def search_worldbank(claim_text: str, max_results: int = 5) -> List[Dict[str, Any]]:
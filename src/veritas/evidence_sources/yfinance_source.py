@@ -8,7 +8,10 @@ No API key required.
 from __future__ import annotations
 import re
 import time
-from typing import List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Tuple
+
+from .base import build_term_index, match_longest_term
 
 # Rate limiting — yfinance is a library wrapping HTTP calls to Yahoo
 _LAST_REQUEST: float = 0.0
@@ -24,6 +27,113 @@ def _rate_limit():
     _LAST_REQUEST = time.time()
 
 
+# Small shared pool so the news request overlaps the info fetch
+_POOL: Optional[ThreadPoolExecutor] = None
+
+
+def _get_pool() -> ThreadPoolExecutor:
+    """Return the module's worker pool, creating it on first use."""
+    global _POOL
+    if _POOL is None:
+        _POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="yfinance")
+    return _POOL
+
+
+# ------------------------------------------------------------------
+# Info cache: ticker -> (fetched_at, info dict)
+# ------------------------------------------------------------------
+
+_INFO_CACHE: Dict[Tuple[str, bool], Tuple[float, Dict[str, Any]]] = {}
+_INFO_TTL = 600.0  # seconds — market data is "live enough" for 10 minutes
+_INFO_CACHE_MAX = 512
+
+# Claims mentioning fundamentals need the full (slow) .info payload;
+# pure price / market-cap claims are served from the lighter fast_info.
+_FUNDAMENTALS_RE = re.compile(
+    r'\b(p/?e|eps|revenue|revenues|sales|profit|profits|margin|margins|'
+    r'earnings|income|dividend|dividends|employees|growth)\b'
+)
+
+# fast_info attribute -> equivalent .info key
+_FAST_INFO_FIELDS = (
+    ("last_price", "currentPrice"),
+    ("market_cap", "marketCap"),
+    ("year_high", "fiftyTwoWeekHigh"),
+    ("year_low", "fiftyTwoWeekLow"),
+)
+
+
+def _needs_full_info(claim_text: str) -> bool:
+    """True if the claim references metrics only present in the full .info."""
+    return _FUNDAMENTALS_RE.search(claim_text.lower()) is not None
+
+
+def _fast_info_dict(stock: Any, ticker: str) -> Dict[str, Any]:
+    """Build an .info-shaped dict from stock.fast_info.
+
+    Returns {} if fast_info has no usable numbers, so callers can fall
+    back to the full .info fetch.
+    """
+    try:
+        fast = stock.fast_info
+    except Exception:
+        return {}
+    info: Dict[str, Any] = {}
+    for attr, key in _FAST_INFO_FIELDS:
+        try:
+            val = getattr(fast, attr)
+        except Exception:
+            continue
+        if isinstance(val, (int, float)) and not isinstance(val, bool) and val == val:
+            info[key] = val
+    if not info:
+        return {}
+    info["symbol"] = ticker
+    return info
+
+
+def _cached_info(ticker: str, full: bool) -> Optional[Dict[str, Any]]:
+    """Return unexpired cached info for *ticker*, or None.
+
+    A cached full .info also satisfies a fast request.
+    """
+    now = time.time()
+    keys = [(ticker, True)] if full else [(ticker, False), (ticker, True)]
+    for key in keys:
+        hit = _INFO_CACHE.get(key)
+        if hit is not None and now - hit[0] < _INFO_TTL:
+            return hit[1]
+    return None
+
+
+def _get_info(stock: Any, ticker: str, full: bool, throttle: bool = True) -> Dict[str, Any]:
+    """Return (cached) market info for *ticker*.
+
+    Empty results are never cached so a transient failure doesn't stick for
+    the whole TTL.  Pass throttle=False when the caller has already called
+    _rate_limit() for this request.
+    """
+    cached = _cached_info(ticker, full)
+    if cached is not None:
+        return cached
+
+    if throttle:
+        _rate_limit()
+    info: Dict[str, Any] = {}
+    if not full:
+        info = _fast_info_dict(stock, ticker)
+        if not info:
+            full = True
+    if full:
+        info = stock.info or {}
+
+    if info:
+        if len(_INFO_CACHE) >= _INFO_CACHE_MAX:
+            _INFO_CACHE.pop(min(_INFO_CACHE, key=lambda k: _INFO_CACHE[k][0]))
+        _INFO_CACHE[(ticker, full)] = (time.time(), info)
+    return info
+
+
 # ------------------------------------------------------------------
 # Ticker resolution: company name -> ticker symbol
 # ------------------------------------------------------------------
@@ -73,6 +183,11 @@ _TICKER_BLACKLIST = frozenset({
     "OWN", "PUT", "LET", "GOT", "GET", "SAW", "USE", "TRY", "ASK", "END",
 })
 
+# Sorted by length descending so "jp morgan" matches before "jp"
+_TICKER_NAMES_BY_LEN = tuple(sorted(_TICKER_MAP, key=len, reverse=True))
+_TICKER_NAME_INDEX = build_term_index(_TICKER_NAMES_BY_LEN)
+_TICKER_SYMBOLS = frozenset(_TICKER_MAP.values())
+
 
 def _extract_ticker(claim_text: str) -> Optional[str]:
     """Extract a stock ticker from claim text.
@@ -86,10 +201,9 @@ def _extract_ticker(claim_text: str) -> Optional[str]:
     lower = claim_text.lower()
 
     # Strategy 1: Known company name lookup (most reliable)
-    # Sort by length descending so "jp morgan" matches before "jp"
-    for name in sorted(_TICKER_MAP.keys(), key=len, reverse=True):
-        if name in lower:
-            return _TICKER_MAP[name]
+    name = match_longest_term(lower, _TICKER_NAME_INDEX)
+    if name:
+        return _TICKER_MAP[name]
 
     # Strategy 2: Explicit ticker symbols (all-caps, 2-5 letters)
     # Must be surrounded by word boundaries
@@ -97,7 +211,7 @@ def _extract_ticker(claim_text: str) -> Optional[str]:
     for c in candidates:
         if c not in _TICKER_BLACKLIST:
             # Validate: it should be a real ticker (exists in our map values)
-            if c in _TICKER_MAP.values() or c in {v for v in _TICKER_MAP.values()}:
+            if c in _TICKER_SYMBOLS:
                 return c
 
     return None
@@ -244,12 +358,26 @@ def search_yfinance(
 
     try:
         import yfinance as yf
-        _rate_limit()
 
         stock = yf.Ticker(ticker)
-        info = stock.info or {}
+        full = _needs_full_info(claim_text)
+        info = _cached_info(ticker, full)
+        # News is independent of .info — fetch it while the info call runs.
+        # Only worth a request if there is room for news in the results; the
+        # worker gets its own Ticker so the two threads never share one.
+        # One throttle covers both requests since they go out together.
+        fetch_news = max_results > 1
+        if info is None or fetch_news:
+            _rate_limit()
+        news_future = None
+        if fetch_news:
+            news_future = _get_pool().submit(lambda: yf.Ticker(ticker).news or [])
+        if info is None:
+            info = _get_info(stock, ticker, full, throttle=False)
 
         if not info or not info.get("symbol"):
+            if news_future is not None:
+                news_future.cancel()
             return []
 
         results = []
@@ -307,7 +435,7 @@ def search_yfinance(
 
         # Result 3: Recent news (secondary evidence)
         try:
-            news = stock.news or []
+            news = news_future.result() if news_future is not None else []
             for item in news[:min(2, max_results - len(results))]:
                 news_title = item.get("title", "")
                 publisher = item.get("publisher", "")
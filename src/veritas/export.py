@@ -89,71 +89,72 @@ def export_json(source_id: str, max_quotes: int = DEFAULT_MAX_QUOTES) -> str:
     return str(out)
 
 
+_STATUS_ICONS = {
+    "supported": "✅",
+    "contradicted": "❌",
+    "partial": "⚠️",
+    "unknown": "❓",
+}
+
+
 def export_markdown(source_id: str, max_quotes: int = DEFAULT_MAX_QUOTES) -> str:
-    """Write brief.md and return its path."""
+    """Write brief.md and return its path.
+
+    Lines are streamed straight to the file rather than joined in memory.
+    """
     d = _build_brief_data(source_id, max_quotes)
 
-    lines = [
-        f"# Veritas Brief: {d['title']}",
-        "",
-        f"**Source:** {d['url']}  ",
-        f"**Channel:** {d['channel']}  ",
-        f"**Uploaded:** {d['upload_date']}  ",
-        f"**Duration:** {d['duration']}  ",
-        f"**Source ID:** `{d['source_id']}`  ",
-        f"**Total claims extracted:** {d['total_claims']}  ",
-        f"**Generated:** {d['generated_at']}  ",
-        "",
-        "---",
-        "",
-        "## Claims",
-        "",
-    ]
-
-    for i, c in enumerate(d["claims"], 1):
-        final = c["final_status"]
-        status_icon = {
-            "supported": "✅",
-            "contradicted": "❌",
-            "partial": "⚠️",
-            "unknown": "❓",
-        }.get(final, "❓")
-
-        # Show provenance: HUMAN override or AUTO
-        provenance = "HUMAN" if c.get("status_human") else (
-            f"AUTO ({c['auto_confidence']:.0%})" if c.get("status_auto", "unknown") != "unknown" else "UNVERIFIED"
-        )
-
-        lines.append(f"### {i}. {status_icon} [{final.upper()}] ({c['confidence']}) — {provenance}")
-        lines.append("")
-        lines.append(f"> \"{c['text']}\"")
-        lines.append(f">")
-        lines.append(f"> *Timestamp: {c['timestamp']}  |  Category: {c.get('category', 'general')}*")
-        lines.append("")
-
-        if c["evidence"]:
-            lines.append("**Evidence (human-verified):**")
-            for ev in c["evidence"]:
-                lines.append(f"- [{ev['type']}] ({ev['strength']}) {ev['url']}")
-                if ev["notes"]:
-                    lines.append(f"  - {ev['notes']}")
-            lines.append("")
-
-        if c.get("evidence_suggestions"):
-            lines.append("**Evidence suggestions (auto-discovered):**")
-            for s in c["evidence_suggestions"]:
-                lines.append(f"- [{s['source']}] (score: {s['score']}) {s['url']}")
-                if s.get("title"):
-                    lines.append(f"  - {s['title'][:100]}")
-            lines.append("")
-
-    lines.append("---")
-    lines.append("")
-    lines.append("*Generated by Veritas — local claim extraction engine.*")
-    lines.append("")
-
-    text = "\n".join(lines)
     out = source_export_dir(source_id) / "brief.md"
-    with open(out, "w", encoding="utf-8") as fh:
-        fh.write(text)
+    with open(out, "w", encoding="utf-8", buffering=1 << 20) as fh:
+        w = fh.write
+        w(f"# Veritas Brief: {d['title']}\n")
+        w("\n")
+        w(f"**Source:** {d['url']}  \n")
+        w(f"**Channel:** {d['channel']}  \n")
+        w(f"**Uploaded:** {d['upload_date']}  \n")
+        w(f"**Duration:** {d['duration']}  \n")
+        w(f"**Source ID:** `{d['source_id']}`  \n")
+        w(f"**Total claims extracted:** {d['total_claims']}  \n")
+        w(f"**Generated:** {d['generated_at']}  \n")
+        w("\n")
+        w("---\n")
+        w("\n")
+        w("## Claims\n")
+        w("\n")
+
+        for i, c in enumerate(d["claims"], 1):
+            final = c["final_status"]
+            status_icon = _STATUS_ICONS.get(final, "❓")
+
+            # Show provenance: HUMAN override or AUTO
+            provenance = "HUMAN" if c.get("status_human") else (
+                f"AUTO ({c['auto_confidence']:.0%})" if c.get("status_auto", "unknown") != "unknown" else "UNVERIFIED"
+            )
+
+            w(f"### {i}. {status_icon} [{final.upper()}] ({c['confidence']}) — {provenance}\n")
+            w("\n")
+            w(f"> \"{c['text']}\"\n")
+            w(">\n")
+            w(f"> *Timestamp: {c['timestamp']}  |  Category: {c.get('category', 'general')}*\n")
+            w("\n")
+
+            if c["evidence"]:
+                w("**Evidence (human-verified):**\n")
+                for ev in c["evidence"]:
+                    w(f"- [{ev['type']}] ({ev['strength']}) {ev['url']}\n")
+                    if ev["notes"]:
+                        w(f"  - {ev['notes']}\n")
+                w("\n")
+
+            if c.get("evidence_suggestions"):
+                w("**Evidence suggestions (auto-discovered):**\n")
+                for s in c["evidence_suggestions"]:
+                    w(f"- [{s['source']}] (score: {s['score']}) {s['url']}\n")
+                    if s.get("title"):
+                        w(f"  - {s['title'][:100]}\n")
+                w("\n")
+
+        w("---\n")
+        w("\n")
+        w("*Generated by Veritas — local claim extraction engine.*\n")
     return str(out)
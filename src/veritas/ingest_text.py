@@ -12,11 +12,14 @@ Supported intake paths:
 """
 
 from __future__ import annotations
+import io
+import itertools
 import json
 import re
 import textwrap
+from html import unescape
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterator, List, Optional
 
 import requests
 
@@ -30,7 +33,10 @@ from . import db
 # ------------------------------------------------------------------
 
 _PARA_RE = re.compile(r'\n\s*\n')  # paragraph boundary
+_SENT_SPLIT_RE = re.compile(r'(?<=[.!?])\s+')  # sentence boundary
 _SEGMENT_TARGET_CHARS = 200  # approximate target per segment
+_MAX_HTML_BYTES = 5_000_000  # pages are truncated past this when fetched
+_FETCH_CHUNK_BYTES = 64 * 1024
 
 
 def _text_to_segments(text: str) -> List[dict]:
@@ -39,51 +45,84 @@ def _text_to_segments(text: str) -> List[dict]:
     Mimics the transcript segment format so the existing claim
     extraction pipeline works unchanged.
     """
-    # Split into paragraphs first
-    paragraphs = [p.strip() for p in _PARA_RE.split(text) if p.strip()]
-
     segments = []
     fake_ts = 0.0
 
-    for para in paragraphs:
-        # Split long paragraphs into ~200-char chunks at sentence boundaries
-        if len(para) <= _SEGMENT_TARGET_CHARS:
-            chunks = [para]
-        else:
-            chunks = _split_into_chunks(para, _SEGMENT_TARGET_CHARS)
-
-        for chunk in chunks:
-            if len(chunk.strip()) < 20:
-                continue
-            duration = max(1.0, len(chunk) / 20.0)  # ~20 chars/sec reading speed
-            segments.append({
-                "start": round(fake_ts, 3),
-                "end": round(fake_ts + duration, 3),
-                "text": chunk.strip(),
-            })
-            fake_ts += duration
+    for chunk in _iter_chunks(text, _SEGMENT_TARGET_CHARS):
+        if len(chunk) < 20:
+            continue
+        duration = max(1.0, len(chunk) / 20.0)  # ~20 chars/sec reading speed
+        segments.append({
+            "start": round(fake_ts, 3),
+            "end": round(fake_ts + duration, 3),
+            "text": chunk,
+        })
+        fake_ts += duration
 
     return segments
 
 
-def _split_into_chunks(text: str, target_chars: int) -> List[str]:
-    """Split text at sentence boundaries into chunks of ~target_chars."""
-    # Split at sentence endings
-    sentences = re.split(r'(?<=[.!?])\s+', text)
-    chunks = []
-    current = ""
-
-    for sent in sentences:
-        if len(current) + len(sent) > target_chars and current:
-            chunks.append(current.strip())
-            current = sent
+def _iter_chunks(text: str, target_chars: int) -> Iterator[str]:
+    """Yield stripped ~target_chars chunks of *text* in one pass.
+
+    Paragraphs are walked with finditer rather than split into a list;
+    short paragraphs are yielded whole, long ones are cut at sentence
+    boundaries.
+    """
+    pos = 0
+    for m in itertools.chain(_PARA_RE.finditer(text), (None,)):
+        para = text[pos:m.start()].strip() if m else text[pos:].strip()
+        if m is not None:
+            pos = m.end()
+        if not para:
+            continue
+        if len(para) <= target_chars:
+            yield para
         else:
-            current = (current + " " + sent).strip()
+            yield from _iter_sentence_chunks(para, target_chars)
+
 
-    if current.strip():
-        chunks.append(current.strip())
+def _iter_sentence_chunks(text: str, target_chars: int) -> Iterator[str]:
+    """Group the sentences of *text* into chunks of ~target_chars.
+
+    *text* must not start with whitespace. Sentence boundaries are walked
+    with finditer and each chunk is sliced out of *text* once; only when a
+    boundary inside the chunk is something other than a single space is
+    the chunk re-joined, so the output matches " ".join(sentences).
+    """
+    def emit(start: int, end: int, plain: bool) -> str:
+        chunk = text[start:end]
+        return chunk if plain else " ".join(_SENT_SPLIT_RE.split(chunk))
+
+    chunk_start = prev_end = pos = 0
+    length = 0  # length of the chunk once " "-joined; 0 while empty
+    plain = True
+    for m in itertools.chain(_SENT_SPLIT_RE.finditer(text), (None,)):
+        end = m.start() if m is not None else len(text)
+        sent_len = end - pos
+        if sent_len:
+            if length and length + sent_len > target_chars:
+                yield emit(chunk_start, prev_end, plain)
+                chunk_start, length, plain = pos, sent_len, True
+            elif length:
+                length += sent_len + 1
+                plain = plain and pos - prev_end == 1 and text[prev_end] == " "
+            else:
+                chunk_start, length = pos, sent_len
+            prev_end = end
+        if m is not None:
+            pos = m.end()
+    if length:
+        yield emit(chunk_start, prev_end, plain).rstrip()
 
-    return chunks
+
+def _split_into_chunks(text: str, target_chars: int) -> List[str]:
+    """Split text at sentence boundaries into chunks of ~target_chars."""
+    # Trailing whitespace still counts toward the last sentence's length
+    text = text.lstrip()
+    if not text:
+        return []
+    return list(_iter_sentence_chunks(text, target_chars))
 
 
 # ------------------------------------------------------------------
@@ -161,27 +200,36 @@ def _extract_pdf_text(path: Path) -> str:
     # Try PyMuPDF first (faster, better quality)
     try:
         import fitz  # PyMuPDF
-        doc = fitz.open(str(path))
-        pages = []
-        for page in doc:
-            pages.append(page.get_text())
-        doc.close()
-        return "\n\n".join(pages)
     except ImportError:
         pass
+    else:
+        # Stream pages into one buffer instead of holding a list of page strings
+        buf = io.StringIO()
+        with fitz.open(str(path)) as doc:
+            for i, page in enumerate(doc):
+                if i:
+                    buf.write("\n\n")
+                buf.write(page.get_text("text"))
+        return buf.getvalue()
 
     # Try pdfplumber
     try:
         import pdfplumber
+    except ImportError:
+        pass
+    else:
+        buf = io.StringIO()
         with pdfplumber.open(str(path)) as pdf:
-            pages = []
+            first = True
             for page in pdf.pages:
                 text = page.extract_text()
                 if text:
-                    pages.append(text)
-            return "\n\n".join(pages)
-    except ImportError:
-        pass
+                    if not first:
+                        buf.write("\n\n")
+                    buf.write(text)
+                    first = False
+                page.flush_cache()  # release parsed page objects eagerly
+        return buf.getvalue()
 
     raise ImportError(
         "PDF ingestion requires PyMuPDF or pdfplumber. "
@@ -205,14 +253,7 @@ def ingest_url(url: str, title: str = "", channel: str = "") -> Source:
 
     Returns: Source object.
     """
-    resp = requests.get(
-        url,
-        headers={"User-Agent": "Veritas/1.0 (local research tool)"},
-        timeout=30,
-    )
-    resp.raise_for_status()
-
-    page_title, text = _extract_article_text(resp.text)
+    page_title, text = _extract_article_text(_fetch_html(url))
 
     if not text.strip():
         raise ValueError(f"No article text could be extracted from: {url}")
@@ -229,53 +270,123 @@ def ingest_url(url: str, title: str = "", channel: str = "") -> Source:
     )
 
 
+def _fetch_html(url: str) -> str:
+    """GET *url* and return the decoded body, capped at _MAX_HTML_BYTES.
+
+    The body is streamed so an oversized page is cut off instead of being
+    buffered whole; compressed transfer is requested and decoded by requests.
+    """
+    resp = requests.get(
+        url,
+        headers={
+            "User-Agent": "Veritas/1.0 (local research tool)",
+            "Accept-Encoding": "gzip, deflate",
+        },
+        timeout=30,
+        stream=True,
+    )
+    try:
+        resp.raise_for_status()
+        body = bytearray()
+        for chunk in resp.iter_content(chunk_size=_FETCH_CHUNK_BYTES):
+            body += chunk
+            if len(body) >= _MAX_HTML_BYTES:
+                del body[_MAX_HTML_BYTES:]
+                break
+    finally:
+        resp.close()
+
+    try:
+        return body.decode(resp.encoding or "utf-8", errors="replace")
+    except LookupError:  # unknown charset in Content-Type
+        return body.decode("utf-8", errors="replace")
+
+
+_TITLE_RE = re.compile(r'<title[^>]*>(.*?)</title>', re.DOTALL | re.IGNORECASE)
+_CONTENT_RES = tuple(
+    re.compile(rf'<{tag}[^>]*>(.*?)</{tag.split("[")[0]}>', re.DOTALL | re.IGNORECASE)
+    for tag in ('article', 'main', '[role="main"]')
+)
+_STRIP_TAG_RES = tuple(
+    re.compile(rf'<{tag}[^>]*>.*?</{tag}>', re.DOTALL | re.IGNORECASE)
+    for tag in ('script', 'style', 'nav', 'header', 'footer', 'aside', 'noscript')
+)
+_TAG_RE = re.compile(r'<[^>]+>')
+_WS_RE = re.compile(r'\s+')
+
+# selectolax equivalents of the patterns above
+_STRIP_SELECTOR = "script, style, nav, header, footer, aside, noscript"
+_CONTENT_SELECTORS = ("article", "main", '[role="main"]')
+
+
 def _extract_article_text(html: str) -> tuple[str, str]:
     """Extract title and article text from HTML.
 
+    Uses selectolax (lexbor) for a single C-level parse when installed;
+    falls back to the regex extractor otherwise.
+
+    Returns (title, text).
+    """
+    try:
+        from selectolax.lexbor import LexborHTMLParser
+    except ImportError:
+        return _extract_article_text_regex(html)
+
+    tree = LexborHTMLParser(html)
+
+    title_node = tree.css_first("title")
+    title = title_node.text().strip() if title_node is not None else ""
+
+    # Drop scripts, styles, nav, header, footer
+    for node in tree.css(_STRIP_SELECTOR):
+        node.decompose()
+
+    # Prefer article/main content, else the whole body
+    root = None
+    for selector in _CONTENT_SELECTORS:
+        root = tree.css_first(selector)
+        if root is not None:
+            break
+    if root is None:
+        root = tree.body
+    if root is None:
+        return title[:200], ""
+
+    text = _WS_RE.sub(' ', root.text(separator=' ')).strip()
+    return title[:200], text
+
+
+def _extract_article_text_regex(html: str) -> tuple[str, str]:
+    """Regex-only fallback for _extract_article_text.
+
     Basic approach: strip tags, extract <title>, get text from <article>
     or <main> or <body>. No external dependencies.
 
     Returns (title, text).
     """
     # Extract title
-    title_match = re.search(r'<title[^>]*>(.*?)</title>', html, re.DOTALL | re.IGNORECASE)
-    title = title_match.group(1).strip() if title_match else ""
-    # Clean HTML entities in title
-    title = re.sub(r'&amp;', '&', title)
-    title = re.sub(r'&lt;', '<', title)
-    title = re.sub(r'&gt;', '>', title)
-    title = re.sub(r'&#\d+;', '', title)
-    title = re.sub(r'&\w+;', '', title)
+    title_match = _TITLE_RE.search(html)
+    # Decode HTML entities in title (named and numeric, single pass)
+    title = unescape(title_match.group(1)).strip() if title_match else ""
 
     # Try to find article/main content
     content_html = html
-    for tag in ('article', 'main', '[role="main"]'):
-        match = re.search(
-            rf'<{tag}[^>]*>(.*?)</{tag.split("[")[0]}>',
-            html, re.DOTALL | re.IGNORECASE,
-        )
+    for content_re in _CONTENT_RES:
+        match = content_re.search(html)
         if match:
             content_html = match.group(1)
             break
 
     # Strip scripts, styles, nav, header, footer
-    for strip_tag in ('script', 'style', 'nav', 'header', 'footer', 'aside', 'noscript'):
-        content_html = re.sub(
-            rf'<{strip_tag}[^>]*>.*?</{strip_tag}>',
-            '', content_html, flags=re.DOTALL | re.IGNORECASE,
-        )
+    for strip_re in _STRIP_TAG_RES:
+        content_html = strip_re.sub('', content_html)
 
     # Strip all remaining HTML tags
-    text = re.sub(r'<[^>]+>', ' ', content_html)
+    text = _TAG_RE.sub(' ', content_html)
 
-    # Clean up whitespace and HTML entities
-    text = re.sub(r'&nbsp;', ' ', text)
-    text = re.sub(r'&amp;', '&', text)
-    text = re.sub(r'&lt;', '<', text)
-    text = re.sub(r'&gt;', '>', text)
-    text = re.sub(r'&#\d+;', '', text)
-    text = re.sub(r'&\w+;', '', text)
-    text = re.sub(r'\s+', ' ', text)
+    # Decode HTML entities, then collapse whitespace (&nbsp; -> \xa0 -> ' ')
+    text = unescape(text)
+    text = _WS_RE.sub(' ', text)
 
     # Re-introduce paragraph breaks (approximate based on double spaces or periods)
     text = text.strip()
@@ -313,6 +424,17 @@ def ingest_raw_text(text: str, title: str = "Inline Text", channel: str = "") ->
 # Shared: create source from text
 # ------------------------------------------------------------------
 
+def _write_transcript(path: Path, segments: List[dict]) -> None:
+    """Write {"segments": [...]} as indented UTF-8 JSON, via orjson if present."""
+    try:
+        import orjson
+    except ImportError:
+        with open(path, "w", encoding="utf-8") as fh:
+            json.dump({"segments": segments}, fh, indent=2, ensure_ascii=False)
+        return
+    path.write_bytes(orjson.dumps({"segments": segments}, option=orjson.OPT_INDENT_2))
+
+
 def _create_text_source(
     text: str,
     title: str,
@@ -348,8 +470,7 @@ def _create_text_source(
     # Write transcript.json
     out_dir = source_export_dir(source_id)
     transcript_path = out_dir / "transcript.json"
-    with open(transcript_path, "w", encoding="utf-8") as fh:
-        json.dump({"segments": segments}, fh, indent=2, ensure_ascii=False)
+    _write_transcript(transcript_path, segments)
 
     # Store transcript metadata
     tmeta = TranscriptMeta(
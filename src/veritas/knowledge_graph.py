@@ -12,10 +12,10 @@ from __future__ import annotations
 import time
 from collections import defaultdict
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Dict, Hashable, Iterator, List, Optional, Sequence, Tuple
 
 from .scoring import _normalise, _tokenize, _extract_claim_numbers, _CAT_TERMS
-from .models import new_id
+from .models import _DATACLASS_SLOTS, new_id
 
 
 # ---------------------------------------------------------------------------
@@ -37,6 +37,10 @@ STOPWORDS = frozenset([
 # Step 1: Claim fingerprinting
 # ---------------------------------------------------------------------------
 
+# Union of every category's terms, used for "general" claims
+_ALL_CAT_TERMS: frozenset = frozenset().union(*_CAT_TERMS.values())
+
+
 def claim_fingerprint(text: str, category: str = "general") -> str:
     """Generate a deterministic fingerprint for fuzzy claim matching.
 
@@ -45,29 +49,33 @@ def claim_fingerprint(text: str, category: str = "general") -> str:
 
     Same underlying fact with different wording produces similar fingerprints.
     """
+    components = claim_fingerprint_set(text, category)
+    if not components:
+        return ""
+    return "|".join(sorted(components))
+
+
+def claim_fingerprint_set(text: str, category: str = "general") -> frozenset:
+    """Fingerprint components as a set — what clustering actually compares.
+
+    claim_fingerprint() is this set sorted and |-joined for storage.
+    """
     # Get all tokens minus stopwords
     tokens = _tokenize(text) - STOPWORDS
 
     # Extract numbers with unit conversion ($350 billion → "350000")
     numbers = _extract_claim_numbers(text)
 
-    # Get category-relevant terms
-    cat_terms = _CAT_TERMS.get(category, set())
+    # Get category-relevant terms (general claims match against every category)
     if category == "general":
-        # For general claims, scan all category dicts for any matches
-        all_cat_terms: Set[str] = set()
-        for terms in _CAT_TERMS.values():
-            all_cat_terms |= terms
-        cat_terms = all_cat_terms
+        cat_terms = _ALL_CAT_TERMS
+    else:
+        cat_terms = _CAT_TERMS.get(category, frozenset())
     matched_cat = cat_terms & tokens
 
     # Combine: significant tokens + numbers + category terms
     # Numbers are the strongest signal, followed by category terms, then tokens
-    components = tokens | numbers | matched_cat
-    if not components:
-        return ""
-
-    return "|".join(sorted(components))
+    return frozenset(tokens | numbers | matched_cat)
 
 
 def fingerprint_similarity(fp1: str, fp2: str) -> float:
@@ -77,19 +85,23 @@ def fingerprint_similarity(fp1: str, fp2: str) -> float:
     """
     if not fp1 or not fp2:
         return 0.0
-    set1 = set(fp1.split("|"))
-    set2 = set(fp2.split("|"))
-    union = set1 | set2
-    if not union:
+    return _jaccard(frozenset(fp1.split("|")), frozenset(fp2.split("|")))
+
+
+def _jaccard(a: frozenset, b: frozenset) -> float:
+    """Jaccard similarity of two pre-split fingerprint token sets."""
+    if not a or not b:
         return 0.0
-    return len(set1 & set2) / len(union)
+    inter = len(a & b)
+    return inter / (len(a) + len(b) - inter)
 
 
 # ---------------------------------------------------------------------------
 # Step 2: Blocking (avoid O(n²) comparisons)
 # ---------------------------------------------------------------------------
 
-@dataclass
+# __slots__ keeps per-claim overhead down when loading 100k+ claims.
+@dataclass(**_DATACLASS_SLOTS)
 class ClaimRecord:
     """Lightweight claim data for clustering."""
     claim_id: str
@@ -97,6 +109,7 @@ class ClaimRecord:
     text: str
     category: str
     fingerprint: str = ""
+    fingerprint_set: frozenset = frozenset()  # fingerprint split once, for Jaccard
     numbers: frozenset = frozenset()
     status_auto: str = "unknown"
     auto_confidence: float = 0.0
@@ -127,21 +140,31 @@ def build_blocks(claims: List[ClaimRecord]) -> Dict[str, List[ClaimRecord]]:
 # ---------------------------------------------------------------------------
 
 class UnionFind:
-    """Disjoint-set data structure with path compression and union by rank."""
+    """Disjoint-set data structure with path compression and union by rank.
+
+    Keys can be any hashable; build_clusters uses dense ints, which hash
+    and compare far cheaper than claim-id strings.
+    """
 
     def __init__(self) -> None:
-        self.parent: Dict[str, str] = {}
-        self.rank: Dict[str, int] = {}
+        self.parent: Dict[Hashable, Hashable] = {}
+        self.rank: Dict[Hashable, int] = {}
 
-    def find(self, x: str) -> str:
-        if x not in self.parent:
-            self.parent[x] = x
+    def find(self, x: Hashable) -> Hashable:
+        parent = self.parent
+        if x not in parent:
+            parent[x] = x
             self.rank[x] = 0
-        if self.parent[x] != x:
-            self.parent[x] = self.find(self.parent[x])
-        return self.parent[x]
-
-    def union(self, x: str, y: str) -> None:
+            return x
+        # Iterative two-pass path compression (no recursion depth limit)
+        root = x
+        while parent[root] != root:
+            root = parent[root]
+        while parent[x] != root:
+            parent[x], x = root, parent[x]
+        return root
+
+    def union(self, x: Hashable, y: Hashable) -> None:
         rx, ry = self.find(x), self.find(y)
         if rx == ry:
             return
@@ -151,14 +174,193 @@ class UnionFind:
         if self.rank[rx] == self.rank[ry]:
             self.rank[rx] += 1
 
-    def clusters(self) -> Dict[str, List[str]]:
+    def clusters(self) -> Dict[Hashable, List[Hashable]]:
         """Return mapping of root → list of all members."""
-        groups: Dict[str, List[str]] = defaultdict(list)
-        for x in self.parent:
-            groups[self.find(x)].append(x)
+        parent = self.parent
+        groups: Dict[Hashable, List[Hashable]] = defaultdict(list)
+        for x in parent:
+            root = x
+            while parent[root] != root:
+                root = parent[root]
+            groups[root].append(x)
         return dict(groups)
 
 
+# Blocks at least this large are scored as one matrix product when NumPy
+# is installed; smaller blocks stay on the plain pairwise loop.
+_VECTORIZE_MIN_BLOCK = 64
+
+# Blocks larger than this are too big for exact all-pairs scoring. With
+# datasketch installed they go through MinHash LSH; otherwise they are
+# skipped as noise.
+_MAX_EXACT_BLOCK = 500
+_MINHASH_PERMUTATIONS = 64
+
+# Below this many candidate pairs (summed over blocks) process start-up
+# costs more than it saves, so clustering stays in-process.
+_PARALLEL_MIN_PAIRS = 200_000
+
+
+def _similar_pairs(
+    block_claims: List[ClaimRecord],
+    threshold: float,
+) -> Iterator[Tuple[ClaimRecord, ClaimRecord]]:
+    """Yield cross-source pairs in a block whose Jaccard similarity >= threshold.
+
+    Pairs come out in (i, j) row-major order for i < j.
+    """
+    if len(block_claims) > _MAX_EXACT_BLOCK:
+        if 0.0 < threshold < 1.0:
+            try:
+                from datasketch import MinHash, MinHashLSH
+            except ImportError:
+                return
+            yield from _similar_pairs_lsh(block_claims, threshold, MinHash, MinHashLSH)
+        return
+
+    if len(block_claims) >= _VECTORIZE_MIN_BLOCK:
+        try:
+            import numpy as np
+        except ImportError:
+            pass
+        else:
+            yield from _similar_pairs_numpy(block_claims, threshold, np)
+            return
+
+    n = len(block_claims)
+    for i in range(n):
+        for j in range(i + 1, n):
+            a, b = block_claims[i], block_claims[j]
+            # Skip same-source pairs (cross-source only)
+            if a.source_id == b.source_id:
+                continue
+            sim = _jaccard(a.fingerprint_set, b.fingerprint_set)
+            if sim >= threshold:
+                yield a, b
+
+
+def _similar_pairs_numpy(
+    block_claims: List[ClaimRecord],
+    threshold: float,
+    np,
+) -> Iterator[Tuple[ClaimRecord, ClaimRecord]]:
+    """NumPy version of _similar_pairs: Jaccard for the whole block at once.
+
+    Builds a binary claim × token matrix X; X @ X.T gives every pairwise
+    intersection and row sums give set sizes, so unions follow directly.
+    """
+    n = len(block_claims)
+    vocab: Dict[str, int] = {}
+    rows: List[int] = []
+    cols: List[int] = []
+    for i, claim in enumerate(block_claims):
+        for token in claim.fingerprint_set:
+            rows.append(i)
+            cols.append(vocab.setdefault(token, len(vocab)))
+
+    x = np.zeros((n, max(len(vocab), 1)), dtype=np.float32)
+    x[rows, cols] = 1.0
+    inter = (x @ x.T).astype(np.float64)  # exact: counts are small integers
+    sizes = x.sum(axis=1, dtype=np.float64)
+    union = sizes[:, None] + sizes[None, :] - inter
+    jaccard = np.divide(inter, union, out=np.zeros_like(inter), where=union > 0)
+
+    source_ids: Dict[str, int] = {}
+    src = np.array([source_ids.setdefault(c.source_id, len(source_ids)) for c in block_claims])
+    keep = (jaccard >= threshold) & (src[:, None] != src[None, :])
+    keep = np.triu(keep, k=1)
+
+    for i, j in np.argwhere(keep):
+        yield block_claims[i], block_claims[j]
+
+
+def _similar_pairs_lsh(
+    block_claims: List[ClaimRecord],
+    threshold: float,
+    MinHash,
+    MinHashLSH,
+) -> Iterator[Tuple[ClaimRecord, ClaimRecord]]:
+    """MinHash-LSH version of _similar_pairs for oversized blocks.
+
+    LSH proposes candidate pairs near the threshold in ~O(n); each
+    candidate is then confirmed with the exact Jaccard, so no false
+    positives get through (some true pairs may be missed).
+    """
+    lsh = MinHashLSH(threshold=threshold, num_perm=_MINHASH_PERMUTATIONS)
+    signatures = {}
+    for i, claim in enumerate(block_claims):
+        if not claim.fingerprint_set:
+            continue  # empty fingerprints never match
+        m = MinHash(num_perm=_MINHASH_PERMUTATIONS)
+        m.update_batch([t.encode("utf-8") for t in claim.fingerprint_set])
+        lsh.insert(i, m)
+        signatures[i] = m
+
+    for i, m in signatures.items():
+        a = block_claims[i]
+        for j in sorted(j for j in lsh.query(m) if j > i):
+            b = block_claims[j]
+            if a.source_id == b.source_id:
+                continue
+            if _jaccard(a.fingerprint_set, b.fingerprint_set) >= threshold:
+                yield a, b
+
+
+def _score_block(
+    args: Tuple[List[Tuple[int, str, frozenset]], float],
+) -> List[Tuple[int, int]]:
+    """Process-pool worker: similar (key, key) pairs for one block.
+
+    Takes bare (key, source_id, fingerprint_set) tuples so only the fields
+    scoring needs are pickled across the process boundary.
+    """
+    rows, threshold = args
+    block_claims = [
+        ClaimRecord(claim_id=str(key), source_id=sid, text="", category="",
+                    fingerprint_set=fp)
+        for key, sid, fp in rows
+    ]
+    return [
+        (int(a.claim_id), int(b.claim_id))
+        for a, b in _similar_pairs(block_claims, threshold)
+    ]
+
+
+def _iter_block_edges(
+    blocks: List[List[ClaimRecord]],
+    threshold: float,
+    key_of: Dict[str, int],
+) -> Iterator[Tuple[int, int]]:
+    """Yield similar claim-key pairs for every block, in block order.
+
+    Large workloads are fanned out across a ProcessPoolExecutor (the scoring
+    is CPU-bound, so threads would just contend for the GIL); small ones, or
+    environments where a pool cannot be started, run in-process.
+    """
+    total_pairs = sum(len(b) * (len(b) - 1) // 2 for b in blocks)
+    if total_pairs >= _PARALLEL_MIN_PAIRS and len(blocks) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+
+        payloads = [
+            ([(key_of[c.claim_id], c.source_id, c.fingerprint_set) for c in b],
+             threshold)
+            for b in blocks
+        ]
+        try:
+            with ProcessPoolExecutor() as ex:
+                edge_lists = list(ex.map(_score_block, payloads, chunksize=8))
+        except (OSError, RuntimeError):
+            pass  # no usable process pool here; fall through to serial
+        else:
+            for edges in edge_lists:
+                yield from edges
+            return
+
+    for block_claims in blocks:
+        for a, b in _similar_pairs(block_claims, threshold):
+            yield key_of[a.claim_id], key_of[b.claim_id]
+
+
 def build_clusters(
     claims: List[ClaimRecord],
     threshold: float = 0.40,
@@ -169,29 +371,25 @@ def build_clusters(
     """
     # 1. Compute fingerprints and numbers
     for claim in claims:
-        claim.fingerprint = claim_fingerprint(claim.text, claim.category)
+        claim.fingerprint_set = claim_fingerprint_set(claim.text, claim.category)
+        claim.fingerprint = "|".join(sorted(claim.fingerprint_set))
         claim.numbers = frozenset(_extract_claim_numbers(claim.text))
 
     # 2. Build blocks
     blocks = build_blocks(claims)
 
-    # 3. Pairwise comparison within blocks → Union-Find
-    uf = UnionFind()
-    claim_map = {c.claim_id: c for c in claims}
+    # 3. Pairwise comparison within blocks → Union-Find. Claims are keyed by
+    #    dense ints internally; string ids are only needed for storage.
+    key_of: Dict[str, int] = {}
+    claim_map: Dict[int, ClaimRecord] = {}
+    for c in claims:
+        key = key_of.setdefault(c.claim_id, len(key_of))
+        claim_map[key] = c
 
-    for block_claims in blocks.values():
-        n = len(block_claims)
-        if n < 2 or n > 500:  # skip huge blocks (noise)
-            continue
-        for i in range(n):
-            for j in range(i + 1, n):
-                a, b = block_claims[i], block_claims[j]
-                # Skip same-source pairs (cross-source only)
-                if a.source_id == b.source_id:
-                    continue
-                sim = fingerprint_similarity(a.fingerprint, b.fingerprint)
-                if sim >= threshold:
-                    uf.union(a.claim_id, b.claim_id)
+    uf = UnionFind()
+    scored_blocks = [b for b in blocks.values() if len(b) >= 2]
+    for a, b in _iter_block_edges(scored_blocks, threshold, key_of):
+        uf.union(a, b)
 
     # 4. Extract clusters with 2+ members
     raw_clusters = uf.clusters()
@@ -210,12 +408,13 @@ def build_clusters(
 # ---------------------------------------------------------------------------
 
 def compute_consensus(
-    members: List[Dict],
+    members: Sequence,
 ) -> Tuple[str, float, float]:
     """Compute consensus score for a cluster of claims.
 
     Args:
-        members: List of dicts with keys: source_id, status_auto, auto_confidence
+        members: ClaimRecords (anything with source_id, status_auto and
+            auto_confidence attributes), or dicts with those keys
 
     Returns:
         (best_status, best_confidence, consensus_score)
@@ -226,17 +425,25 @@ def compute_consensus(
     if not members:
         return "unknown", 0.0, 0.0
 
-    # Best individual evidence
-    best_confidence = max(m.get("auto_confidence", 0.0) for m in members)
-
-    # Count unique sources with meaningful verification
-    source_ids = {m["source_id"] for m in members}
-    source_count = len(source_ids)
+    if isinstance(members[0], dict):
+        rows = ((m["source_id"], m.get("status_auto", "unknown"), m.get("auto_confidence", 0.0))
+                for m in members)
+    else:
+        rows = ((m.source_id, m.status_auto, m.auto_confidence) for m in members)
 
+    # Best individual evidence, verified sources and best status in one pass
+    best_confidence = None
     verified_sources = set()
-    for m in members:
-        if m.get("status_auto") in ("supported", "partial"):
-            verified_sources.add(m["source_id"])
+    has_supported = has_partial = False
+    for source_id, status, confidence in rows:
+        if best_confidence is None or confidence > best_confidence:
+            best_confidence = confidence
+        if status == "supported":
+            has_supported = True
+            verified_sources.add(source_id)
+        elif status == "partial":
+            has_partial = True
+            verified_sources.add(source_id)
 
     # Consensus boost: each additional verified source adds diminishing confidence
     consensus = best_confidence
@@ -248,10 +455,9 @@ def compute_consensus(
     consensus = min(1.0, round(consensus, 4))
 
     # Best status across all members
-    statuses = [m.get("status_auto", "unknown") for m in members]
-    if "supported" in statuses:
+    if has_supported:
         best_status = "supported"
-    elif "partial" in statuses:
+    elif has_partial:
         best_status = "partial"
     else:
         best_status = "unknown"
@@ -273,40 +479,37 @@ def build_knowledge_graph(threshold: float = 0.40) -> Dict:
     t0 = time.time()
 
     # 1. Load all claims
+    # Stream rows straight into records instead of fetchall() + list-comp,
+    # so the result set is never materialised twice.
     with db.get_conn() as conn:
-        rows = conn.execute(
+        cur = conn.execute(
             "SELECT id, source_id, text, category, status_auto, auto_confidence "
             "FROM claims"
-        ).fetchall()
-    claims = [
-        ClaimRecord(
-            claim_id=r["id"], source_id=r["source_id"], text=r["text"],
-            category=r["category"],
-            status_auto=r["status_auto"] or "unknown",
-            auto_confidence=r["auto_confidence"] or 0.0,
         )
-        for r in rows
-    ]
+        claims = [
+            ClaimRecord(
+                claim_id=r[0], source_id=r[1], text=r[2], category=r[3],
+                status_auto=r[4] or "unknown",
+                auto_confidence=r[5] or 0.0,
+            )
+            for r in cur
+        ]
 
     # 2. Build clusters
     clusters = build_clusters(claims, threshold=threshold)
 
     # 3. Compute consensus and prepare storage
-    from .models import ClaimCluster
+    from .models import ClaimCluster, _now_iso
     cluster_objects = []
     member_rows = []
+    now_iso = _now_iso()  # one timestamp for the whole rebuild
 
     for cluster_id, members in clusters.items():
         # Pick representative: claim with highest auto_confidence, or longest text
         rep = max(members, key=lambda m: (m.auto_confidence, len(m.text)))
 
         # Compute consensus
-        member_dicts = [
-            {"source_id": m.source_id, "status_auto": m.status_auto,
-             "auto_confidence": m.auto_confidence}
-            for m in members
-        ]
-        best_status, best_conf, consensus = compute_consensus(member_dicts)
+        best_status, best_conf, consensus = compute_consensus(members)
 
         source_count = len({m.source_id for m in members})
 
@@ -319,12 +522,14 @@ def build_knowledge_graph(threshold: float = 0.40) -> Dict:
             best_status=best_status,
             best_confidence=best_conf,
             consensus_score=consensus,
+            created_at=now_iso,
+            updated_at=now_iso,
         )
         cluster_objects.append(cluster_obj)
 
         # Member rows
         for m in members:
-            sim = fingerprint_similarity(rep.fingerprint, m.fingerprint)
+            sim = _jaccard(rep.fingerprint_set, m.fingerprint_set)
             member_rows.append({
                 "cluster_id": cluster_id,
                 "claim_id": m.claim_id,
@@ -333,9 +538,7 @@ def build_knowledge_graph(threshold: float = 0.40) -> Dict:
             })
 
     # 4. Store
-    db.clear_clusters()
-    db.upsert_clusters(cluster_objects)
-    db.insert_cluster_members(member_rows)
+    db.replace_clusters(cluster_objects, member_rows)
 
     elapsed = time.time() - t0
 
@@ -4,12 +4,28 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Optional, List
-import uuid
+import os
+import sys
+
+_UTC = timezone.utc
+
+# Segment and Claim are created in bulk during extraction; __slots__ drops
+# the per-instance __dict__. dataclass(slots=True) needs Python 3.10+.
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+def _now_iso() -> str:
+    """Current UTC time as an ISO-8601 string (default for created_at/updated_at)."""
+    return datetime.now(_UTC).isoformat()
 
 
 def new_id() -> str:
-    """Generate a short UUID (first 12 hex chars)."""
-    return uuid.uuid4().hex[:12]
+    """Generate a short random id: 12 hex chars (48 random bits).
+
+    Same shape and entropy as the old uuid4().hex[:12], without building a
+    UUID object.
+    """
+    return os.urandom(6).hex()
 
 
 @dataclass
@@ -22,7 +38,7 @@ class Source:
     source_type: str = "audio"  # audio|text|pdf|filing|url
     duration_seconds: float = 0.0
     local_audio_path: str = ""
-    created_at: str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
+    created_at: str = field(default_factory=_now_iso)
 
 
 @dataclass
@@ -33,10 +49,10 @@ class TranscriptMeta:
     language: str = ""
     segment_count: int = 0
     transcript_path: str = ""
-    created_at: str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
+    created_at: str = field(default_factory=_now_iso)
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class Segment:
     """Single transcript segment — NOT stored in DB; kept in JSON file."""
     start: float = 0.0
@@ -44,7 +60,7 @@ class Segment:
     text: str = ""
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class Claim:
     id: str = field(default_factory=new_id)
     source_id: str = ""
@@ -62,8 +78,8 @@ class Claim:
     status_auto: str = "unknown"  # auto verification: supported|partial|unknown
     auto_confidence: float = 0.0  # 0.0-1.0
     status_human: Optional[str] = None  # human override (nullable)
-    created_at: str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
-    updated_at: str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
+    created_at: str = field(default_factory=_now_iso)
+    updated_at: str = field(default_factory=_now_iso)
 
     @property
     def final_status(self) -> str:
@@ -84,7 +100,7 @@ class Evidence:
     evidence_type: str = "other"  # primary|secondary|dataset|filing|gov|paper|other
     strength: str = "medium"  # strong|medium|weak
     notes: str = ""
-    created_at: str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
+    created_at: str = field(default_factory=_now_iso)
 
 
 @dataclass
@@ -98,8 +114,8 @@ class ClaimCluster:
     best_status: str = "unknown"
     best_confidence: float = 0.0
     consensus_score: float = 0.0
-    created_at: str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
-    updated_at: str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
+    created_at: str = field(default_factory=_now_iso)
+    updated_at: str = field(default_factory=_now_iso)
 
 
 @dataclass
@@ -114,4 +130,4 @@ class EvidenceSuggestion:
     score: int = 0  # 0-100
     signals: str = ""  # pipe-delimited explainability signals
     snippet: str = ""  # optional short excerpt
-    created_at: str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
+    created_at: str = field(default_factory=_now_iso)
@@ -1,5 +1,6 @@
 """Path helpers — create directories lazily and return safe paths."""
 
+from functools import lru_cache
 from pathlib import Path
 from .config import RAW_DIR, TRANSCRIPTS_DIR, EXPORTS_DIR
 
@@ -10,6 +11,11 @@ def ensure_data_dirs() -> None:
         d.mkdir(parents=True, exist_ok=True)
 
 
+# The per-source helpers below are memoised: once a directory has been
+# created for a source it is not stat'ed/mkdir'ed again for the life of the
+# process. Call <helper>.cache_clear() if directories are removed at runtime.
+
+@lru_cache(maxsize=4096)
 def source_raw_dir(source_id: str) -> Path:
     """Return (and create) the raw-audio directory for a source."""
     p = RAW_DIR / source_id
@@ -17,6 +23,7 @@ def source_raw_dir(source_id: str) -> Path:
     return p
 
 
+@lru_cache(maxsize=4096)
 def source_transcript_dir(source_id: str) -> Path:
     """Return (and create) the transcript directory for a source."""
     p = TRANSCRIPTS_DIR / source_id
@@ -24,6 +31,7 @@ def source_transcript_dir(source_id: str) -> Path:
     return p
 
 
+@lru_cache(maxsize=4096)
 def source_export_dir(source_id: str) -> Path:
     """Return (and create) the export directory for a source."""
     p = EXPORTS_DIR / source_id
@@ -12,15 +12,19 @@ All scoring is deterministic and explainable:
 from __future__ import annotations
 import re
 import string
-from typing import Dict, Any, List, Tuple
+from dataclasses import dataclass
+from typing import Dict, Any, Collection, List, Optional, Tuple, Union
 
 
 # ---------------------------------------------------------------------------
 # Normalisation (shared with claim_extract but independent)
 # ---------------------------------------------------------------------------
 
+_PUNCT_TABLE = str.maketrans("", "", string.punctuation)
+
+
 def _normalise(text: str) -> str:
-    t = text.lower().translate(str.maketrans("", "", string.punctuation))
+    t = text.lower().translate(_PUNCT_TABLE)
     return " ".join(t.split())
 
 
@@ -32,14 +36,24 @@ def _tokenize(text: str) -> set[str]:
 # Number extraction helpers
 # ---------------------------------------------------------------------------
 
-_NUM_RE = re.compile(r'\d+')
-
 # Extract financial numbers with decimals (e.g., "113.8", "31.6", "2.82")
 _FINANCIAL_NUM_RE = re.compile(r'\d+(?:\.\d+)?')
 
+
+def _digit_runs(financial_nums: List[str]) -> set[str]:
+    """Plain digit runs recovered from _FINANCIAL_NUM_RE matches.
+
+    "113.8" contributes "113" and "8", so one scan serves both the loose
+    number match and the exact financial match.
+    """
+    return {part for n in financial_nums for part in n.split(".")}
+
 # Unit-qualified numbers: "$5.5 billion", "14 trillion", "350 million"
 _UNIT_RE = re.compile(r'(\d+(?:\.\d+)?)\s*(billion|trillion|million)', re.IGNORECASE)
 
+# Capitalised word runs ("Federal Reserve", "Apple") — proxy for named entities
+_ENTITY_RE = re.compile(r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b')
+
 
 def _extract_claim_numbers(text: str) -> set[str]:
     """Extract significant numbers from claim text, with unit conversion.
@@ -95,7 +109,7 @@ def _is_substantive_snippet(snippet: str) -> bool:
     # Structured data: 3+ pipe-separated fields with numeric content
     if "|" in snippet:
         fields = snippet.split("|")
-        numeric_fields = sum(1 for f in fields if _NUM_RE.search(f))
+        numeric_fields = sum(1 for f in fields if _FINANCIAL_NUM_RE.search(f))
         if numeric_fields >= 3:
             return True
     return False
@@ -108,27 +122,115 @@ _GENERIC_TITLES = frozenset([
 ])
 
 # Category-relevant terms — used by both score_evidence() and knowledge_graph.py
-_CAT_TERMS = {
-    "finance": {"rate", "inflation", "gdp", "economy", "market", "fiscal",
-                 "monetary", "bank", "revenue", "revenues", "income",
-                 "earnings", "margin", "operating", "cash", "flow",
-                 "cap", "price", "eps", "dividend", "ratio", "stock",
-                 "shares", "valuation", "profit", "quarterly"},
-    "tech": {"ai", "model", "gpu", "software", "algorithm", "computing", "neural"},
-    "health": {"health", "drug", "vaccine", "clinical", "patient", "disease", "treatment"},
-    "science": {"research", "study", "climate", "energy", "species", "experiment"},
-    "politics": {"vote", "election", "congress", "senate", "legislation", "policy"},
-    "military": {"military", "defense", "weapon", "security", "intelligence"},
-    "education": {"education", "school", "student", "teacher", "tuition",
-                   "enrollment", "graduation", "degree", "literacy", "curriculum"},
-    "energy_climate": {"climate", "carbon", "emissions", "renewable", "solar",
-                        "fossil", "temperature", "energy", "ev", "battery",
-                        "greenhouse", "pollution", "sustainable"},
-    "labor": {"labor", "workers", "employment", "unemployment", "wages",
-               "union", "workforce", "hiring", "layoff", "payroll",
-               "jobs", "salary", "minimum", "pension"},
+_CAT_TERMS: Dict[str, frozenset] = {
+    "finance": frozenset({"rate", "inflation", "gdp", "economy", "market", "fiscal",
+                           "monetary", "bank", "revenue", "revenues", "income",
+                           "earnings", "margin", "operating", "cash", "flow",
+                           "cap", "price", "eps", "dividend", "ratio", "stock",
+                           "shares", "valuation", "profit", "quarterly"}),
+    "tech": frozenset({"ai", "model", "gpu", "software", "algorithm", "computing", "neural"}),
+    "health": frozenset({"health", "drug", "vaccine", "clinical", "patient", "disease", "treatment"}),
+    "science": frozenset({"research", "study", "climate", "energy", "species", "experiment"}),
+    "politics": frozenset({"vote", "election", "congress", "senate", "legislation", "policy"}),
+    "military": frozenset({"military", "defense", "weapon", "security", "intelligence"}),
+    "education": frozenset({"education", "school", "student", "teacher", "tuition",
+                             "enrollment", "graduation", "degree", "literacy", "curriculum"}),
+    "energy_climate": frozenset({"climate", "carbon", "emissions", "renewable", "solar",
+                                  "fossil", "temperature", "energy", "ev", "battery",
+                                  "greenhouse", "pollution", "sustainable"}),
+    "labor": frozenset({"labor", "workers", "employment", "unemployment", "wages",
+                         "union", "workforce", "hiring", "layoff", "payroll",
+                         "jobs", "salary", "minimum", "pension"}),
 }
 
+# One alternation per category, scanned over the lowered evidence text in a
+# single pass instead of intersecting against its token set.
+_CAT_REGEXES: Dict[str, "re.Pattern[str]"] = {
+    cat: re.compile(
+        r'\b(?:' + '|'.join(map(re.escape, sorted(terms, key=len, reverse=True))) + r')\b'
+    )
+    for cat, terms in _CAT_TERMS.items()
+}
+
+# Aho-Corasick automaton over every category term (pyahocorasick, optional).
+# None = not built yet; False = pyahocorasick is not installed.
+_CAT_AUTOMATON: Any = None
+
+
+def _get_cat_automaton() -> Any:
+    """Return the category-term automaton, building it on first use."""
+    global _CAT_AUTOMATON
+    if _CAT_AUTOMATON is None:
+        try:
+            import ahocorasick
+        except ImportError:
+            _CAT_AUTOMATON = False
+        else:
+            owners: Dict[str, List[str]] = {}
+            for cat, terms in _CAT_TERMS.items():
+                for term in terms:
+                    owners.setdefault(term, []).append(cat)
+            automaton = ahocorasick.Automaton()
+            for term, cats in owners.items():
+                automaton.add_word(term, (len(term), term, frozenset(cats)))
+            automaton.make_automaton()
+            _CAT_AUTOMATON = automaton
+    return _CAT_AUTOMATON or None
+
+
+def _is_word_char(c: str) -> bool:
+    return c.isalnum() or c == "_"
+
+
+def _category_hits(lowered_text: str, category: str) -> set[str]:
+    """Whole-word *category* terms found in *lowered_text*.
+
+    With pyahocorasick installed this is one automaton pass with a \\b-style
+    boundary check on each hit; otherwise the category's alternation regex.
+    """
+    automaton = _get_cat_automaton()
+    if automaton is None:
+        cat_re = _CAT_REGEXES.get(category)
+        return set(cat_re.findall(lowered_text)) if cat_re is not None else set()
+
+    hits = set()
+    last = len(lowered_text) - 1
+    for end, (length, term, cats) in automaton.iter(lowered_text):
+        if category not in cats:
+            continue
+        start = end - length + 1
+        if start > 0 and _is_word_char(lowered_text[start - 1]):
+            continue
+        if end < last and _is_word_char(lowered_text[end + 1]):
+            continue
+        hits.add(term)
+    return hits
+
+
+@dataclass(frozen=True)
+class ClaimArtifacts:
+    """Claim-side inputs to scoring, computed once per claim by _prep_claim."""
+    category: str
+    tokens: frozenset
+    entities: Tuple[Tuple[str, str], ...]  # (entity, entity.lower())
+    nums: frozenset
+    fin_nums: frozenset
+    bigrams: frozenset
+    cat_key: Optional[str]  # lowered category, None if it has no term set
+
+
+def _prep_claim(claim_text: str, claim_category: str) -> ClaimArtifacts:
+    words = _normalise(claim_text).split()
+    return ClaimArtifacts(
+        category=claim_category,
+        tokens=frozenset(words),
+        entities=tuple((e, e.lower()) for e in set(_ENTITY_RE.findall(claim_text))),
+        nums=frozenset(_digit_runs(_FINANCIAL_NUM_RE.findall(claim_text))),
+        fin_nums=frozenset(_extract_claim_numbers(claim_text)),
+        bigrams=frozenset(_word_bigrams(words)),
+        cat_key=claim_category.lower() if claim_category.lower() in _CAT_TERMS else None,
+    )
+
 
 def score_evidence(
     claim_text: str,
@@ -144,17 +246,72 @@ def score_evidence(
 
     Returns (score 0-100, pipe-delimited signals).
     """
+    score, signals = _score_one(
+        _prep_claim(claim_text, claim_category),
+        evidence_title, evidence_snippet, evidence_type, claim_date, evidence_date,
+    )
+    return score, "|".join(signals)
+
+
+def score_evidence_batch(
+    claim_text: str,
+    claim_category: str,
+    candidates: List[Dict[str, Any]],
+    claim_date: str = "",
+    raw_signals: bool = False,
+) -> List[Tuple[int, Any]]:
+    """Score many evidence results against one claim.
+
+    Same scores as calling score_evidence() per candidate, but the claim is
+    tokenised and analysed once. Candidates are search-result dicts (title,
+    snippet, evidence_type, evidence_date keys; missing ones default).
+
+    With raw_signals=True each result carries its signals as a list instead
+    of a pipe-joined string, so callers that keep only the top few can skip
+    joining the rest (compute_auto_status accepts the list directly).
+    """
+    art = _prep_claim(claim_text, claim_category)
+    scored = [
+        _score_one(
+            art,
+            r.get("title", ""),
+            r.get("snippet", ""),
+            r.get("evidence_type", "other"),
+            claim_date,
+            r.get("evidence_date", ""),
+        )
+        for r in candidates
+    ]
+    if raw_signals:
+        return scored
+    return [(score, "|".join(signals)) for score, signals in scored]
+
+
+def _score_one(
+    art: ClaimArtifacts,
+    evidence_title: str,
+    evidence_snippet: str,
+    evidence_type: str,
+    claim_date: str,
+    evidence_date: str,
+) -> Tuple[int, List[str]]:
     signals: List[str] = []
     score = 0
 
-    claim_tokens = _tokenize(claim_text)
-    title_tokens = _tokenize(evidence_title)
-    snippet_tokens = _tokenize(evidence_snippet) if evidence_snippet else set()
-    evidence_tokens = title_tokens | snippet_tokens
+    # Normalise the evidence once; every step below reuses these. Title-only
+    # results are common, so stages that need a snippet or a claim-side
+    # artifact are skipped outright when it is missing.
+    has_snippet = bool(evidence_snippet)
+    title_lower = evidence_title.lower()
+    lowered_combined = title_lower + " " + evidence_snippet.lower() if has_snippet else title_lower
+    evidence_words = lowered_combined.translate(_PUNCT_TABLE).split()
+    claim_tokens = art.tokens
 
     # 1. Token overlap (0-30 points)
-    if claim_tokens and evidence_tokens:
-        overlap = claim_tokens & evidence_tokens
+    if claim_tokens and evidence_words:
+        # Probe the (small) claim set with the evidence word list directly
+        # rather than materialising a set of the evidence words first.
+        overlap = claim_tokens.intersection(evidence_words)
         overlap_ratio = len(overlap) / max(len(claim_tokens), 1)
         token_score = min(30, int(overlap_ratio * 72))  # 42% overlap = 30 pts
         if token_score > 0:
@@ -162,18 +319,21 @@ def score_evidence(
             signals.append(f"token_overlap:{len(overlap)}")
 
     # 2. Named entity / proper noun match (0-15 points)
-    claim_entities = set(re.findall(r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b', claim_text))
-    if claim_entities:
-        title_upper = evidence_title + " " + evidence_snippet
-        matched_entities = [e for e in claim_entities if e.lower() in title_upper.lower()]
+    if art.entities:
+        matched_entities = [e for e, e_lower in art.entities if e_lower in lowered_combined]
         if matched_entities:
             entity_score = min(15, len(matched_entities) * 5)
             score += entity_score
             signals.append(f"entity_match:{','.join(matched_entities[:3])}")
 
     # 3. Number match (0-10 points for basic, 0-20 for exact financial match)
-    claim_nums = set(_NUM_RE.findall(claim_text))
-    evidence_nums = set(_NUM_RE.findall(evidence_title + " " + evidence_snippet))
+    snippet_num_matches = _FINANCIAL_NUM_RE.findall(evidence_snippet) if has_snippet else []
+    claim_nums = art.nums
+    if claim_nums:
+        evidence_nums = _digit_runs(_FINANCIAL_NUM_RE.findall(evidence_title))
+        evidence_nums |= _digit_runs(snippet_num_matches)
+    else:
+        evidence_nums = set()
     if claim_nums and evidence_nums:
         matched_nums = claim_nums & evidence_nums
         if matched_nums:
@@ -181,14 +341,14 @@ def score_evidence(
             # First 2 matches: 5 pts each; additional: 3 pts each (diminishing)
             num_score = min(2, n) * 5 + max(0, n - 2) * 3
             score += min(15, num_score)
-            signals.append(f"number_match:{','.join(list(matched_nums)[:3])}")
+            signals.append(f"number_match:{','.join(sorted(matched_nums)[:3])}")
 
     # 3b. Exact financial number match — big boost for substantive evidence
     #     Matches decimal numbers like "113.8", "31.6", "2.82"
     #     Gate: snippet must contain real data (not just filing metadata stubs)
-    if evidence_snippet and _is_substantive_snippet(evidence_snippet):
-        claim_financial_nums = _extract_claim_numbers(claim_text)
-        snippet_financial_nums = set(_FINANCIAL_NUM_RE.findall(evidence_snippet))
+    if art.fin_nums and has_snippet and _is_substantive_snippet(evidence_snippet):
+        claim_financial_nums = art.fin_nums
+        snippet_financial_nums = set(snippet_num_matches)
         exact_matches = claim_financial_nums & snippet_financial_nums
         if exact_matches:
             exact_boost = min(20, len(exact_matches) * 8)
@@ -196,12 +356,11 @@ def score_evidence(
             signals.append(f"number_exact_match:{','.join(sorted(exact_matches)[:4])}")
 
     # 4. Category relevance boost (0-10 points)
-    cat_terms = _CAT_TERMS.get(claim_category, set())
-    if cat_terms and evidence_tokens:
-        cat_overlap = cat_terms & evidence_tokens
+    if art.cat_key is not None and evidence_words:
+        cat_overlap = _category_hits(lowered_combined, art.cat_key)
         if cat_overlap:
             score += min(10, len(cat_overlap) * 3)
-            signals.append(f"category_match:{claim_category}")
+            signals.append(f"category_match:{art.category}")
 
     # 5. Evidence type boost (0-15 points)
     if evidence_type in ("paper", "filing", "gov", "dataset"):
@@ -215,15 +374,16 @@ def score_evidence(
         signals.append("secondary_source")
 
     # 6. Keyphrase match — multi-word sequences (0-10 points)
-    claim_bigrams = _bigrams(claim_text)
-    evidence_bigrams = _bigrams(evidence_title + " " + evidence_snippet)
-    keyphrase_matches = claim_bigrams & evidence_bigrams
+    if art.bigrams and len(evidence_words) > 1:
+        keyphrase_matches = art.bigrams & _word_bigrams(evidence_words)
+    else:
+        keyphrase_matches = set()
     if keyphrase_matches:
         score += min(10, len(keyphrase_matches) * 5)
         signals.append(f"keyphrase_hit:{len(keyphrase_matches)}")
 
     # 7. Generic title penalty (-10 points)
-    title_lower_words = set(evidence_title.lower().split())
+    title_lower_words = set(title_lower.split())
     if title_lower_words & _GENERIC_TITLES and len(title_lower_words) < 5:
         score = max(0, score - 10)
         signals.append("generic_title_penalty")
@@ -269,12 +429,12 @@ def score_evidence(
     # Clamp
     score = min(100, max(0, score))
 
-    return score, "|".join(signals)
+    return score, signals
 
 
-def _bigrams(text: str) -> set[str]:
-    words = _normalise(text).split()
-    return {f"{words[i]} {words[i+1]}" for i in range(len(words) - 1)}
+def _word_bigrams(words: List[str]) -> set[Tuple[str, str]]:
+    """Bigrams of an already-normalised word list, as (word, next_word) tuples."""
+    return set(zip(words, words[1:]))
 
 
 # ---------------------------------------------------------------------------
@@ -296,6 +456,13 @@ _GUIDANCE_TERMS = frozenset([
 ])
 
 
+# The term sets above are matched as plain substrings, so the alternations
+# deliberately have no \b anchors ("plans" still hits "plan").
+_KPI_RE = re.compile('|'.join(map(re.escape, sorted(_NUMERIC_KPI_TERMS, key=len, reverse=True))))
+_GUIDANCE_RE = re.compile('|'.join(map(re.escape, sorted(_GUIDANCE_TERMS, key=len, reverse=True))))
+_DIGIT_RE = re.compile(r'\d')
+
+
 def classify_finance_claim(claim_text: str) -> str:
     """Classify a finance claim as numeric_kpi, guidance, or other.
 
@@ -303,22 +470,14 @@ def classify_finance_claim(claim_text: str) -> str:
     Guidance claims stay UNKNOWN by design.
     """
     lower = claim_text.lower()
-    has_number = bool(re.search(r'\d', lower))
-
-    # Check for numeric KPI: must have numbers + financial terms
-    if has_number:
-        for term in _NUMERIC_KPI_TERMS:
-            if term in lower:
-                # Also check for guidance terms — guidance with numbers is still guidance
-                for g in _GUIDANCE_TERMS:
-                    if g in lower:
-                        return "guidance"
-                return "numeric_kpi"
-
-    # Check for guidance language (without numbers)
-    for g in _GUIDANCE_TERMS:
-        if g in lower:
-            return "guidance"
+
+    # Guidance language wins, with or without numbers
+    if _GUIDANCE_RE.search(lower):
+        return "guidance"
+
+    # Numeric KPI: must have numbers + financial terms
+    if _DIGIT_RE.search(lower) and _KPI_RE.search(lower):
+        return "numeric_kpi"
 
     return "other"
 
@@ -330,13 +489,15 @@ def classify_finance_claim(claim_text: str) -> str:
 def compute_auto_status(
     best_score: int,
     best_evidence_type: str,
-    best_signals: str,
+    best_signals: Union[str, Collection[str]],
     claim_confidence: str,
     finance_claim_type: str = "",
 ) -> Tuple[str, float]:
     """Determine auto verification status from best evidence score.
 
-    Returns (status_auto, auto_confidence).
+    Returns (status_auto, auto_confidence). best_signals is either the
+    pipe-delimited string from score_evidence() or the signal list from
+    score_evidence_batch(raw_signals=True); bare prefixes work too.
 
     Guardrails:
       - SUPPORTED only if primary source + score >= 85 + token_overlap + keyphrase_hit
@@ -352,10 +513,13 @@ def compute_auto_status(
     if best_score < 70:
         return "unknown", best_score / 100.0
 
-    signal_set = set(best_signals.split("|"))
-    has_token_overlap = any(s.startswith("token_overlap") for s in signal_set)
-    has_keyphrase = any(s.startswith("keyphrase_hit") for s in signal_set)
-    has_exact_number = any(s.startswith("number_exact_match") for s in signal_set)
+    # Signal names without their ":detail" suffix, parsed in one pass
+    if isinstance(best_signals, str):
+        best_signals = best_signals.split("|")
+    prefixes = {s.split(":", 1)[0] for s in best_signals if s}
+    has_token_overlap = "token_overlap" in prefixes
+    has_keyphrase = "keyphrase_hit" in prefixes
+    has_exact_number = "number_exact_match" in prefixes
     is_primary = best_evidence_type in ("paper", "filing", "gov", "dataset", "factcheck")
 
     # SUPPORTED: strict guardrails
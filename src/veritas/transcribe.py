@@ -4,6 +4,7 @@ from __future__ import annotations
 import json
 import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import List
 
@@ -13,13 +14,23 @@ from .paths import source_transcript_dir
 from . import db
 
 
+_DLLS_LOADED = False
+
+
 def _load_nvidia_dll_paths() -> None:
     """Add pip-installed nvidia-* DLL directories to the DLL search path (Windows).
 
     This allows CTranslate2 to find cublas64_12.dll, cudnn*.dll, etc. that ship
     in the nvidia-cublas-cu12 / nvidia-cudnn-cu12 pip packages without needing
     a system-wide CUDA Toolkit install.
+
+    Runs once per process; later calls return immediately instead of
+    re-walking the package and prepending the same directories to PATH again.
     """
+    global _DLLS_LOADED
+    if _DLLS_LOADED:
+        return
+    _DLLS_LOADED = True
     if sys.platform != "win32":
         return
     try:
@@ -35,6 +46,18 @@ def _load_nvidia_dll_paths() -> None:
             os.environ["PATH"] = str(bin_dir) + os.pathsep + os.environ.get("PATH", "")
 
 
+@lru_cache(maxsize=2)
+def _get_model(model_size: str, device: str, compute_type: str):
+    """Load (or reuse) a WhisperModel; loading weights takes seconds."""
+    from faster_whisper import WhisperModel  # defer import so CLI loads fast
+    return WhisperModel(model_size, device=device, compute_type=compute_type)
+
+
+def release_models() -> None:
+    """Drop cached WhisperModel instances (frees GPU/host memory)."""
+    _get_model.cache_clear()
+
+
 def transcribe(
     source_id: str,
     model_size: str = DEFAULT_WHISPER_MODEL,
@@ -46,7 +69,6 @@ def transcribe(
     Returns the metadata row and a list of Segment objects.
     """
     _load_nvidia_dll_paths()
-    from faster_whisper import WhisperModel  # defer import so CLI loads fast
 
     source = db.get_source(source_id)
     if source is None:
@@ -58,38 +80,56 @@ def transcribe(
 
     # Resolve compute type
     if compute_type is None:
-        compute_type = "float16" if device == "cuda" else "int8"
+        compute_type = DEFAULT_COMPUTE_TYPE if device == "cuda" else "int8"
 
     # Try requested device, fallback to cpu
     try:
-        model = WhisperModel(model_size, device=device, compute_type=compute_type)
+        model = _get_model(model_size, device, compute_type)
     except Exception:
         if device != "cpu":
-            model = WhisperModel(model_size, device="cpu", compute_type="int8")
+            model = _get_model(model_size, "cpu", "int8")
             device = "cpu"
         else:
             raise
 
     segments_iter, info = model.transcribe(str(audio_path), beam_size=5)
 
-    segments: List[Segment] = []
-    for seg in segments_iter:
-        segments.append(Segment(start=round(seg.start, 3), end=round(seg.end, 3), text=seg.text.strip()))
-
-    # Write transcript JSON to disk
+    # Stream segments to disk as the model yields them, so the transcript is
+    # never held in memory a second time as a payload dict. Written to a
+    # .partial file first so a failed run leaves no truncated transcript.
     out_dir = source_transcript_dir(source_id)
     transcript_path = out_dir / "transcript.json"
-    payload = {
+    partial_path = out_dir / "transcript.json.partial"
+    header = {
         "source_id": source_id,
         "engine": "faster-whisper",
         "model": model_size,
         "device": device,
         "language": info.language,
         "language_probability": round(info.language_probability, 4),
-        "segments": [{"start": s.start, "end": s.end, "text": s.text} for s in segments],
     }
-    with open(transcript_path, "w", encoding="utf-8") as fh:
-        json.dump(payload, fh, indent=2, ensure_ascii=False)
+    segments: List[Segment] = []
+    try:
+        with open(partial_path, "w", encoding="utf-8") as fh:
+            fh.write("{\n")
+            for key, value in header.items():
+                fh.write(f"  {json.dumps(key)}: {json.dumps(value, ensure_ascii=False)},\n")
+            fh.write('  "segments": [')
+            sep = "\n    "
+            for seg in segments_iter:
+                segment = Segment(start=round(seg.start, 3), end=round(seg.end, 3), text=seg.text.strip())
+                fh.write(sep)
+                fh.write(json.dumps(
+                    {"start": segment.start, "end": segment.end, "text": segment.text},
+                    ensure_ascii=False,
+                ))
+                sep = ",\n    "
+                segments.append(segment)
+            fh.write("\n  ]\n}\n" if segments else "]\n}\n")
+    except BaseException:
+        partial_path.unlink(missing_ok=True)
+        raise
+    os.replace(partial_path, transcript_path)
 
     meta = TranscriptMeta(
         source_id=source_id,
@@ -7,9 +7,9 @@ from .models import Evidence, new_id
 from . import db
 
 
-VALID_STATUSES = ("supported", "contradicted", "partial", "unknown")
-VALID_EVIDENCE_TYPES = ("primary", "secondary", "dataset", "filing", "gov", "paper", "other")
-VALID_STRENGTHS = ("strong", "medium", "weak")
+VALID_STATUSES = frozenset({"supported", "contradicted", "partial", "unknown"})
+VALID_EVIDENCE_TYPES = frozenset({"primary", "secondary", "dataset", "filing", "gov", "paper", "other"})
+VALID_STRENGTHS = frozenset({"strong", "medium", "weak"})
 
 
 def verify_claim(
@@ -22,7 +22,7 @@ def verify_claim(
 ) -> None:
     """Set a claim's status and optionally attach evidence links."""
     if status not in VALID_STATUSES:
-        raise ValueError(f"Invalid status '{status}'. Must be one of {VALID_STATUSES}")
+        raise ValueError(f"Invalid status '{status}'. Must be one of {sorted(VALID_STATUSES)}")
 
     claim = db.get_claim(claim_id)
     if claim is None:
@@ -30,13 +30,17 @@ def verify_claim(
 
     db.update_claim_status(claim_id, status)
 
-    for url in (evidence_urls or []):
-        ev = Evidence(
-            id=new_id(),
-            claim_id=claim_id,
-            url=url,
-            evidence_type=evidence_type if evidence_type in VALID_EVIDENCE_TYPES else "other",
-            strength=strength if strength in VALID_STRENGTHS else "medium",
-            notes=notes,
-        )
-        db.insert_evidence(ev)
+    if evidence_urls:
+        ev_type = evidence_type if evidence_type in VALID_EVIDENCE_TYPES else "other"
+        ev_strength = strength if strength in VALID_STRENGTHS else "medium"
+        db.insert_evidence_many([
+            Evidence(
+                id=new_id(),
+                claim_id=claim_id,
+                url=url,
+                evidence_type=ev_type,
+                strength=ev_strength,
+                notes=notes,
+            )
+            for url in evidence_urls
+        ])
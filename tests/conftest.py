@@ -0,0 +1,11 @@
+"""Shared pytest setup: make the src/ package importable from every test module."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+# Bind the package now. After collection pytest puts the project root, home of
+# the veritas.py runner script, back in front of src/ on sys.path, so a first
+# `import veritas` inside a test body would otherwise pick up that script.
+import veritas  # noqa: E402,F401
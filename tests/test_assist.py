@@ -1,11 +1,7 @@
 """Tests for assisted verification: scoring, guardrails, evidence sources, DB migration."""
 
-import sys
-from pathlib import Path
 from unittest.mock import patch, MagicMock
 
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
-
 from veritas.scoring import score_evidence, compute_auto_status, _normalise, _tokenize
 from veritas.evidence_sources.base import build_search_query
 from veritas.models import Source, Claim, EvidenceSuggestion, new_id
@@ -69,6 +65,42 @@ def test_score_category_boost():
     assert "category_match" in sigs
 
 
+def test_score_category_match_whole_words_only():
+    """Category terms match as whole words, not inside longer words."""
+    _, sigs = score_evidence(
+        claim_text="Inflation rose again.",
+        claim_category="finance",
+        evidence_title="Pirate stories",
+        evidence_snippet="Bankruptcy tales (unrated).",
+        evidence_type="other",
+        source_name="crossref",
+    )
+    assert "category_match" not in sigs
+
+    _, sigs = score_evidence(
+        claim_text="Inflation rose again.",
+        claim_category="Finance",
+        evidence_title="GDP, inflation-adjusted",
+        evidence_snippet="",
+        evidence_type="other",
+        source_name="crossref",
+    )
+    assert "category_match:Finance" in sigs
+
+
+def test_category_hits_automaton_matches_regex(monkeypatch):
+    """The Aho-Corasick scan finds the same whole-word terms as the regex."""
+    import pytest
+    pytest.importorskip("ahocorasick")
+    import veritas.scoring as scoring
+
+    text = "gdp_rate, inflation-adjusted bank rates; ratio (cash) flows flow"
+    with_automaton = scoring._category_hits(text, "finance")
+    monkeypatch.setattr(scoring, "_CAT_AUTOMATON", False)
+    assert scoring._category_hits(text, "finance") == with_automaton
+    assert with_automaton == {"inflation", "bank", "ratio", "cash", "flow"}
+
+
 def test_score_generic_title_penalty():
     """Generic titles should be penalised."""
     score, sigs = score_evidence(
@@ -95,6 +127,31 @@ def test_score_keyphrase_hit():
     assert "keyphrase_hit" in sigs
 
 
+def test_score_evidence_batch_matches_single():
+    """Batch scoring gives the same result as scoring each candidate."""
+    from veritas.scoring import score_evidence_batch
+    claim = "Apple reported $94.8 billion revenue in Q1 2024, up 2 percent."
+    candidates = [
+        {"title": "Apple Q1 2024 results", "snippet": "Revenue 94.8 | EPS 2.18 | Growth 2 | Period 2024",
+         "evidence_type": "filing", "evidence_date": "2024"},
+        {"title": "Introduction", "snippet": "", "evidence_type": "other"},
+        {"title": "Apple revenue grows", "snippet": "Apple reported revenue of $94.8 billion.",
+         "evidence_type": "secondary", "evidence_date": "2019"},
+    ]
+    batch = score_evidence_batch(claim, "finance", candidates, claim_date="2024")
+    single = [
+        score_evidence(
+            claim_text=claim, claim_category="finance",
+            evidence_title=c.get("title", ""), evidence_snippet=c.get("snippet", ""),
+            evidence_type=c.get("evidence_type", "other"), source_name="",
+            claim_date="2024", evidence_date=c.get("evidence_date", ""),
+        )
+        for c in candidates
+    ]
+    assert batch == single
+    assert batch[0][0] > batch[1][0]
+
+
 # ── Guardrails tests ────────────────────────────────────────────
 
 
@@ -311,3 +368,24 @@ def test_db_evidence_suggestions_crud(tmp_path, monkeypatch):
     results = _db.get_suggestions_for_claim("sug_claim")
     assert len(results) == 2
     assert results[0].score >= results[1].score
+
+
+def test_guardrail_accepts_signal_list():
+    """Raw signal lists from score_evidence_batch give the same status as the joined string."""
+    from veritas.scoring import score_evidence_batch
+
+    joined = "token_overlap:5|keyphrase_hit:2|primary_source:paper"
+    for signals in (joined, joined.split("|"), frozenset({"token_overlap", "keyphrase_hit"})):
+        status, _ = compute_auto_status(
+            best_score=90,
+            best_evidence_type="paper",
+            best_signals=signals,
+            claim_confidence="definitive",
+        )
+        assert status == "supported"
+
+    candidates = [{"title": "Federal Reserve raises interest rates", "snippet": "by 25 basis points"}]
+    raw = score_evidence_batch("The Federal Reserve raised interest rates", "finance", candidates,
+                               raw_signals=True)
+    joined_batch = score_evidence_batch("The Federal Reserve raised interest rates", "finance", candidates)
+    assert [(s, "|".join(sigs)) for s, sigs in raw] == joined_batch
@@ -1,11 +1,6 @@
 """Tests for improved claim categorizer — verifying that expanded keyword sets
 correctly classify claims that previously fell through to 'general'."""
 
-import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
-
 from veritas.claim_extract import _classify_category
 
 
@@ -4,8 +4,7 @@ import json
 import sys
 from pathlib import Path
 
-# Ensure src is on path
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+import pytest
 
 from veritas.models import Segment, Claim, new_id
 from veritas.claim_extract import (
@@ -29,7 +28,9 @@ from veritas.claim_extract import (
 FIXTURE = Path(__file__).parent / "fixtures" / "sample_transcript.json"
 
 
-def _load_segments():
+@pytest.fixture(scope="module")
+def segments():
+    """The sample transcript, parsed once for all tests in this module."""
     with open(FIXTURE, "r", encoding="utf-8") as fh:
         data = json.load(fh)
     return [Segment(**s) for s in data["segments"]]
@@ -141,6 +142,62 @@ def test_dedup_keeps_distinct():
     assert len(result) == 2
 
 
+def test_dedup_exact_repeats_skip_ratio(monkeypatch):
+    """Repeated normalised text is dropped without any SequenceMatcher work."""
+    import veritas.claim_extract as ce
+
+    claims = [Claim(id=str(i), source_id="s", text="Rates rose 2 percent.") for i in range(50)]
+    calls = []
+    real = ce._is_similar
+    monkeypatch.setattr(ce, "_is_similar", lambda *a: calls.append(a) or real(*a))
+    assert [c.id for c in _deduplicate(claims, threshold=0.85)] == ["0"]
+    assert calls == []
+    assert len(_deduplicate(claims, threshold=1.01)) == 50
+
+
+def test_dedup_lsh_path_matches_exact(monkeypatch):
+    """Large inputs go through MinHash-LSH candidates but keep the same claims."""
+    pytest.importorskip("datasketch")
+    import veritas.claim_extract as ce
+
+    texts = [
+        "Inflation dropped to 2.3 percent in March.",
+        "Inflation dropped to 2.3 percent in march!",
+        "Unemployment is at 3.7 percent nationwide.",
+        "The Fed cut rates by 25 basis points in December.",
+        "Unemployment is at 3.7 percent nation wide.",
+        "The Fed cut interest rates by 25 basis points in December.",
+        "Apple reported revenue of 124 billion dollars last quarter.",
+    ]
+    claims = [Claim(id=str(i), source_id="s", text=t) for i, t in enumerate(texts)]
+    exact = [c.id for c in _deduplicate(claims, threshold=0.85)]
+    monkeypatch.setattr(ce, "_MAX_EXACT_DEDUP", 0)
+    assert [c.id for c in _deduplicate(claims, threshold=0.85)] == exact
+    assert exact == ["0", "2", "3", "6"]
+
+
+def test_dedup_process_pool_matches_serial(monkeypatch):
+    """Candidate pairs checked in worker processes keep the same claims."""
+    pytest.importorskip("datasketch")
+    import veritas.claim_extract as ce
+
+    texts = [
+        "Inflation dropped to 2.3 percent in March.",
+        "Inflation dropped to 2.3 percent in march!",
+        "Inflation dropped to 2.4 percent in March.",
+        "Unemployment is at 3.7 percent nationwide.",
+        "Unemployment is at 3.7 percent nation wide.",
+        "The Fed cut rates by 25 basis points in December.",
+    ]
+    norms = [_normalise(t) for t in texts]
+    monkeypatch.setattr(ce, "_MAX_EXACT_DEDUP", 0)
+    serial = ce._dedup_indices(norms, 0.85)
+    monkeypatch.setattr(ce, "_PARALLEL_MIN_DEDUP_PAIRS", 0)
+    monkeypatch.setattr(ce.os, "cpu_count", lambda: 2)
+    assert ce._parallel_similar_pairs(norms, [[], [0], [0, 1], [], [3], []], 0.85) is not None
+    assert ce._dedup_indices(norms, 0.85) == serial == [0, 3, 5]
+
+
 # -- Stitching ---------------------------------------------------------
 
 def test_stitch_window_merges_adjacent():
@@ -171,8 +228,7 @@ def test_stitch_produces_complete_sentences():
 
 # -- Full extraction from fixture --------------------------------------
 
-def test_extract_from_fixture():
-    segments = _load_segments()
+def test_extract_from_fixture(segments):
     claims = extract_claims_from_segments(segments, source_id="test_src")
     assert len(claims) >= 3, f"Expected >=3 claims, got {len(claims)}"
 
@@ -184,16 +240,14 @@ def test_extract_from_fixture():
     assert "hedged" in confidences or "definitive" in confidences
 
 
-def test_extract_preserves_source_id():
-    segments = _load_segments()
+def test_extract_preserves_source_id(segments):
     claims = extract_claims_from_segments(segments, source_id="MY_SRC")
     for c in claims:
         assert c.source_id == "MY_SRC"
 
 
-def test_no_dangling_claims():
+def test_no_dangling_claims(segments):
     """Claims should not start with conjunctions."""
-    segments = _load_segments()
     claims = extract_claims_from_segments(segments, source_id="dangle_test")
     for c in claims:
         first_word = c.text.strip().split()[0].lower().rstrip(",")
@@ -201,9 +255,8 @@ def test_no_dangling_claims():
             f"Claim starts with conjunction: {c.text[:50]}"
 
 
-def test_claims_have_subjects():
+def test_claims_have_subjects(segments):
     """All extracted claims should have a subject-like token."""
-    segments = _load_segments()
     claims = extract_claims_from_segments(segments, source_id="subj_test")
     for c in claims:
         assert _has_subject(c.text), f"Claim lacks subject: {c.text[:80]}"
@@ -255,6 +308,19 @@ def test_category_general_fallback():
     assert _classify_category("Something happened somewhere today.") == "general"
 
 
+def test_category_scores_without_automaton(monkeypatch):
+    """The substring fallback scores phrases exactly like the automaton."""
+    import veritas.claim_extract as ce
+
+    text = "Hedge funds and the Federal Reserve: free cash flow, climate change, NVIDIA GPUs."
+    with_automaton = ce._score_all_categories(text)
+    monkeypatch.setattr(ce, "_PHRASE_AUTOMATON", False)
+    ce._score_all_categories_lc.cache_clear()
+    assert ce._score_all_categories(text) == with_automaton
+    ce._score_all_categories_lc.cache_clear()
+    assert with_automaton["finance"] >= 6  # hedge fund, federal reserve, free cash flow, cash flow
+
+
 # -- Boilerplate filter ---------------------------------------------------
 
 def test_boilerplate_detected():
@@ -269,9 +335,8 @@ def test_non_boilerplate():
 
 # -- Extracted claims have hashes and categories --------------------------
 
-def test_extracted_claims_have_hash_and_category():
+def test_extracted_claims_have_hash_and_category(segments):
     """All extracted claims should have a non-empty claim_hash and category."""
-    segments = _load_segments()
     claims = extract_claims_from_segments(segments, source_id="hash_test")
     for c in claims:
         assert c.claim_hash, f"Claim missing hash: {c.text[:60]}"
@@ -301,9 +366,30 @@ def test_global_hash_ignores_source():
     assert h_global == _claim_hash_global("Inflation dropped to 2.3 percent.")
 
 
-def test_extracted_claims_have_global_hash():
+def test_hashes_are_stable_sha256():
+    """Stored claims are grouped by these digests, so the algorithm must not drift."""
+    import hashlib
+    norm = "inflation dropped to 23 percent"
+    assert _claim_hash_global("Inflation dropped to 2.3 percent.") == \
+        hashlib.sha256(norm.encode()).hexdigest()
+    assert _claim_hash("src_A", "Inflation dropped to 2.3 percent.") == \
+        hashlib.sha256(f"src_A||{norm}".encode()).hexdigest()
+
+
+def test_normalise_ascii_and_unicode_paths_agree():
+    assert _normalise("  The FED, raised\trates\x1cby 0.25%!  ") == "the fed raised rates by 025"
+    assert _normalise("Ünïcode TEXT, café-owner!") == "ünïcode text caféowner"
+
+
+def test_claim_hasher_matches_claim_hash():
+    from veritas.claim_extract import _claim_hasher
+    hasher = _claim_hasher("src_A").copy()
+    hasher.update(_normalise("Inflation dropped to 2.3 percent.").encode("utf-8"))
+    assert hasher.hexdigest() == _claim_hash("src_A", "Inflation dropped to 2.3 percent.")
+
+
+def test_extracted_claims_have_global_hash(segments):
     """All extracted claims should have a non-empty claim_hash_global."""
-    segments = _load_segments()
     claims = extract_claims_from_segments(segments, source_id="ghash_test")
     for c in claims:
         assert c.claim_hash_global, f"Claim missing global hash: {c.text[:60]}"
@@ -333,12 +419,25 @@ def test_collect_signals_assertion_verb():
     assert "assertion_verb" in signals
 
 
-def test_extracted_claims_have_signals():
+def test_extracted_claims_have_signals(segments):
     """All extracted claims should have at least one signal logged."""
-    segments = _load_segments()
     claims = extract_claims_from_segments(segments, source_id="sig_test")
     for c in claims:
         assert c.signals, f"Claim missing signals: {c.text[:60]}"
         signal_list = c.signals.split("|")
         assert len(signal_list) >= 2, f"Expected >=2 signals, got: {c.signals}"
         assert "has_subject" in signal_list, f"Missing 'has_subject' signal: {c.signals}"
+
+
+def test_import_leaves_optional_deps_unloaded():
+    """datasketch, pyahocorasick and the process pool load only when used."""
+    import subprocess
+
+    src = str(Path(__file__).resolve().parent.parent / "src")
+    code = (
+        "import sys; sys.path.insert(0, sys.argv[1]); import veritas.claim_extract; "
+        "print(' '.join(m for m in ('datasketch', 'ahocorasick', 'concurrent.futures')"
+        " if m in sys.modules))"
+    )
+    out = subprocess.run([sys.executable, "-c", code, src], capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == ""
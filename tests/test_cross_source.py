@@ -1,32 +1,40 @@
 """Tests for cross-source claim intelligence: spread, timeline, top-claims, enhanced sources."""
 
-import sys
 import hashlib
+import sqlite3
 import string
-from pathlib import Path
+from functools import lru_cache
 
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+import pytest
 
+import veritas.config as cfg
+from veritas import db
+from veritas.cli import cli
 
+
+_PUNCT_TABLE = str.maketrans("", "", string.punctuation)
+_CLI_COMMAND_NAMES = {c.name for c in cli.commands.values()}
+
+
+@lru_cache(maxsize=512)
 def _normalise(text: str) -> str:
     """Mirror the normalisation from claim_extract.py."""
-    t = text.lower().translate(str.maketrans("", "", string.punctuation))
+    t = text.lower().translate(_PUNCT_TABLE)
     return " ".join(t.split())
 
 
+@lru_cache(maxsize=512)
 def _global_hash(text: str) -> str:
     return hashlib.sha256(_normalise(text).encode()).hexdigest()
 
 
-def _setup_cross_source_db(tmp_path):
-    """Create a temp DB with 3 sources, some claims sharing global hashes."""
-    import veritas.config as cfg
-    cfg.DB_PATH = tmp_path / "cross_source.sqlite"
-
-    from veritas import db
+def _setup_cross_source_db():
+    """Fill the current DB with 3 sources, some claims sharing global hashes."""
     from veritas.models import Source, Claim
 
     db.init_db()
+    # Queried before anything is inserted, for the empty-DB stats test
+    empty_stats = db.get_source_verification_stats()
 
     # Source A — earliest
     src_a = Source(id="aaa000000001", url="https://example.com/a", title="Source Alpha",
@@ -83,247 +91,203 @@ def _setup_cross_source_db(tmp_path):
         "claims": claims,
         "shared_ghash": shared_ghash,
         "shared_ghash_2": shared_ghash_2,
+        "empty_stats": empty_stats,
     }
 
 
+@pytest.fixture(scope="module")
+def cross_source_db(tmp_path_factory):
+    """The cross-source DB, built once for the read-only tests in this module."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(cfg, "DB_PATH", tmp_path_factory.mktemp("xs") / "cross_source.sqlite")
+        yield _setup_cross_source_db()
+
+
+@pytest.fixture
+def traced_sql(monkeypatch):
+    """Statements executed through db connections during the test.
+
+    sqlite3.Connection.execute cannot be patched, so each connection db
+    opens gets a trace callback instead.
+    """
+    statements = []
+    real_connect = sqlite3.connect
+
+    def traced_connect(*args, **kwargs):
+        conn = real_connect(*args, **kwargs)
+        conn.set_trace_callback(statements.append)
+        return conn
+
+    monkeypatch.setattr(db.sqlite3, "connect", traced_connect)
+    return statements
+
+
 # ──────────────────────────────────────────────────────────────────
 # Tests for db.get_claim_spread
 # ──────────────────────────────────────────────────────────────────
 
-def test_spread_returns_all_occurrences(tmp_path):
-    import veritas.config as cfg
-    original = cfg.DB_PATH
-    try:
-        data = _setup_cross_source_db(tmp_path)
-        from veritas import db
-        results = db.get_claim_spread(data["shared_ghash"])
-        assert len(results) == 2
-        source_ids = {r["source_id"] for r in results}
-        assert source_ids == {"aaa000000001", "bbb000000002"}
-    finally:
-        cfg.DB_PATH = original
+def test_spread_returns_all_occurrences(cross_source_db):
+    results = db.get_claim_spread(cross_source_db["shared_ghash"])
+    assert len(results) == 2
+    source_ids = {r["source_id"] for r in results}
+    assert source_ids == {"aaa000000001", "bbb000000002"}
 
 
-def test_spread_three_sources(tmp_path):
-    import veritas.config as cfg
-    original = cfg.DB_PATH
-    try:
-        data = _setup_cross_source_db(tmp_path)
-        from veritas import db
-        results = db.get_claim_spread(data["shared_ghash_2"])
-        assert len(results) == 3
-        source_ids = {r["source_id"] for r in results}
-        assert source_ids == {"aaa000000001", "bbb000000002", "ccc000000003"}
-    finally:
-        cfg.DB_PATH = original
+def test_spread_three_sources(cross_source_db):
+    results = db.get_claim_spread(cross_source_db["shared_ghash_2"])
+    assert len(results) == 3
+    source_ids = {r["source_id"] for r in results}
+    assert source_ids == {"aaa000000001", "bbb000000002", "ccc000000003"}
 
 
-def test_spread_nonexistent_hash(tmp_path):
-    import veritas.config as cfg
-    original = cfg.DB_PATH
-    try:
-        _setup_cross_source_db(tmp_path)
-        from veritas import db
-        results = db.get_claim_spread("nonexistent_hash_value")
-        assert results == []
-    finally:
-        cfg.DB_PATH = original
+def test_spread_nonexistent_hash(cross_source_db):
+    results = db.get_claim_spread("nonexistent_hash_value")
+    assert results == []
+
+
+def test_spread_ordered_by_source_date(cross_source_db):
+    results = db.get_claim_spread(cross_source_db["shared_ghash_2"])
+    dates = [r["source_created"] for r in results]
+    assert dates == sorted(dates)
+
 
+def test_spread_uses_global_hash_index(cross_source_db, traced_sql):
+    """The spread lookup seeks idx_claims_ghash instead of scanning claims."""
+    ghash = cross_source_db["shared_ghash"]
+    db.get_claim_spread(ghash)
+    spread_sql = [sql for sql in traced_sql
+                  if sql.lstrip().upper().startswith("SELECT") and "claim_hash_global =" in sql]
+    assert len(spread_sql) == 1, traced_sql
 
-def test_spread_ordered_by_source_date(tmp_path):
-    import veritas.config as cfg
-    original = cfg.DB_PATH
+    # Newer sqlite3 traces the statement with its parameters already bound
+    params = (ghash,) if "?" in spread_sql[0] else ()
+    conn = sqlite3.connect(str(cfg.DB_PATH))
     try:
-        data = _setup_cross_source_db(tmp_path)
-        from veritas import db
-        results = db.get_claim_spread(data["shared_ghash_2"])
-        dates = [r["source_created"] for r in results]
-        assert dates == sorted(dates)
+        plan = conn.execute("EXPLAIN QUERY PLAN " + spread_sql[0], params).fetchall()
     finally:
-        cfg.DB_PATH = original
+        conn.close()
+    assert any("idx_claims_ghash" in row[-1] for row in plan), plan
 
 
 # ──────────────────────────────────────────────────────────────────
 # Tests for db.get_claim_timeline
 # ──────────────────────────────────────────────────────────────────
 
-def test_timeline_chronological(tmp_path):
-    import veritas.config as cfg
-    original = cfg.DB_PATH
-    try:
-        data = _setup_cross_source_db(tmp_path)
-        from veritas import db
-        entries = db.get_claim_timeline(data["shared_ghash"])
-        assert len(entries) == 2
-        # First entry should be Source Alpha (earliest)
-        assert entries[0]["source_title"] == "Source Alpha"
-        assert entries[1]["source_title"] == "Source Beta"
-    finally:
-        cfg.DB_PATH = original
+def test_timeline_chronological(cross_source_db):
+    entries = db.get_claim_timeline(cross_source_db["shared_ghash"])
+    assert len(entries) == 2
+    # First entry should be Source Alpha (earliest)
+    assert entries[0]["source_title"] == "Source Alpha"
+    assert entries[1]["source_title"] == "Source Beta"
 
 
-def test_timeline_includes_status(tmp_path):
-    import veritas.config as cfg
-    original = cfg.DB_PATH
-    try:
-        data = _setup_cross_source_db(tmp_path)
-        from veritas import db
-        entries = db.get_claim_timeline(data["shared_ghash"])
-        statuses = [e["status_auto"] for e in entries]
-        assert "supported" in statuses
-        assert "partial" in statuses
-    finally:
-        cfg.DB_PATH = original
+def test_timeline_includes_status(cross_source_db):
+    entries = db.get_claim_timeline(cross_source_db["shared_ghash"])
+    statuses = [e["status_auto"] for e in entries]
+    assert "supported" in statuses
+    assert "partial" in statuses
 
 
 # ──────────────────────────────────────────────────────────────────
 # Tests for db.get_top_claims
 # ──────────────────────────────────────────────────────────────────
 
-def test_top_claims_returns_cross_source_only(tmp_path):
-    import veritas.config as cfg
-    original = cfg.DB_PATH
-    try:
-        _setup_cross_source_db(tmp_path)
-        from veritas import db
-        results = db.get_top_claims(limit=10)
-        # Only claims appearing in 2+ sources should be returned
-        for r in results:
-            assert r["source_count"] >= 2
-    finally:
-        cfg.DB_PATH = original
+def test_top_claims_returns_cross_source_only(cross_source_db):
+    results = db.get_top_claims(limit=10)
+    # Only claims appearing in 2+ sources should be returned
+    for r in results:
+        assert r["source_count"] >= 2
 
 
-def test_top_claims_sorted_by_source_count(tmp_path):
-    import veritas.config as cfg
-    original = cfg.DB_PATH
-    try:
-        _setup_cross_source_db(tmp_path)
-        from veritas import db
-        results = db.get_top_claims(limit=10)
-        assert len(results) == 2  # Two shared claims
-        # shared_text_2 appears in 3 sources, shared_text in 2
-        assert results[0]["source_count"] == 3
-        assert results[1]["source_count"] == 2
-    finally:
-        cfg.DB_PATH = original
+def test_top_claims_sorted_by_source_count(cross_source_db):
+    results = db.get_top_claims(limit=10)
+    assert len(results) == 2  # Two shared claims
+    # shared_text_2 appears in 3 sources, shared_text in 2
+    assert results[0]["source_count"] == 3
+    assert results[1]["source_count"] == 2
 
 
-def test_top_claims_best_status(tmp_path):
-    import veritas.config as cfg
-    original = cfg.DB_PATH
-    try:
-        _setup_cross_source_db(tmp_path)
-        from veritas import db
-        results = db.get_top_claims(limit=10)
-        # Both shared claims have at least one supported occurrence
-        best_statuses = {r["best_status"] for r in results}
-        assert "supported" in best_statuses
-    finally:
-        cfg.DB_PATH = original
+def test_top_claims_best_status(cross_source_db):
+    results = db.get_top_claims(limit=10)
+    # Both shared claims have at least one supported occurrence
+    best_statuses = {r["best_status"] for r in results}
+    assert "supported" in best_statuses
 
 
-def test_top_claims_limit(tmp_path):
-    import veritas.config as cfg
-    original = cfg.DB_PATH
-    try:
-        _setup_cross_source_db(tmp_path)
-        from veritas import db
-        results = db.get_top_claims(limit=1)
-        assert len(results) == 1
-    finally:
-        cfg.DB_PATH = original
+def test_top_claims_limit(cross_source_db):
+    results = db.get_top_claims(limit=1)
+    assert len(results) == 1
+
+
+def test_top_claims_groups_in_sql(cross_source_db, traced_sql):
+    """Grouping and the 2+ sources filter run in SQLite, not over fetched rows."""
+    db.get_top_claims(limit=10)
+    top_sql = [sql.upper() for sql in traced_sql if "FROM CLAIMS" in sql.upper()]
+    assert top_sql, traced_sql
+    assert "GROUP BY C.CLAIM_HASH_GLOBAL" in top_sql[-1]
+    assert "HAVING COUNT(DISTINCT C.SOURCE_ID)" in top_sql[-1]
 
 
 # ──────────────────────────────────────────────────────────────────
 # Tests for db.get_source_verification_stats
 # ──────────────────────────────────────────────────────────────────
 
-def test_source_stats_all_sources(tmp_path):
-    import veritas.config as cfg
-    original = cfg.DB_PATH
-    try:
-        _setup_cross_source_db(tmp_path)
-        from veritas import db
-        stats = db.get_source_verification_stats()
-        assert len(stats) == 3
-    finally:
-        cfg.DB_PATH = original
+def test_source_stats_all_sources(cross_source_db):
+    stats = db.get_source_verification_stats()
+    assert len(stats) == 3
 
 
-def test_source_stats_claim_counts(tmp_path):
-    import veritas.config as cfg
-    original = cfg.DB_PATH
-    try:
-        _setup_cross_source_db(tmp_path)
-        from veritas import db
-        stats = db.get_source_verification_stats()
-        by_id = {s["source_id"]: s for s in stats}
-        assert by_id["aaa000000001"]["total_claims"] == 3
-        assert by_id["bbb000000002"]["total_claims"] == 2
-        assert by_id["ccc000000003"]["total_claims"] == 2
-    finally:
-        cfg.DB_PATH = original
+@pytest.fixture(scope="module")
+def source_stats_by_id(cross_source_db):
+    """get_source_verification_stats() for the shared DB, keyed by source id."""
+    return {s["source_id"]: s for s in db.get_source_verification_stats()}
 
 
-def test_source_stats_verified_rate(tmp_path):
-    import veritas.config as cfg
-    original = cfg.DB_PATH
-    try:
-        _setup_cross_source_db(tmp_path)
-        from veritas import db
-        stats = db.get_source_verification_stats()
-        by_id = {s["source_id"]: s for s in stats}
-
-        # Source A: claim_a1=supported, claim_a2=unknown, claim_a3=partial → 2/3 verified
-        a_rate = by_id["aaa000000001"]["verified_rate"]
-        assert abs(a_rate - 66.7) < 1.0  # ~66.7%
-
-        # Source B: claim_b1=partial, claim_b2=supported → 2/2 verified
-        b_rate = by_id["bbb000000002"]["verified_rate"]
-        assert b_rate == 100.0
-
-        # Source C: claim_c1=unknown, claim_c2=unknown → 0/2 verified
-        c_rate = by_id["ccc000000003"]["verified_rate"]
-        assert c_rate == 0.0
-    finally:
-        cfg.DB_PATH = original
+def test_source_stats_claim_counts(source_stats_by_id):
+    by_id = source_stats_by_id
+    assert by_id["aaa000000001"]["total_claims"] == 3
+    assert by_id["bbb000000002"]["total_claims"] == 2
+    assert by_id["ccc000000003"]["total_claims"] == 2
 
 
-def test_source_stats_empty_db(tmp_path):
-    import veritas.config as cfg
-    original = cfg.DB_PATH
-    cfg.DB_PATH = tmp_path / "empty.sqlite"
-    try:
-        from veritas import db
-        db.init_db()
-        stats = db.get_source_verification_stats()
-        assert stats == []
-    finally:
-        cfg.DB_PATH = original
+def test_source_stats_verified_rate(source_stats_by_id):
+    by_id = source_stats_by_id
 
+    # Source A: claim_a1=supported, claim_a2=unknown, claim_a3=partial → 2/3 verified
+    a_rate = by_id["aaa000000001"]["verified_rate"]
+    assert abs(a_rate - 66.7) < 1.0  # ~66.7%
 
-# ──────────────────────────────────────────────────────────────────
-# CLI integration smoke tests
-# ──────────────────────────────────────────────────────────────────
+    # Source B: claim_b1=partial, claim_b2=supported → 2/2 verified
+    b_rate = by_id["bbb000000002"]["verified_rate"]
+    assert b_rate == 100.0
 
-def test_cli_spread_command_exists():
-    from veritas.cli import cli
-    assert "spread" in [c.name for c in cli.commands.values()]
+    # Source C: claim_c1=unknown, claim_c2=unknown → 0/2 verified
+    c_rate = by_id["ccc000000003"]["verified_rate"]
+    assert c_rate == 0.0
 
 
-def test_cli_timeline_command_exists():
-    from veritas.cli import cli
-    assert "timeline" in [c.name for c in cli.commands.values()]
+def test_source_stats_single_query(cross_source_db, traced_sql):
+    """All per-source counts come from one aggregate query."""
+    db.get_source_verification_stats()
+    selects = [sql for sql in traced_sql
+               if sql.lstrip().upper().startswith("SELECT") and "sqlite_master" not in sql]
+    assert len(selects) == 1, selects
+    assert "GROUP BY S.ID" in selects[0].upper()
 
 
-def test_cli_top_claims_command_exists():
-    from veritas.cli import cli
-    assert "top-claims" in [c.name for c in cli.commands.values()]
+def test_source_stats_empty_db(cross_source_db):
+    assert cross_source_db["empty_stats"] == []
+
+
+# ──────────────────────────────────────────────────────────────────
+# CLI integration smoke tests
+# ──────────────────────────────────────────────────────────────────
+
+@pytest.mark.parametrize("command", ["spread", "timeline", "top-claims"])
+def test_cli_command_exists(command):
+    assert command in _CLI_COMMAND_NAMES
 
 
 def test_cli_sources_has_by_option():
-    from veritas.cli import cli
-    sources_cmd = cli.commands["sources"]
-    param_names = [p.name for p in sources_cmd.params]
+    param_names = [p.name for p in cli.commands["sources"].params]
     assert "sort_by" in param_names
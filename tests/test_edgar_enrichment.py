@@ -1,9 +1,6 @@
 """Tests for EDGAR enrichment: entity injection, snippet extraction, scoring, and guardrails."""
 
-import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+import pytest
 
 from veritas.evidence_sources.sec_edgar import (
     infer_source_entity,
@@ -21,29 +18,16 @@ from veritas.scoring import (
 # ── Entity injection tests ────────────────────────────────────────
 
 
-def test_infer_entity_alphabet():
-    """Should recognize Alphabet from title."""
-    assert infer_source_entity("Alphabet 2025 Q4 Earnings Call") == "Alphabet"
-
-
-def test_infer_entity_google():
-    """Should map Google to Alphabet alias."""
-    assert infer_source_entity("Google Cloud Revenue Update") == "Alphabet"
-
-
-def test_infer_entity_meta():
-    """Should recognize Meta/Facebook."""
-    assert infer_source_entity("Meta Platforms Q3 2025 Results") == "Meta"
-
-
-def test_infer_entity_apple():
-    """Should recognize Apple."""
-    assert infer_source_entity("Apple Inc Annual Report") == "Apple"
-
-
-def test_infer_entity_nvidia():
-    """Should recognize Nvidia."""
-    assert infer_source_entity("Nvidia AI Chip Sales Surge") == "Nvidia"
+@pytest.mark.parametrize("title,expected", [
+    ("Alphabet 2025 Q4 Earnings Call", "Alphabet"),
+    ("Google Cloud Revenue Update", "Alphabet"),  # alias
+    ("Meta Platforms Q3 2025 Results", "Meta"),
+    ("Apple Inc Annual Report", "Apple"),
+    ("Nvidia AI Chip Sales Surge", "Nvidia"),
+])
+def test_infer_entity_known(title, expected):
+    """Known companies and their aliases are recognised from the title."""
+    assert infer_source_entity(title) == expected
 
 
 def test_infer_entity_fallback_proper_noun():
@@ -112,12 +96,16 @@ def test_html_to_text_whitespace_normalization():
 # ── Snippet extraction tests ─────────────────────────────────────
 
 
+# Filing-sized filler, built once; strings are immutable so tests can share them.
+_LOREM_FILLER = "Lorem ipsum dolor sit amet. " * 200  # ~5600 chars
+_FOX_FILLER = "The quick brown fox jumped over the lazy dog. " * 200
+
+
 def test_snippet_extraction_exact_number_priority():
     """Snippet window should center on exact number matches."""
-    # Build a fake filing text: 10K chars of filler, then the target section
-    filler = "Lorem ipsum dolor sit amet. " * 200  # ~5600 chars
+    # Fake filing text: filler, then the target section, then more filler
     target = "Total revenues were $113.8 billion for the quarter ended December 31, 2025. Operating income was $31.6 billion."
-    filing_text = filler + target + filler
+    filing_text = _LOREM_FILLER + target + _LOREM_FILLER
 
     claim = "Alphabet's total revenues were $113.8 billion with operating income of $31.6 billion."
     snippet = extract_relevant_snippet(filing_text, claim, window=4000)
@@ -128,9 +116,8 @@ def test_snippet_extraction_exact_number_priority():
 
 def test_snippet_extraction_key_terms():
     """Snippet should find section with key financial terms when no exact numbers."""
-    filler = "The quick brown fox jumped over the lazy dog. " * 200
     target = "Revenue growth in the cloud segment exceeded expectations with strong advertising performance."
-    filing_text = filler + target + filler
+    filing_text = _FOX_FILLER + target + _FOX_FILLER
 
     claim = "Cloud revenue and advertising were strong."
     snippet = extract_relevant_snippet(filing_text, claim, window=4000)
@@ -153,53 +140,31 @@ def test_snippet_extraction_short_filing():
 # ── Financial number extraction tests ─────────────────────────────
 
 
-def test_extract_claim_numbers_decimals():
-    """Should extract decimal numbers like 113.8, 31.6, 2.82."""
-    nums = _extract_claim_numbers("Revenue was $113.8 billion, EPS was $2.82")
-    assert "113.8" in nums
-    assert "2.82" in nums
-
-
-def test_extract_claim_numbers_integers():
-    """Should extract multi-digit integers."""
-    nums = _extract_claim_numbers("Operating income increased 16 percent to $403 million")
-    assert "403" in nums
-    assert "16" in nums
-
-
-def test_extract_claim_numbers_filters_single_digits():
-    """Single digit numbers < 10 should be filtered out."""
-    nums = _extract_claim_numbers("Growth of 3 percent in Q4 2025")
-    assert "3" not in nums  # too short, < 10
-    assert "2025" in nums
+@pytest.mark.parametrize("text,must_contain,must_not_contain", [
+    ("Revenue was $113.8 billion, EPS was $2.82", {"113.8", "2.82"}, set()),  # decimals
+    ("Operating income increased 16 percent to $403 million", {"403", "16"}, set()),
+    ("Growth of 3 percent in Q4 2025", {"2025"}, {"3"}),  # single digits < 10 dropped
+])
+def test_extract_claim_numbers(text, must_contain, must_not_contain):
+    """Decimals and multi-digit integers are extracted; single digits are not."""
+    nums = _extract_claim_numbers(text)
+    assert must_contain <= set(nums)
+    assert not must_not_contain & set(nums)
 
 
 # ── Finance claim type classification tests ───────────────────────
 
 
-def test_classify_numeric_kpi():
-    """Claim with numbers + financial terms = numeric_kpi."""
-    assert classify_finance_claim("Revenue was $113.8 billion in Q4 2025") == "numeric_kpi"
-
-
-def test_classify_numeric_kpi_margin():
-    """Margin percentage = numeric_kpi."""
-    assert classify_finance_claim("Operating margin expanded to 32 percent") == "numeric_kpi"
-
-
-def test_classify_guidance():
-    """Forward-looking language = guidance."""
-    assert classify_finance_claim("We expect revenue growth to accelerate in 2026") == "guidance"
-
-
-def test_classify_guidance_with_numbers():
-    """Guidance with numbers should still be guidance."""
-    assert classify_finance_claim("We expect revenue of $120 billion in fiscal 2026") == "guidance"
-
-
-def test_classify_other():
-    """Generic statement without finance terms = other."""
-    assert classify_finance_claim("The company is headquartered in Mountain View California") == "other"
+@pytest.mark.parametrize("claim,expected", [
+    ("Revenue was $113.8 billion in Q4 2025", "numeric_kpi"),
+    ("Operating margin expanded to 32 percent", "numeric_kpi"),
+    ("We expect revenue growth to accelerate in 2026", "guidance"),
+    ("We expect revenue of $120 billion in fiscal 2026", "guidance"),  # numbers don't override
+    ("The company is headquartered in Mountain View California", "other"),
+])
+def test_classify_finance_claim(claim, expected):
+    """Numbers + financial terms = numeric_kpi; forward-looking language = guidance."""
+    assert classify_finance_claim(claim) == expected
 
 
 # ── Scoring with enriched snippets tests ──────────────────────────
@@ -4,6 +4,15 @@ import json
 import pytest
 from unittest.mock import patch, MagicMock
 
+from veritas.assist import _select_sources_for_category
+from veritas.evidence_sources import ALL_SOURCES
+from veritas.evidence_sources.google_factcheck import (
+    _format_result,
+    _parse_explorer_response,
+    search_google_factcheck,
+)
+from veritas.scoring import compute_auto_status, score_evidence
+
 
 # ---------------------------------------------------------------------------
 # Helpers: mock API response data
@@ -46,17 +55,24 @@ def _make_entry(claim_text, claimant, reviews):
     return [claim_array, "https://example.com/thumb.jpg", 5.0]
 
 
+# Responses are plain strings, so they can be built once and shared.
+_EMPTY_RESPONSE = json.dumps([["claims_response", []]])
+
+
+@pytest.fixture(scope="module")
+def ten_claims_response():
+    """Serialized Explorer response with ten single-review claims."""
+    return _make_mock_response([
+        _make_entry(f"Claim {i}", "Person", [("Pub", "pub.com", f"https://pub.com/{i}", "False", f"Title {i}")])
+        for i in range(10)
+    ])
+
+
 # ---------------------------------------------------------------------------
 # Parser tests
 # ---------------------------------------------------------------------------
 
 class TestParseExplorerResponse:
-    def setup_method(self):
-        import sys
-        sys.path.insert(0, "src")
-        from veritas.evidence_sources.google_factcheck import _parse_explorer_response
-        self.parse = _parse_explorer_response
-
     def test_parses_single_claim(self):
         entry = _make_entry(
             "Unemployment is at a record low",
@@ -65,7 +81,7 @@ class TestParseExplorerResponse:
         )
         raw = ")]}'\n" + json.dumps([["claims_response", [entry]]])
         raw = raw[raw.index("\n") + 1:]
-        result = self.parse(raw)
+        result = _parse_explorer_response(raw)
         assert len(result) == 1
         assert result[0]["claim_text"] == "Unemployment is at a record low"
         assert result[0]["claimant"] == "Joe Biden"
@@ -79,7 +95,7 @@ class TestParseExplorerResponse:
             _make_entry("Claim B", "Person B", [("AFP", "afp.com", "https://afp.com/1", "True", "Title B")]),
         ]
         raw = json.dumps([["claims_response", entries]])
-        result = self.parse(raw)
+        result = _parse_explorer_response(raw)
         assert len(result) == 2
         assert result[0]["claim_text"] == "Claim A"
         assert result[1]["claim_text"] == "Claim B"
@@ -94,16 +110,15 @@ class TestParseExplorerResponse:
             ]
         )
         raw = json.dumps([["claims_response", [entry]]])
-        result = self.parse(raw)
+        result = _parse_explorer_response(raw)
         assert len(result[0]["reviews"]) == 2
 
     def test_handles_empty_response(self):
-        raw = json.dumps([["claims_response", []]])
-        result = self.parse(raw)
+        result = _parse_explorer_response(_EMPTY_RESPONSE)
         assert result == []
 
     def test_handles_malformed_json(self):
-        result = self.parse("not json")
+        result = _parse_explorer_response("not json")
         assert result == []
 
     def test_handles_missing_reviews(self):
@@ -114,7 +129,7 @@ class TestParseExplorerResponse:
             1700000000,
         ], "thumb.jpg", 3.0]
         raw = json.dumps([["claims_response", [entry]]])
-        result = self.parse(raw)
+        result = _parse_explorer_response(raw)
         assert result == []
 
     def test_skips_entries_without_url(self):
@@ -125,7 +140,7 @@ class TestParseExplorerResponse:
             [("Publisher", "pub.com", "", "False", "Title")]
         )
         raw = json.dumps([["claims_response", [entry]]])
-        result = self.parse(raw)
+        result = _parse_explorer_response(raw)
         assert len(result) == 1  # parse succeeds, _format_result will filter
 
 
@@ -134,12 +149,6 @@ class TestParseExplorerResponse:
 # ---------------------------------------------------------------------------
 
 class TestFormatResult:
-    def setup_method(self):
-        import sys
-        sys.path.insert(0, "src")
-        from veritas.evidence_sources.google_factcheck import _format_result
-        self.format = _format_result
-
     def test_formats_basic_result(self):
         item = {
             "claim_text": "Crime rate is the highest ever",
@@ -152,7 +161,7 @@ class TestFormatResult:
                 "title_snippet": "Crime stats debunked",
             }],
         }
-        result = self.format(item)
+        result = _format_result(item)
         assert result is not None
         assert result["source_name"] == "google_factcheck"
         assert result["evidence_type"] == "factcheck"
@@ -167,12 +176,12 @@ class TestFormatResult:
             "claim_text": "A claim",
             "reviews": [{"publisher_name": "P", "url": "", "rating": "False", "title_snippet": "", "publisher_site": ""}],
         }
-        result = self.format(item)
+        result = _format_result(item)
         assert result is None
 
     def test_returns_none_for_no_reviews(self):
         item = {"claim_text": "A claim", "reviews": []}
-        result = self.format(item)
+        result = _format_result(item)
         assert result is None
 
     def test_includes_multiple_reviewers_in_snippet(self):
@@ -184,7 +193,7 @@ class TestFormatResult:
                 {"publisher_name": "AFP", "url": "https://afp.com/1", "rating": "Misleading", "title_snippet": "", "publisher_site": "afp.com"},
             ],
         }
-        result = self.format(item)
+        result = _format_result(item)
         assert "Also checked:" in result["snippet"]
         assert "AFP" in result["snippet"]
 
@@ -197,7 +206,7 @@ class TestFormatResult:
                 "title_snippet": "T" * 500, "publisher_site": "p.com",
             }],
         }
-        result = self.format(item)
+        result = _format_result(item)
         assert len(result["snippet"]) <= 2000
 
 
@@ -206,12 +215,6 @@ class TestFormatResult:
 # ---------------------------------------------------------------------------
 
 class TestSearchGoogleFactcheck:
-    def setup_method(self):
-        import sys
-        sys.path.insert(0, "src")
-        from veritas.evidence_sources.google_factcheck import search_google_factcheck
-        self.search = search_google_factcheck
-
     @patch("veritas.evidence_sources.google_factcheck.rate_limited_get")
     def test_returns_results_from_api(self, mock_get):
         entry = _make_entry(
@@ -223,7 +226,7 @@ class TestSearchGoogleFactcheck:
         mock_resp.text = _make_mock_response([entry])
         mock_get.return_value = mock_resp
 
-        results = self.search("inflation rate is 2 percent")
+        results = search_google_factcheck("inflation rate is 2 percent")
         assert len(results) == 1
         assert results[0]["source_name"] == "google_factcheck"
         assert results[0]["evidence_type"] == "factcheck"
@@ -232,26 +235,22 @@ class TestSearchGoogleFactcheck:
     @patch("veritas.evidence_sources.google_factcheck.rate_limited_get")
     def test_returns_empty_on_api_failure(self, mock_get):
         mock_get.return_value = None
-        results = self.search("some claim")
+        results = search_google_factcheck("some claim")
         assert results == []
 
     @patch("veritas.evidence_sources.google_factcheck.rate_limited_get")
     def test_returns_empty_on_empty_query(self, mock_get):
-        results = self.search("")
+        results = search_google_factcheck("")
         assert results == []
         mock_get.assert_not_called()
 
     @patch("veritas.evidence_sources.google_factcheck.rate_limited_get")
-    def test_respects_max_results(self, mock_get):
-        entries = [
-            _make_entry(f"Claim {i}", "Person", [("Pub", "pub.com", f"https://pub.com/{i}", "False", f"Title {i}")])
-            for i in range(10)
-        ]
+    def test_respects_max_results(self, mock_get, ten_claims_response):
         mock_resp = MagicMock()
-        mock_resp.text = _make_mock_response(entries)
+        mock_resp.text = ten_claims_response
         mock_get.return_value = mock_resp
 
-        results = self.search("test claim", max_results=3)
+        results = search_google_factcheck("test claim", max_results=3)
         assert len(results) == 3
 
     @patch("veritas.evidence_sources.google_factcheck.rate_limited_get")
@@ -259,7 +258,7 @@ class TestSearchGoogleFactcheck:
         mock_resp = MagicMock()
         mock_resp.text = ")]}'\nnot valid json"
         mock_get.return_value = mock_resp
-        results = self.search("test claim")
+        results = search_google_factcheck("test claim")
         assert results == []
 
 
@@ -268,21 +267,14 @@ class TestSearchGoogleFactcheck:
 # ---------------------------------------------------------------------------
 
 class TestRegistryAndRouting:
-    def setup_method(self):
-        import sys
-        sys.path.insert(0, "src")
-
     def test_google_factcheck_in_all_sources(self):
-        from veritas.evidence_sources import ALL_SOURCES
         names = [name for name, _ in ALL_SOURCES]
         assert "google_factcheck" in names
 
     def test_source_count_is_20(self):
-        from veritas.evidence_sources import ALL_SOURCES
         assert len(ALL_SOURCES) == 20
 
     def test_politics_routing_includes_factcheck(self):
-        from veritas.assist import _select_sources_for_category
         sources = _select_sources_for_category("politics")
         names = [name for name, _ in sources]
         assert "google_factcheck" in names
@@ -290,13 +282,11 @@ class TestRegistryAndRouting:
         assert names.index("google_factcheck") < names.index("crossref")
 
     def test_general_routing_includes_factcheck(self):
-        from veritas.assist import _select_sources_for_category
         sources = _select_sources_for_category("general")
         names = [name for name, _ in sources]
         assert "google_factcheck" in names
 
     def test_health_routing_includes_factcheck(self):
-        from veritas.assist import _select_sources_for_category
         sources = _select_sources_for_category("health")
         names = [name for name, _ in sources]
         assert "google_factcheck" in names
@@ -307,15 +297,8 @@ class TestRegistryAndRouting:
 # ---------------------------------------------------------------------------
 
 class TestScoringIntegration:
-    def setup_method(self):
-        import sys
-        sys.path.insert(0, "src")
-        from veritas.scoring import score_evidence, compute_auto_status
-        self.score_evidence = score_evidence
-        self.compute_auto_status = compute_auto_status
-
     def test_factcheck_gets_primary_boost(self):
-        score, signals = self.score_evidence(
+        score, signals = score_evidence(
             claim_text="Unemployment rate is at a record low",
             claim_category="politics",
             evidence_title="Fact Check: Unemployment rate claim",
@@ -328,7 +311,7 @@ class TestScoringIntegration:
 
     def test_factcheck_qualifies_as_primary_for_supported(self):
         # factcheck evidence_type should count as primary for auto-status
-        status, confidence = self.compute_auto_status(
+        status, confidence = compute_auto_status(
             best_score=90,
             best_evidence_type="factcheck",
             best_signals="token_overlap:8|keyphrase_hit:2|factcheck_source",
@@ -337,7 +320,7 @@ class TestScoringIntegration:
         assert status == "supported"
 
     def test_factcheck_partial_at_moderate_score(self):
-        status, _ = self.compute_auto_status(
+        status, _ = compute_auto_status(
             best_score=75,
             best_evidence_type="factcheck",
             best_signals="token_overlap:5|factcheck_source",
@@ -1,12 +1,21 @@
 """Tests for text/PDF/URL document ingestion (Step 4)."""
 
-import sys
 import json
 import pytest
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
-sys.path.insert(0, "src")
+from veritas.cli import cli
+from veritas.ingest_text import (
+    _extract_article_text,
+    _extract_article_text_regex,
+    _fetch_html,
+    _split_into_chunks,
+    _text_to_segments,
+    ingest_raw_text,
+    ingest_text_file,
+    ingest_url,
+)
 
 
 # ===========================================================================
@@ -14,13 +23,9 @@ sys.path.insert(0, "src")
 # ===========================================================================
 
 class TestTextToSegments:
-    def setup_method(self):
-        from veritas.ingest_text import _text_to_segments
-        self.convert = _text_to_segments
-
     def test_single_paragraph(self):
         text = "The Federal Reserve raised interest rates by 25 basis points in March 2024."
-        segments = self.convert(text)
+        segments = _text_to_segments(text)
         assert len(segments) >= 1
         assert segments[0]["text"] == text.strip()
         assert segments[0]["start"] == 0.0
@@ -28,36 +33,36 @@ class TestTextToSegments:
 
     def test_multiple_paragraphs(self):
         text = "First paragraph about economics.\n\nSecond paragraph about climate change."
-        segments = self.convert(text)
+        segments = _text_to_segments(text)
         assert len(segments) == 2
         assert "economics" in segments[0]["text"]
         assert "climate" in segments[1]["text"]
 
     def test_long_paragraph_split(self):
         text = "This is a very long paragraph. " * 20
-        segments = self.convert(text)
+        segments = _text_to_segments(text)
         assert len(segments) > 1  # should split into multiple segments
 
     def test_empty_text_returns_empty(self):
-        segments = self.convert("")
+        segments = _text_to_segments("")
         assert segments == []
 
     def test_timestamps_are_sequential(self):
         text = "Paragraph one.\n\nParagraph two.\n\nParagraph three."
-        segments = self.convert(text)
+        segments = _text_to_segments(text)
         for i in range(1, len(segments)):
             assert segments[i]["start"] >= segments[i - 1]["end"] or \
                    segments[i]["start"] >= segments[i - 1]["start"]
 
     def test_whitespace_only_skipped(self):
         text = "Real content here.\n\n   \n\n   \n\nMore real content."
-        segments = self.convert(text)
+        segments = _text_to_segments(text)
         for seg in segments:
             assert seg["text"].strip() != ""
 
     def test_segment_dict_format(self):
         text = "Apple reported revenue of 113.8 billion dollars in Q1 2024."
-        segments = self.convert(text)
+        segments = _text_to_segments(text)
         assert len(segments) >= 1
         seg = segments[0]
         assert "start" in seg
@@ -73,19 +78,15 @@ class TestTextToSegments:
 # ===========================================================================
 
 class TestSplitIntoChunks:
-    def setup_method(self):
-        from veritas.ingest_text import _split_into_chunks
-        self.split = _split_into_chunks
-
     def test_short_text_stays_intact(self):
         text = "Short sentence."
-        chunks = self.split(text, 200)
+        chunks = _split_into_chunks(text, 200)
         assert len(chunks) == 1
         assert chunks[0] == "Short sentence."
 
     def test_long_text_splits_at_sentences(self):
         text = "First sentence. Second sentence. Third sentence. Fourth sentence."
-        chunks = self.split(text, 40)
+        chunks = _split_into_chunks(text, 40)
         assert len(chunks) >= 2
         # Each chunk should end with a complete sentence
         for chunk in chunks:
@@ -97,59 +98,64 @@ class TestSplitIntoChunks:
 # ===========================================================================
 
 class TestExtractArticleText:
-    def setup_method(self):
-        from veritas.ingest_text import _extract_article_text
-        self.extract = _extract_article_text
-
     def test_extracts_title(self):
         html = "<html><head><title>Test Article</title></head><body>Content here.</body></html>"
-        title, text = self.extract(html)
+        title, text = _extract_article_text(html)
         assert title == "Test Article"
 
     def test_extracts_body_text(self):
         html = "<html><body><p>Some paragraph text.</p><p>Another paragraph.</p></body></html>"
-        _, text = self.extract(html)
+        _, text = _extract_article_text(html)
         assert "Some paragraph text" in text
         assert "Another paragraph" in text
 
     def test_strips_scripts(self):
         html = "<html><body><script>var x = 1;</script><p>Real content.</p></body></html>"
-        _, text = self.extract(html)
+        _, text = _extract_article_text(html)
         assert "var x" not in text
         assert "Real content" in text
 
     def test_strips_nav_and_footer(self):
         html = "<html><body><nav>Menu stuff</nav><article>Article text here.</article><footer>Footer stuff</footer></body></html>"
-        _, text = self.extract(html)
+        _, text = _extract_article_text(html)
         assert "Article text here" in text
         # Nav/footer may or may not be present depending on article extraction
 
     def test_prefers_article_tag(self):
         html = "<html><body><div>Sidebar</div><article>Main article content.</article></body></html>"
-        _, text = self.extract(html)
+        _, text = _extract_article_text(html)
         assert "Main article content" in text
 
     def test_handles_empty_html(self):
-        title, text = self.extract("")
+        title, text = _extract_article_text("")
         assert title == ""
 
+    def test_regex_fallback_matches_parser(self):
+        html = ("<html><head><title>Fed &amp; Rates</title></head><body><nav>Menu</nav>"
+                "<article><p>Rates rose.</p><script>x()</script><p>Again.</p></article></body></html>")
+        assert _extract_article_text_regex(html) == ("Fed & Rates", "Rates rose. Again.")
+        assert _extract_article_text(html) == ("Fed & Rates", "Rates rose. Again.")
+
+    def test_decodes_html_entities(self):
+        html = ("<html><head><title>Q&amp;A &#8212; Rates</title></head>"
+                "<body><p>&quot;Rates&quot;&nbsp;rose &lt;5%&gt; at AT&amp;T.</p></body></html>")
+        title, text = _extract_article_text(html)
+        assert title == "Q&A \u2014 Rates"
+        assert '"Rates" rose <5%> at AT&T.' in text
+
 
 # ===========================================================================
 # Text file ingestion (integration, mocked DB)
 # ===========================================================================
 
 class TestIngestTextFile:
-    def setup_method(self):
-        from veritas.ingest_text import ingest_text_file
-        self.ingest = ingest_text_file
-
     @patch("veritas.ingest_text.db")
     def test_ingests_text_file(self, mock_db, tmp_path):
         # Create a temp text file
         txt = tmp_path / "test_article.txt"
         txt.write_text("The Federal Reserve raised interest rates by 25 basis points. Inflation fell to 3 percent.")
 
-        source = self.ingest(str(txt), title="Test Article")
+        source = ingest_text_file(str(txt), title="Test Article")
         assert source.source_type == "text"
         assert source.title == "Test Article"
         mock_db.insert_source.assert_called_once()
@@ -157,37 +163,53 @@ class TestIngestTextFile:
 
     def test_raises_on_missing_file(self):
         with pytest.raises(FileNotFoundError):
-            self.ingest("/nonexistent/path/file.txt")
+            ingest_text_file("/nonexistent/path/file.txt")
 
     @patch("veritas.ingest_text.db")
     def test_raises_on_empty_file(self, mock_db, tmp_path):
         txt = tmp_path / "empty.txt"
         txt.write_text("")
         with pytest.raises(ValueError, match="empty"):
-            self.ingest(str(txt))
+            ingest_text_file(str(txt))
 
     @patch("veritas.ingest_text.db")
     def test_defaults_title_to_filename(self, mock_db, tmp_path):
         txt = tmp_path / "my_article.txt"
         txt.write_text("Some claim about the economy and inflation rate.")
-        source = self.ingest(str(txt))
+        source = ingest_text_file(str(txt))
         assert source.title == "my_article"
 
+    @patch("veritas.ingest_text.db")
+    def test_transcript_json_round_trips(self, mock_db, tmp_path):
+        txt = tmp_path / "euro.txt"
+        txt.write_text("The ECB held rates at 4% — prices in € rose 2.5 percent.", encoding="utf-8")
+        ingest_text_file(str(txt))
+        tmeta = mock_db.upsert_transcript.call_args[0][0]
+        raw = Path(tmeta.transcript_path).read_text(encoding="utf-8")
+        assert "€" in raw  # written as UTF-8, not \u escapes
+        data = json.loads(raw)
+        assert data["segments"][0]["text"].startswith("The ECB held rates")
+        assert len(data["segments"]) == tmeta.segment_count
+
 
 # ===========================================================================
 # URL ingestion (mocked HTTP + DB)
 # ===========================================================================
 
-class TestIngestUrl:
-    def setup_method(self):
-        from veritas.ingest_text import ingest_url
-        self.ingest = ingest_url
+def _mock_response(html: str, encoding: str = "utf-8") -> MagicMock:
+    """A streamed requests response whose body is *html*."""
+    mock_resp = MagicMock()
+    mock_resp.encoding = encoding
+    mock_resp.iter_content.return_value = [html.encode(encoding)]
+    mock_resp.raise_for_status = MagicMock()
+    return mock_resp
 
+
+class TestIngestUrl:
     @patch("veritas.ingest_text.db")
     @patch("veritas.ingest_text.requests")
     def test_ingests_url(self, mock_requests, mock_db):
-        mock_resp = MagicMock()
-        mock_resp.text = """
+        mock_resp = _mock_response("""
         <html>
         <head><title>Test Page</title></head>
         <body>
@@ -197,11 +219,10 @@ class TestIngestUrl:
         </article>
         </body>
         </html>
-        """
-        mock_resp.raise_for_status = MagicMock()
+        """)
         mock_requests.get.return_value = mock_resp
 
-        source = self.ingest("https://example.com/article")
+        source = ingest_url("https://example.com/article")
         assert source.source_type == "url"
         assert "Test Page" in source.title
         mock_db.insert_source.assert_called_once()
@@ -210,31 +231,42 @@ class TestIngestUrl:
     @patch("veritas.ingest_text.db")
     @patch("veritas.ingest_text.requests")
     def test_raises_on_empty_content(self, mock_requests, mock_db):
-        mock_resp = MagicMock()
-        mock_resp.text = "<html><body><script>Only scripts here</script></body></html>"
-        mock_resp.raise_for_status = MagicMock()
+        mock_resp = _mock_response("<html><body><script>Only scripts here</script></body></html>")
         mock_requests.get.return_value = mock_resp
 
         # This might not raise if the script stripping leaves whitespace
         # So we just verify it doesn't crash
         try:
-            source = self.ingest("https://example.com/empty")
+            source = ingest_url("https://example.com/empty")
         except ValueError:
             pass  # Expected for truly empty content
 
+    @patch("veritas.ingest_text.requests")
+    def test_fetch_caps_body_size(self, mock_requests, monkeypatch):
+        import veritas.ingest_text as it
+        monkeypatch.setattr(it, "_MAX_HTML_BYTES", 10)
+        mock_resp = _mock_response("")
+        mock_resp.iter_content.return_value = [b"abcdef", b"ghijkl", b"mnopqr"]
+        mock_requests.get.return_value = mock_resp
+
+        assert it._fetch_html("https://example.com/big") == "abcdefghij"
+        assert mock_requests.get.call_args.kwargs["stream"] is True
+        mock_resp.close.assert_called_once()
+
+    @patch("veritas.ingest_text.requests")
+    def test_fetch_decodes_declared_charset(self, mock_requests):
+        mock_requests.get.return_value = _mock_response("Café prices", encoding="latin-1")
+        assert _fetch_html("https://example.com/fr") == "Café prices"
+
 
 # ===========================================================================
 # Raw text ingestion
 # ===========================================================================
 
 class TestIngestRawText:
-    def setup_method(self):
-        from veritas.ingest_text import ingest_raw_text
-        self.ingest = ingest_raw_text
-
     @patch("veritas.ingest_text.db")
     def test_ingests_raw_text(self, mock_db):
-        source = self.ingest(
+        source = ingest_raw_text(
             "The unemployment rate dropped to 3.5 percent in 2024.",
             title="Test Claim",
         )
@@ -243,7 +275,7 @@ class TestIngestRawText:
 
     def test_raises_on_empty_text(self):
         with pytest.raises(ValueError, match="empty"):
-            self.ingest("")
+            ingest_raw_text("")
 
 
 # ===========================================================================
@@ -252,11 +284,9 @@ class TestIngestRawText:
 
 class TestCLICommands:
     def test_ingest_text_command_exists(self):
-        from veritas.cli import cli
         commands = cli.commands
         assert "ingest-text" in commands
 
     def test_ingest_url_command_exists(self):
-        from veritas.cli import cli
         commands = cli.commands
         assert "ingest-url" in commands
@@ -1,11 +1,6 @@
 """Tests for the knowledge graph layer — fingerprinting, clustering, consensus, DB, CLI."""
 
-import sys
-from pathlib import Path
-
-# Ensure src is on path
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
-
+import veritas.config as cfg
 
 # ---------------------------------------------------------------------------
 # Step 1: Fingerprinting tests
@@ -201,6 +196,19 @@ class TestUnionFind:
         assert sorted(members) == [["a", "b"], ["c", "d"]]
 
 
+    def test_deep_chain_no_recursion_error(self):
+        """find() must not recurse — long parent chains are compressed iteratively."""
+        from veritas.knowledge_graph import UnionFind
+        uf = UnionFind()
+        n = 5000
+        for i in range(n):
+            uf.parent[f"n{i}"] = f"n{min(i + 1, n - 1)}"
+            uf.rank[f"n{i}"] = 0
+        assert uf.find("n0") == f"n{n - 1}"
+        assert uf.parent["n0"] == f"n{n - 1}"
+        assert len(uf.clusters()) == 1
+
+
 class TestBuildClusters:
     """Tests for build_clusters() end-to-end."""
 
@@ -236,6 +244,33 @@ class TestBuildClusters:
         # Should have NO clusters (same source)
         assert len(clusters) == 0
 
+    def test_process_pool_matches_serial(self, monkeypatch):
+        """Fanning blocks out to worker processes gives the same clusters."""
+        import veritas.knowledge_graph as kg
+
+        texts = [
+            ("Alphabet reported $350 billion revenue in 2024", "finance"),
+            ("Google parent Alphabet had $350 billion revenue for 2024", "finance"),
+            ("Unemployment fell to 3.5 percent in March", "economics"),
+            ("The unemployment rate dropped to 3.5 percent in March", "economics"),
+        ]
+
+        def make_claims():
+            return [
+                kg.ClaimRecord(claim_id=f"c{i}", source_id=f"s{i % 4}",
+                               text=t, category=cat)
+                for i, (t, cat) in enumerate(texts * 5)
+            ]
+
+        def member_sets(clusters):
+            return sorted(sorted(m.claim_id for m in ms) for ms in clusters.values())
+
+        serial = member_sets(kg.build_clusters(make_claims(), threshold=0.30))
+        monkeypatch.setattr(kg, "_PARALLEL_MIN_PAIRS", 0)
+        parallel = member_sets(kg.build_clusters(make_claims(), threshold=0.30))
+        assert parallel == serial
+        assert serial
+
     def test_singletons_excluded(self):
         """Claims that don't match anything are excluded from clusters."""
         from veritas.knowledge_graph import build_clusters, ClaimRecord
@@ -265,6 +300,57 @@ class TestBuildClusters:
         assert len(low) >= len(high)
 
 
+class TestSimilarPairs:
+    """Vectorised block scoring must agree with the pairwise loop."""
+
+    def test_numpy_matches_pairwise(self, monkeypatch):
+        import pytest
+        np = pytest.importorskip("numpy")
+        import veritas.knowledge_graph as kg
+
+        texts = [
+            "Alphabet reported $350 billion revenue in 2024",
+            "Google parent Alphabet had $350 billion revenue for 2024",
+            "Revenue was $350 billion in 2024",
+            "Tesla delivered 350 thousand cars",
+            "",
+        ]
+        block = []
+        for i in range(80):
+            c = kg.ClaimRecord(claim_id=f"c{i}", source_id=f"s{i % 3}",
+                               text=texts[i % len(texts)], category="finance")
+            c.fingerprint = kg.claim_fingerprint(c.text, c.category)
+            c.fingerprint_set = frozenset(c.fingerprint.split("|")) if c.fingerprint else frozenset()
+            block.append(c)
+
+        vectorised = [(a.claim_id, b.claim_id) for a, b in kg._similar_pairs_numpy(block, 0.4, np)]
+        monkeypatch.setattr(kg, "_VECTORIZE_MIN_BLOCK", 10**9)
+        pairwise = [(a.claim_id, b.claim_id) for a, b in kg._similar_pairs(block, 0.4)]
+        assert vectorised == pairwise
+        assert vectorised  # the block does contain matches
+
+    def test_oversized_block_uses_lsh(self):
+        import pytest
+        pytest.importorskip("datasketch")
+        import veritas.knowledge_graph as kg
+
+        block = []
+        for i in range(kg._MAX_EXACT_BLOCK + 10):
+            text = f"Company number {i} reported revenue of {i} million"
+            if i in (3, 400):
+                text = "Alphabet reported $350 billion revenue in 2024"
+            c = kg.ClaimRecord(claim_id=f"c{i}", source_id=f"s{i}",
+                               text=text, category="finance")
+            c.fingerprint_set = kg.claim_fingerprint_set(c.text, c.category)
+            block.append(c)
+
+        pairs = [(a.claim_id, b.claim_id) for a, b in kg._similar_pairs(block, 0.9)]
+        assert ("c3", "c400") in pairs
+        assert all(kg._jaccard(block[int(a[1:])].fingerprint_set,
+                               block[int(b[1:])].fingerprint_set) >= 0.9
+                   for a, b in pairs)
+
+
 # ---------------------------------------------------------------------------
 # Step 4: DB tests
 # ---------------------------------------------------------------------------
@@ -272,18 +358,16 @@ class TestBuildClusters:
 class TestClusterDB:
     """Tests for cluster DB CRUD functions."""
 
-    def _setup_db(self, tmp_path):
+    def _setup_db(self, tmp_path, monkeypatch):
         """Redirect DB to temp and initialize."""
-        import veritas.config as cfg
-        cfg.DB_PATH = tmp_path / "test_kg.sqlite"
+        monkeypatch.setattr(cfg, "DB_PATH", tmp_path / "test_kg.sqlite")
         from veritas import db
         db.init_db()
         return db
 
-    def test_table_creation(self, tmp_path):
+    def test_table_creation(self, tmp_path, monkeypatch):
         """Cluster tables are created on init."""
-        import veritas.config as cfg
-        cfg.DB_PATH = tmp_path / "test_tables.sqlite"
+        monkeypatch.setattr(cfg, "DB_PATH", tmp_path / "test_tables.sqlite")
         from veritas import db
         db.init_db()
 
@@ -296,9 +380,9 @@ class TestClusterDB:
         assert "claim_clusters" in tables
         assert "cluster_members" in tables
 
-    def test_upsert_and_get_cluster(self, tmp_path):
+    def test_upsert_and_get_cluster(self, tmp_path, monkeypatch):
         """Insert and retrieve a cluster."""
-        db = self._setup_db(tmp_path)
+        db = self._setup_db(tmp_path, monkeypatch)
         from veritas.models import ClaimCluster
 
         cluster = ClaimCluster(
@@ -319,9 +403,9 @@ class TestClusterDB:
         assert got["claim_count"] == 3
         assert got["consensus_score"] == 0.92
 
-    def test_insert_and_get_members(self, tmp_path):
+    def test_insert_and_get_members(self, tmp_path, monkeypatch):
         """Insert cluster members and retrieve with claim details."""
-        db = self._setup_db(tmp_path)
+        db = self._setup_db(tmp_path, monkeypatch)
         from veritas.models import ClaimCluster, Source, Claim
 
         # Create source and claims first (FK constraints)
@@ -351,9 +435,9 @@ class TestClusterDB:
         assert got[0]["similarity_to_rep"] >= got[1]["similarity_to_rep"]
         assert got[0]["text"] == "Revenue was $350 billion"
 
-    def test_clear_clusters(self, tmp_path):
+    def test_clear_clusters(self, tmp_path, monkeypatch):
         """clear_clusters() removes all clusters and members."""
-        db = self._setup_db(tmp_path)
+        db = self._setup_db(tmp_path, monkeypatch)
         from veritas.models import ClaimCluster
 
         cluster = ClaimCluster(id="c1", representative_text="Test")
@@ -363,9 +447,9 @@ class TestClusterDB:
         db.clear_clusters()
         assert db.get_cluster("c1") is None
 
-    def test_get_top_clusters(self, tmp_path):
+    def test_get_top_clusters(self, tmp_path, monkeypatch):
         """get_top_clusters returns sorted results."""
-        db = self._setup_db(tmp_path)
+        db = self._setup_db(tmp_path, monkeypatch)
         from veritas.models import ClaimCluster
 
         clusters = [
@@ -383,9 +467,9 @@ class TestClusterDB:
         assert top[0]["id"] == "c2"  # highest consensus first
         assert top[2]["id"] == "c1"  # lowest last
 
-    def test_get_cluster_for_claim(self, tmp_path):
+    def test_get_cluster_for_claim(self, tmp_path, monkeypatch):
         """get_cluster_for_claim returns the cluster a claim belongs to."""
-        db = self._setup_db(tmp_path)
+        db = self._setup_db(tmp_path, monkeypatch)
         from veritas.models import ClaimCluster, Source, Claim
 
         src = Source(id="src1", url="https://example.com", title="Test")
@@ -405,9 +489,27 @@ class TestClusterDB:
         # Non-existent claim
         assert db.get_cluster_for_claim("nonexistent") is None
 
-    def test_empty_operations(self, tmp_path):
+    def test_replace_clusters(self, tmp_path, monkeypatch):
+        """replace_clusters() drops the old graph and writes the new one."""
+        db = self._setup_db(tmp_path, monkeypatch)
+        from veritas.models import ClaimCluster, Source, Claim
+
+        db.insert_source(Source(id="src1", url="https://example.com", title="Test"))
+        db.insert_claims([Claim(id="cl1", source_id="src1", text="Test claim")])
+        db.upsert_clusters([ClaimCluster(id="old", representative_text="Old")])
+
+        db.replace_clusters(
+            [ClaimCluster(id="new", representative_text="New")],
+            [{"cluster_id": "new", "claim_id": "cl1", "fingerprint": "test",
+              "similarity_to_rep": 1.0}],
+        )
+        assert db.get_cluster("old") is None
+        assert db.get_cluster("new") is not None
+        assert db.get_cluster_for_claim("cl1")["id"] == "new"
+
+    def test_empty_operations(self, tmp_path, monkeypatch):
         """Empty inputs return 0 / empty."""
-        db = self._setup_db(tmp_path)
+        db = self._setup_db(tmp_path, monkeypatch)
         assert db.upsert_clusters([]) == 0
         assert db.insert_cluster_members([]) == 0
         assert db.get_top_clusters() == []
@@ -502,6 +604,23 @@ class TestConsensus:
         status2, _, _ = compute_consensus(members2)
         assert status2 == "partial"
 
+    def test_claim_records_match_dicts(self):
+        """ClaimRecords are scored by attribute, same as the dict form."""
+        from veritas.knowledge_graph import compute_consensus, ClaimRecord
+        rows = [
+            ("s1", "supported", 0.80),
+            ("s2", "partial", 0.70),
+            ("s3", "supported", 0.75),
+            ("s3", "unknown", 0.90),
+        ]
+        dicts = [{"source_id": s, "status_auto": st, "auto_confidence": c} for s, st, c in rows]
+        records = [
+            ClaimRecord(claim_id=f"c{i}", source_id=s, text="", category="general",
+                        status_auto=st, auto_confidence=c)
+            for i, (s, st, c) in enumerate(rows)
+        ]
+        assert compute_consensus(records) == compute_consensus(dicts) == ("supported", 0.90, 1.0)
+
 
 # ---------------------------------------------------------------------------
 # Step 6: CLI registration tests
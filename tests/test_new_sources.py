@@ -4,13 +4,10 @@ OpenFDA, BLS, CBO, USASpending, Census, World Bank, PatentsView.
 All tests mock external HTTP calls.
 """
 
-import sys
 import json
 import pytest
 from unittest.mock import patch, MagicMock
 
-sys.path.insert(0, "src")
-
 
 # ===========================================================================
 # Registry tests — all 7 sources registered in __init__.py
@@ -470,6 +467,14 @@ class TestWorldBank:
     def test_defaults_to_world(self):
         assert self.extract_country("global GDP growth") == "WLD"
 
+    def test_prefers_longest_term(self):
+        match = self.match("GDP per capita in Brazil")
+        assert match[0] == "NY.GDP.PCAP.CD"
+
+    def test_country_requires_whole_first_word(self):
+        # "uk" must not fire inside "Ukraine"
+        assert self.extract_country("Ukraine GDP fell sharply") == "WLD"
+
     @patch("veritas.evidence_sources.worldbank.rate_limited_get")
     def test_returns_results_from_api(self, mock_get):
         mock_resp = MagicMock()
@@ -1,13 +1,8 @@
 """Smoke tests for Veritas — DB init, models, basic CLI import."""
 
-import sys
 import os
 import sqlite3
 import tempfile
-from pathlib import Path
-
-# Ensure src is on path
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
 
 
 def test_models_creation():
@@ -71,6 +66,13 @@ def test_db_init_and_roundtrip(tmp_path):
         assert len(evs) == 1
         assert evs[0].url == "https://source.gov/report"
 
+        assert db.insert_evidence_many([
+            Evidence(claim_id=c1.id, url="https://a.example/1"),
+            Evidence(claim_id=c1.id, url="https://a.example/2"),
+        ]) == 2
+        assert db.insert_evidence_many([]) == 0
+        assert len(db.get_evidence_for_claim(c1.id)) == 3
+
     finally:
         cfg.DB_PATH = original_db
 
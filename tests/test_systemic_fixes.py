@@ -9,16 +9,12 @@
 All tests mock external HTTP calls.
 """
 
-import sys
 import os
 import csv
 import json
 import tempfile
 import pytest
 from unittest.mock import patch, MagicMock, PropertyMock
-from pathlib import Path
-
-sys.path.insert(0, "src")
 
 
 # ===========================================================================
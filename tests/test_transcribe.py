@@ -0,0 +1,97 @@
+"""Tests for transcribe.py — faster-whisper is replaced by a fake module."""
+
+import sys
+import json
+import types
+import pytest
+from pathlib import Path
+from unittest.mock import patch, MagicMock
+
+
+def _fake_whisper(segments, language="en"):
+    """A stand-in faster_whisper module whose model yields *segments*."""
+    model = MagicMock()
+    info = MagicMock(language=language, language_probability=0.987654)
+    model.transcribe.return_value = (
+        iter(types.SimpleNamespace(start=s, end=e, text=t) for s, e, t in segments),
+        info,
+    )
+    module = types.ModuleType("faster_whisper")
+    module.WhisperModel = MagicMock(return_value=model)
+    return module
+
+
+@pytest.fixture(autouse=True)
+def _release_models():
+    import veritas.transcribe as tr
+    tr.release_models()
+    yield
+    tr.release_models()
+
+
+class TestTranscribe:
+    def test_writes_transcript_and_returns_segments(self, tmp_path, monkeypatch):
+        import veritas.transcribe as tr
+        from veritas.models import Source
+
+        audio = tmp_path / "audio.m4a"
+        audio.write_bytes(b"")
+        fake = _fake_whisper([(0.12345, 1.5, "  Hello there. "), (1.5, 3.0004, "Rates rose.")])
+        monkeypatch.setitem(sys.modules, "faster_whisper", fake)
+        monkeypatch.setattr(tr, "source_transcript_dir", lambda sid: tmp_path)
+
+        with patch.object(tr, "db") as mock_db:
+            mock_db.get_source.return_value = Source(id="src1", local_audio_path=str(audio))
+            meta, segments = tr.transcribe("src1", model_size="tiny", device="cpu")
+
+        assert meta.segment_count == 2
+        assert [(s.start, s.end, s.text) for s in segments] == [
+            (0.123, 1.5, "Hello there."), (1.5, 3.0, "Rates rose."),
+        ]
+        data = json.loads(Path(meta.transcript_path).read_text(encoding="utf-8"))
+        assert data["source_id"] == "src1"
+        assert data["language"] == "en"
+        assert data["language_probability"] == 0.9877
+        assert data["segments"] == [
+            {"start": 0.123, "end": 1.5, "text": "Hello there."},
+            {"start": 1.5, "end": 3.0, "text": "Rates rose."},
+        ]
+        mock_db.upsert_transcript.assert_called_once_with(meta)
+
+    def test_no_segments_still_valid_json(self, tmp_path, monkeypatch):
+        import veritas.transcribe as tr
+        from veritas.models import Source
+
+        audio = tmp_path / "silence.m4a"
+        audio.write_bytes(b"")
+        monkeypatch.setitem(sys.modules, "faster_whisper", _fake_whisper([]))
+        monkeypatch.setattr(tr, "source_transcript_dir", lambda sid: tmp_path)
+
+        with patch.object(tr, "db") as mock_db:
+            mock_db.get_source.return_value = Source(id="src2", local_audio_path=str(audio))
+            meta, segments = tr.transcribe("src2", device="cpu")
+
+        assert segments == [] and meta.segment_count == 0
+        assert json.loads(Path(meta.transcript_path).read_text(encoding="utf-8"))["segments"] == []
+        assert not (tmp_path / "transcript.json.partial").exists()
+
+    def test_model_reused_across_calls(self, tmp_path, monkeypatch):
+        import veritas.transcribe as tr
+        from veritas.models import Source
+
+        audio = tmp_path / "a.m4a"
+        audio.write_bytes(b"")
+        fake = _fake_whisper([])
+        model = fake.WhisperModel.return_value
+        model.transcribe.side_effect = lambda *a, **kw: (iter(()), MagicMock(
+            language="en", language_probability=1.0))
+        monkeypatch.setitem(sys.modules, "faster_whisper", fake)
+        monkeypatch.setattr(tr, "source_transcript_dir", lambda sid: tmp_path)
+
+        with patch.object(tr, "db") as mock_db:
+            mock_db.get_source.return_value = Source(id="src3", local_audio_path=str(audio))
+            tr.transcribe("src3", model_size="tiny", device="cpu")
+            tr.transcribe("src3", model_size="tiny", device="cpu")
+
+        fake.WhisperModel.assert_called_once_with("tiny", device="cpu", compute_type="int8")
+        assert model.transcribe.call_count == 2
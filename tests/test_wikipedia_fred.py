@@ -1,13 +1,11 @@
 """Tests for Wikipedia and FRED evidence sources, improved routing, and build_search_query."""
 
-import sys
-from pathlib import Path
+import time
 from unittest.mock import patch, MagicMock
 
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
-
 from veritas.evidence_sources.wikipedia_source import (
     search_wikipedia,
+    search_wikipedia_batch,
     _clean_extract,
     _build_results_from_search,
 )
@@ -23,7 +21,9 @@ from veritas.assist import (
     _select_sources_for_category,
     _smart_select_sources,
     _MACRO_TERMS,
+    _SourceBatch,
 )
+from veritas.models import Claim
 
 
 # ── Wikipedia source ─────────────────────────────────────────────
@@ -48,6 +48,26 @@ def test_clean_extract_relevance_sorting():
     assert "trillion" in snippet or "manages" in snippet
 
 
+def test_clean_extract_ignores_punctuation():
+    """Trailing punctuation should not prevent a word from matching."""
+    extract = (
+        "BlackRock founded Aladdin later.\n"
+        "Year: 1988, founded by Fink (BlackRock)."
+    )
+    snippet = _clean_extract(extract, "BlackRock founded 1988")
+    assert snippet.startswith("Year: 1988, founded by Fink (BlackRock).")
+
+
+def test_clean_extract_long_extract_stops_on_irrelevant_run():
+    """Very long extracts stop scanning after a run of irrelevant paragraphs."""
+    filler = "\n".join("Unrelated filler paragraph number %d. " % i * 40 for i in range(40))
+    extract = "BlackRock manages assets.\n" + filler + "\nBlackRock manages trillions in assets."
+    assert len(extract) > 32 * 1024
+    snippet = _clean_extract(extract, "BlackRock manages trillions in assets")
+    assert snippet.startswith("BlackRock manages assets.")
+    assert "trillions" not in snippet
+
+
 def test_clean_extract_empty():
     """Empty extract should return empty string."""
     assert _clean_extract("", "some claim") == ""
@@ -76,6 +96,78 @@ def test_wikipedia_result_format():
     assert results[0]["evidence_type"] == "secondary"
 
 
+def _wiki_response(payload):
+    resp = MagicMock()
+    resp.json.return_value = payload
+    return resp
+
+
+@patch("veritas.evidence_sources.wikipedia_source.rate_limited_get")
+def test_wikipedia_batch_shares_extracts_request(mock_get):
+    """Batched lookup should run one search per claim and one extracts call."""
+    searches = [
+        {"query": {"search": [{"pageid": 1, "title": "BlackRock"}]}},
+        {"query": {"search": [{"pageid": 1, "title": "BlackRock"}, {"pageid": 2, "title": "Larry Fink"}]}},
+    ]
+    extracts = {"query": {"pages": {
+        "1": {"title": "BlackRock", "fullurl": "https://en.wikipedia.org/wiki/BlackRock",
+              "extract": "BlackRock manages $10 trillion in assets."},
+        "2": {"title": "Larry Fink", "fullurl": "https://en.wikipedia.org/wiki/Larry_Fink",
+              "extract": "Larry Fink founded BlackRock in 1988."},
+    }}}
+    mock_get.side_effect = [_wiki_response(searches[0]), _wiki_response(searches[1]),
+                            _wiki_response(extracts)]
+
+    results = search_wikipedia_batch([
+        "BlackRock manages trillions in assets",
+        "Larry Fink founded BlackRock",
+        "it was going up and down",  # no entities — never searched
+    ], max_results=3)
+
+    assert mock_get.call_count == 3
+    assert mock_get.call_args_list[2].kwargs["params"]["pageids"] == "1|2"
+    assert [len(r) for r in results] == [1, 2, 0]
+    assert results[1][1]["title"] == "Larry Fink - Wikipedia"
+    assert "1988" in results[1][1]["snippet"]
+
+
+def _batch_claims(n):
+    return [Claim(id=f"c{i}", source_id="s1", text=f"Claim {i}", ts_start=0.0, ts_end=1.0)
+            for i in range(n)]
+
+
+def test_source_batch_fetches_lazily_and_caps_at_batch_size():
+    """Without a budget, one fetch covers up to ten upcoming claims."""
+    claims = _batch_claims(12)
+    batch_fn = MagicMock(side_effect=lambda texts, max_results: [[{"title": t}] for t in texts])
+    batch = _SourceBatch(batch_fn, claims, float("inf"))
+    assert batch_fn.call_count == 0
+
+    assert batch.results_for(claims[0]) == [{"title": "Claim 0"}]
+    assert len(batch_fn.call_args.args[0]) == 10
+    assert batch.results_for(claims[9]) == [{"title": "Claim 9"}]
+    assert batch_fn.call_count == 1
+    batch.results_for(claims[10])
+    assert batch_fn.call_args.args[0] == ["Claim 10", "Claim 11"]
+
+
+def test_source_batch_respects_budget():
+    """Under a budget the first fetch covers only the current claim."""
+    claims = _batch_claims(12)
+    batch_fn = MagicMock(side_effect=lambda texts, max_results: [[] for _ in texts])
+    batch = _SourceBatch(batch_fn, claims, time.time() + 60)
+
+    assert batch.results_for(claims[0]) == []
+    assert batch_fn.call_args.args[0] == ["Claim 0"]
+
+
+def test_source_batch_failure_falls_back():
+    """A failed batch fetch returns None so the caller queries per claim."""
+    claims = _batch_claims(2)
+    batch = _SourceBatch(MagicMock(side_effect=RuntimeError), claims, float("inf"))
+    assert batch.results_for(claims[0]) is None
+
+
 # ── FRED source ──────────────────────────────────────────────────
 
 
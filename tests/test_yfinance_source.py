@@ -1,10 +1,8 @@
 """Tests for yfinance evidence source, smart routing, and scoring integration."""
 
-import sys
-from pathlib import Path
 from unittest.mock import patch, MagicMock
 
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+import pytest
 
 from veritas.evidence_sources.yfinance_source import (
     _extract_ticker,
@@ -13,6 +11,9 @@ from veritas.evidence_sources.yfinance_source import (
     search_yfinance,
     _TICKER_MAP,
     _TICKER_BLACKLIST,
+    _INFO_CACHE,
+    _needs_full_info,
+    _get_info,
 )
 from veritas.assist import (
     _has_company_mention,
@@ -153,6 +154,14 @@ def test_format_snippet_percentages():
 # ── search_yfinance function ────────────────────────────────────
 
 
+@pytest.fixture(autouse=True)
+def _clear_info_cache():
+    """Each test sees a cold yfinance info cache."""
+    _INFO_CACHE.clear()
+    yield
+    _INFO_CACHE.clear()
+
+
 def test_search_yfinance_no_ticker():
     """No ticker found → empty results."""
     results = search_yfinance("The economy is growing")
@@ -212,6 +221,95 @@ def test_search_yfinance_empty_info(mock_ticker_cls):
     assert results == []
 
 
+def test_needs_full_info():
+    """Only fundamentals claims should pay for the full .info fetch."""
+    assert _needs_full_info("Apple P/E ratio is 30")
+    assert _needs_full_info("Alphabet revenue hit 350 billion")
+    assert not _needs_full_info("Apple stock trades at 190 dollars")
+    assert not _needs_full_info("Nvidia market cap passed 3 trillion")
+
+
+@patch("yfinance.Ticker")
+def test_search_yfinance_price_claim_uses_fast_info(mock_ticker_cls):
+    """Price-only claims should be answered from fast_info, never .info."""
+    mock_ticker = MagicMock()
+    mock_ticker.fast_info = MagicMock(last_price=190.5, market_cap=3e12, year_high=199.6, year_low=164.1)
+    type(mock_ticker).info = property(lambda self: pytest.fail(".info should not be fetched"))
+    mock_ticker.news = []
+    mock_ticker_cls.return_value = mock_ticker
+
+    results = search_yfinance("Apple stock trades at 190 dollars")
+    assert len(results) == 1
+    assert "190.50" in results[0]["snippet"]
+
+
+@patch("yfinance.Ticker")
+def test_search_yfinance_caches_info(mock_ticker_cls):
+    """Repeat claims about the same ticker should not refetch .info."""
+    mock_ticker = MagicMock()
+    info_calls = []
+
+    def _info(self):
+        info_calls.append(1)
+        return {"symbol": "AAPL", "shortName": "Apple Inc.", "totalRevenue": 390e9}
+
+    type(mock_ticker).info = property(_info)
+    mock_ticker.news = []
+    mock_ticker_cls.return_value = mock_ticker
+
+    search_yfinance("Apple revenue was 390 billion")
+    search_yfinance("Apple revenue grew again")
+    assert len(info_calls) == 1
+
+
+@patch("veritas.evidence_sources.yfinance_source._rate_limit")
+@patch("yfinance.Ticker")
+def test_search_yfinance_news_is_rate_limited(mock_ticker_cls, mock_rate_limit):
+    """The news request is throttled even when .info comes from the cache."""
+    mock_ticker = MagicMock()
+    mock_ticker.info = {"symbol": "AAPL", "shortName": "Apple Inc.", "totalRevenue": 390e9}
+    news_calls = []
+
+    def _news(self):
+        news_calls.append(mock_rate_limit.call_count)
+        return []
+
+    type(mock_ticker).news = property(_news)
+    mock_ticker_cls.return_value = mock_ticker
+
+    # Cache miss: news and .info go out together under a single throttle
+    search_yfinance("Apple revenue was 390 billion")
+    assert mock_rate_limit.call_count == 1
+    assert news_calls == [1]
+    mock_rate_limit.reset_mock()
+    news_calls.clear()
+
+    # Cached info: the only request left is news, and it must be throttled
+    search_yfinance("Apple revenue grew again")
+    assert mock_rate_limit.call_count == 1
+    assert news_calls == [1]
+
+    # No room for news in the results -> no news request at all
+    mock_rate_limit.reset_mock()
+    news_calls.clear()
+    search_yfinance("Apple revenue grew again", max_results=1)
+    assert mock_rate_limit.call_count == 0
+    assert news_calls == []
+
+
+@patch("veritas.evidence_sources.yfinance_source._rate_limit")
+def test_get_info_throttles_unless_told_not_to(mock_rate_limit):
+    """_get_info keeps its own limiter unless the caller already throttled."""
+    stock = MagicMock()
+    stock.info = {"symbol": "AAPL"}
+    _get_info(stock, "AAPL", True)
+    assert mock_rate_limit.call_count == 1
+
+    _INFO_CACHE.clear()
+    _get_info(stock, "AAPL", True, throttle=False)
+    assert mock_rate_limit.call_count == 1
+
+
 # ── _has_company_mention ─────────────────────────────────────────
 
 